@@ -0,0 +1,9 @@
+import os
+import time
+
+# Taken when the package is first imported, which app.main does before its
+# heavy imports, so startup timings include loading OpenCV and MediaPipe.
+LAUNCHED = time.perf_counter()
+
+# Set before any entry point imports MediaPipe, which reads it once.
+os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "3")
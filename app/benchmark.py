@@ -0,0 +1,362 @@
+"""End-to-end pipeline benchmark.
+
+Drives the real Camera -> FaceDetector -> SecurityMonitor loop from a
+recorded or synthetic clip, with a stubbed SystemController, and prints a
+JSON report of throughput, per-stage latency, CPU time and peak memory.
+
+Usage:
+    python -m app.benchmark --source synthetic --duration 10
+    python -m app.benchmark --source video --path clip.mp4 --leave-frame 120
+    python -m app.benchmark --source images --path frames/ --set FRAME_SKIP=1
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import platform
+import resource
+import sys
+import time
+from app.core.backends import CascadeBackend
+from app.services.monitor import SecurityMonitor
+from app.utils.config import Config
+from app.utils.logger import logger
+
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class StageTimer:
+    """Collects latency samples for a single pipeline stage."""
+
+    def __init__(self):
+        self.samples = []
+
+    def wrap(self, func):
+        """Return ``func`` instrumented to record its wall-clock duration."""
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.samples.append(time.perf_counter() - start)
+
+        return timed
+
+    def summary(self) -> dict:
+        """Summarize the samples as percentiles and a fixed-bucket histogram.
+
+        Returns:
+            dict: Count, mean/p50/p90/p99/max in milliseconds and bucket counts
+        """
+        values = sorted(sample * 1000 for sample in self.samples)
+        if not values:
+            return {"count": 0}
+        buckets = {f"le_{bound}": 0 for bound in HISTOGRAM_BUCKETS_MS}
+        buckets["le_inf"] = 0
+        for value in values:
+            for bound in HISTOGRAM_BUCKETS_MS:
+                if value <= bound:
+                    buckets[f"le_{bound}"] += 1
+                    break
+            else:
+                buckets["le_inf"] += 1
+        return {
+            "count": len(values),
+            "mean_ms": sum(values) / len(values),
+            "p50_ms": percentile(values, 50),
+            "p90_ms": percentile(values, 90),
+            "p99_ms": percentile(values, 99),
+            "max_ms": values[-1],
+            "histogram_ms": buckets,
+        }
+
+
+def percentile(sorted_values, pct: float) -> float:
+    """Return the linearly interpolated percentile of pre-sorted values."""
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (
+        rank - low
+    )
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class BenchmarkSystem:
+    """Stand-in for SystemController that never sleeps, idles or locks for real.
+
+    ``lock_screen()`` records when the lock would have fired and stops the
+    monitor, which ends the benchmark run.
+    """
+
+    def __init__(self):
+        self.monitor = None
+        self.lock_time = None
+
+    def lock_screen(self):
+        self.lock_time = time.perf_counter()
+        if self.monitor:
+            self.monitor.running = False
+        return True
+
+    def is_sleep_mode(self):
+        return False
+
+    def is_screen_locked(self):
+        return self.lock_time is not None
+
+    def is_user_inactive(self):
+        return False
+
+
+class PipelineBenchmark:
+    """Runs SecurityMonitor against a replayed clip and records timings.
+
+    Attributes:
+        config (Config): Pipeline configuration under test
+        duration (float): Maximum wall-clock run time in seconds
+        leave_frame (int): Index of the first clip frame without the user
+    """
+
+    def __init__(self, config: Config, duration: float = 30.0, leave_frame: int = 0):
+        self.config = config
+        self.duration = duration
+        self.leave_frame = leave_frame
+        self.system = BenchmarkSystem()
+        self.monitor = SecurityMonitor(config, system=self.system)
+        self.system.monitor = self.monitor
+        self.timers = {
+            "capture": StageTimer(),
+            "grab": StageTimer(),
+            "decode": StageTimer(),
+            "inference": StageTimer(),
+            "sample_interval": StageTimer(),
+        }
+        self.frames_read = 0
+        self.leave_time = None
+        self.exhausted = False
+        self._instrument()
+
+    def _instrument(self):
+        camera, detector = self.monitor.camera, self.monitor.detector
+        read = self.timers["capture"].wrap(camera.read)
+        detector.detect = self.timers["inference"].wrap(detector.detect)
+        detect_async = detector.detect_async
+        loop_timer = self.timers["sample_interval"]
+        self._last_sample = None
+
+        def counted_read(decode=True):
+            frame = read(decode)
+            if camera.grab_time is not None:
+                self.timers["grab"].samples.append(camera.grab_time)
+            if camera.decode_time is not None:
+                self.timers["decode"].samples.append(camera.decode_time)
+            if not frame.success:
+                self.exhausted = True
+                self.monitor.running = False
+                return frame
+            self.frames_read += 1 + frame.dropped
+            if self.leave_time is None and self.frames_read > self.leave_frame:
+                self.leave_time = time.perf_counter()
+            return frame
+
+        async def sampled_detect(image):
+            now = time.perf_counter()
+            if self._last_sample is not None:
+                loop_timer.samples.append(now - self._last_sample)
+            self._last_sample = now
+            return await detect_async(image)
+
+        camera.read = counted_read
+        detector.detect_async = sampled_detect
+
+    async def _stop_after_deadline(self):
+        deadline = time.perf_counter() + self.duration
+        while self.monitor.running and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        self.monitor.running = False
+
+    async def run(self) -> dict:
+        """Run the pipeline until lock, clip exhaustion or the time limit.
+
+        Returns:
+            dict: The benchmark report
+        """
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        watchdog = asyncio.create_task(self._stop_after_deadline())
+        try:
+            await self.monitor.monitor()
+        finally:
+            self.monitor.running = False
+            await watchdog
+            await self.monitor.stop()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        return self._report(wall, cpu)
+
+    def _report(self, wall: float, cpu: float) -> dict:
+        sampled = len(self.timers["inference"].samples)
+        time_to_lock = None
+        if self.system.lock_time is not None and self.leave_time is not None:
+            time_to_lock = max(0.0, self.system.lock_time - self.leave_time)
+        return {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "config": dataclasses.asdict(self.config),
+            "wall_time_s": wall,
+            "frames_read": self.frames_read,
+            "frames_sampled": sampled,
+            "frames_dropped": self.monitor.camera.dropped_frames,
+            "frame_pool_misses": (
+                self.monitor.camera.pool.misses
+                if self.monitor.camera.pool is not None
+                else None
+            ),
+            "camera_first_frame_s": self.monitor.camera.first_frame_latency,
+            "capture_fps": self.frames_read / wall if wall else 0.0,
+            "sampled_fps": sampled / wall if wall else 0.0,
+            "cpu_time_s": cpu,
+            "cpu_ms_per_frame": (
+                cpu * 1000 / self.frames_read if self.frames_read else None
+            ),
+            "cpu_ms_per_sample": cpu * 1000 / sampled if sampled else None,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "locked": self.system.lock_time is not None,
+            "time_to_lock_s": time_to_lock,
+            "clip_exhausted": self.exhausted,
+            "motion_gated_ratio": (
+                self.monitor.detector.motion_gate.gated_ratio
+                if self.monitor.detector.motion_gate is not None
+                else None
+            ),
+            "preprocess_bytes_per_frame": (
+                self.monitor.detector.preprocess.bytes_per_frame
+                if self.monitor.detector.preprocess is not None
+                else None
+            ),
+            "cascade": self._cascade_report(),
+            "stages": {name: timer.summary() for name, timer in self.timers.items()},
+        }
+
+    def _cascade_report(self):
+        backend = self.monitor.detector.backend
+        if not isinstance(backend, CascadeBackend):
+            return None
+        return {
+            "decisions": dict(backend.decisions),
+            "escalation_ratio": backend.escalation_ratio,
+            "stage_mean_ms": {
+                name: backend.stage_time[name] * 1000 / calls if calls else None
+                for name, calls in backend.stage_calls.items()
+            },
+        }
+
+
+def parse_override(config: Config, assignment: str) -> tuple:
+    """Parse a ``KEY=VALUE`` override into a typed Config field value.
+
+    Tuple fields take a comma-separated list, e.g. ``CAMERA_INDICES=0,1``.
+
+    Args:
+        config (Config): Config providing the field types
+        assignment (str): Override in ``KEY=VALUE`` form
+
+    Returns:
+        tuple: The field name and its converted value
+
+    Raises:
+        argparse.ArgumentTypeError: If the key is unknown or the value invalid
+    """
+    key, sep, raw = assignment.partition("=")
+    fields = {field.name: field for field in dataclasses.fields(config)}
+    if not sep or key not in fields:
+        raise argparse.ArgumentTypeError(f"Unknown config override: {assignment}")
+    current = getattr(config, key)
+    try:
+        if isinstance(current, bool):
+            value = raw.lower() in ("1", "true", "yes", "on")
+        elif isinstance(current, tuple):
+            # Tuple fields hold per-camera integers, given comma-separated
+            value = tuple(int(item) for item in raw.split(",") if item.strip())
+        else:
+            value = type(current)(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid value for {key}: {raw}") from None
+    return key, value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.benchmark",
+        description="Benchmark the Sentry AI capture and detection pipeline.",
+    )
+    parser.add_argument(
+        "--source",
+        choices=("synthetic", "video", "images"),
+        default="synthetic",
+        help="frame source to replay (default: synthetic)",
+    )
+    parser.add_argument("--path", default="", help="video file or image directory")
+    parser.add_argument(
+        "--realtime",
+        action="store_true",
+        help="pace playback at the clip frame rate instead of as fast as possible",
+    )
+    parser.add_argument(
+        "--duration", type=float, default=30.0, help="maximum run time in seconds"
+    )
+    parser.add_argument(
+        "--leave-frame",
+        type=int,
+        default=0,
+        help="index of the first clip frame in which the user has left",
+    )
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="override a Config field, may be repeated",
+    )
+    parser.add_argument("--output", help="write the JSON report to this file")
+    return parser
+
+
+def main(argv=None) -> dict:
+    args = build_parser().parse_args(argv)
+    config = Config(
+        FRAME_SOURCE=args.source,
+        SOURCE_PATH=args.path,
+        SOURCE_REALTIME=args.realtime,
+    )
+    overrides = dict(parse_override(config, item) for item in args.set)
+    config = dataclasses.replace(config, **overrides)
+
+    logger.info(f"⏱️ Benchmarking {config.FRAME_SOURCE} pipeline...")
+    benchmark = PipelineBenchmark(
+        config, duration=args.duration, leave_frame=args.leave_frame
+    )
+    report = asyncio.run(benchmark.run())
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+        logger.info(f"📊 Benchmark report written to {args.output}")
+    else:
+        print(text)
+    return report
+
+
+if __name__ == "__main__":
+    main()
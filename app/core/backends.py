@@ -0,0 +1,366 @@
+from collections import deque
+from dataclasses import dataclass, replace
+import math
+import os
+import time
+import cv2
+import mediapipe as mp
+import numpy as np
+from app.core.decode import ReducedDecoder, request_raw_frames
+from app.core.detection import FULL_FRAME, DetectionResult
+from app.core.frame_source import create_frame_source
+from app.core.preprocess import Preprocessor
+from app.utils.config import Config
+from app.utils.logger import logger
+
+
+class DetectorBackend:
+    """Face detection model behind ``FaceDetector``.
+
+    A backend takes a BGR frame or crop, applies its own preprocessing and
+    returns a ``DetectionResult`` mapped to full-frame coordinates. Backends
+    that cannot load their model raise from ``__init__``.
+
+    Attributes:
+        name (str): Name used for ``Config.DETECTOR_BACKEND``
+        preprocess (Preprocessor): Preprocessing stage, or None if the backend
+            prepares its own input
+    """
+
+    name = ""
+    preprocess = None
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        raise NotImplementedError
+
+    def reset(self):
+        """Forget per-session state; most backends have none."""
+
+    def close(self):
+        """Release resources held outside the Python heap, if any."""
+
+
+class MediaPipeBackend(DetectorBackend):
+    """MediaPipe's BlazeFace short- or full-range face detector."""
+
+    name = "mediapipe"
+
+    def __init__(self, config: Config):
+        self.model = mp.solutions.face_detection.FaceDetection(
+            min_detection_confidence=config.FACE_CONFIDENCE,
+            model_selection=config.MODEL_SELECTION,
+        )
+        self.preprocess = Preprocessor(config)
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        results = self.model.process(self.preprocess(image))
+        return DetectionResult.from_mediapipe(results.detections, region)
+
+    def close(self):
+        # MediaPipe raises if its graph is closed twice
+        if self.model is not None:
+            self.model.close()
+            self.model = None
+
+
+class HaarBackend(DetectorBackend):
+    """OpenCV Haar cascade run on a downscaled greyscale frame.
+
+    Cascades report a stage weight rather than a probability, so scores are
+    the weight passed through a logistic function.
+    """
+
+    name = "haar"
+
+    def __init__(self, config: Config):
+        path = config.HAAR_CASCADE_PATH or os.path.join(
+            cv2.data.haarcascades, "haarcascade_frontalface_default.xml"
+        )
+        self.model = cv2.CascadeClassifier(path)
+        if self.model.empty():
+            raise RuntimeError(f"Could not load Haar cascade: {path}")
+        self.min_neighbors = config.HAAR_MIN_NEIGHBORS
+        self.confidence = config.FACE_CONFIDENCE
+        self.preprocess = Preprocessor(config, cv2.COLOR_BGR2GRAY)
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        gray = self.preprocess(image)
+        height, width = gray.shape[:2]
+        faces, _, weights = self.model.detectMultiScale3(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=self.min_neighbors,
+            outputRejectLevels=True,
+        )
+        boxes, scores = [], []
+        for (x, y, w, h), weight in zip(faces, np.ravel(weights)):
+            score = 1.0 / (1.0 + math.exp(-float(weight)))
+            if score >= self.confidence:
+                boxes.append((x / width, y / height, (x + w) / width, (y + h) / height))
+                scores.append(score)
+        return DetectionResult.from_boxes(boxes, scores, region)
+
+
+class DnnBackend(DetectorBackend):
+    """SSD face model loaded through ``cv2.dnn``, e.g. OpenCV's res10 Caffe model.
+
+    The model files are not shipped with OpenCV and are read from
+    ``DNN_MODEL_PATH`` and ``DNN_CONFIG_PATH``.
+    """
+
+    name = "dnn"
+    MEAN = (104.0, 177.0, 123.0)
+
+    def __init__(self, config: Config):
+        if not config.DNN_MODEL_PATH:
+            raise RuntimeError("DNN_MODEL_PATH is not set")
+        self.model = cv2.dnn.readNet(config.DNN_MODEL_PATH, config.DNN_CONFIG_PATH)
+        self.input_size = (config.DNN_INPUT_SIZE, config.DNN_INPUT_SIZE)
+        self.confidence = config.FACE_CONFIDENCE
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        self.model.setInput(
+            cv2.dnn.blobFromImage(image, 1.0, self.input_size, self.MEAN)
+        )
+        detections = self.model.forward()[0, 0]
+        confident = detections[detections[:, 2] >= self.confidence]
+        return DetectionResult.from_boxes(
+            (tuple(row[3:7]) for row in confident), confident[:, 2], region
+        )
+
+
+class CascadeBackend(DetectorBackend):
+    """Two-stage cascade that only runs MediaPipe when a cheap detector is unsure.
+
+    The first stage, ``CASCADE_FIRST_STAGE``, runs on a frame downscaled by
+    ``CASCADE_FIRST_STAGE_SCALE``. Its answer stands only when it sees a face
+    with a score of at least ``CASCADE_ACCEPT_SCORE`` and the last
+    ``CASCADE_HISTORY`` decisions were all "present". Everything else goes to
+    MediaPipe: absences, weak hits, and a change from recent history. Every
+    absence that could lead to a lock is therefore confirmed by MediaPipe.
+    After ``CASCADE_VERIFY_INTERVAL`` first-stage decisions in a row, the
+    next frame is escalated anyway so a false first-stage hit cannot keep
+    the screen unlocked.
+
+    Attributes:
+        first_stage (DetectorBackend): Cheap detector
+        second_stage (MediaPipeBackend): Authoritative detector
+        decisions (dict): Frames decided by each stage, keyed by stage name
+        stage_time (dict): Total seconds spent in each stage, keyed by name
+        stage_calls (dict): Times each stage ran, keyed by name
+    """
+
+    name = "cascade"
+
+    def __init__(self, config: Config):
+        first_stage = config.CASCADE_FIRST_STAGE
+        if first_stage not in BACKENDS or first_stage == self.name:
+            raise ValueError(f"Unknown cascade first stage: {first_stage}")
+        self.first_stage = BACKENDS[first_stage](
+            replace(config, PREPROCESS_SCALE=config.CASCADE_FIRST_STAGE_SCALE)
+        )
+        self.second_stage = MediaPipeBackend(config)
+        self.preprocess = self.second_stage.preprocess
+        self.accept_score = config.CASCADE_ACCEPT_SCORE
+        self.verify_interval = config.CASCADE_VERIFY_INTERVAL
+        self.history = deque(maxlen=config.CASCADE_HISTORY)
+        self.decisions = {first_stage: 0, MediaPipeBackend.name: 0}
+        self.stage_time = {first_stage: 0.0, MediaPipeBackend.name: 0.0}
+        self.stage_calls = {first_stage: 0, MediaPipeBackend.name: 0}
+        self._first_stage_streak = 0
+
+    @property
+    def escalation_ratio(self) -> float:
+        """Fraction of decided frames that needed the second stage."""
+        total = sum(self.decisions.values())
+        return self.decisions[MediaPipeBackend.name] / total if total else 0.0
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        result = self._run(self.first_stage, image, region)
+        if self._trust(result):
+            self._first_stage_streak += 1
+        else:
+            result = self._run(self.second_stage, image, region)
+            self._first_stage_streak = 0
+        self.decisions[result.stage] += 1
+        self.history.append(result.present)
+        return result
+
+    def reset(self):
+        """Forget decision history, e.g. when a monitoring session ends."""
+        self.history.clear()
+        self._first_stage_streak = 0
+
+    def _trust(self, result: DetectionResult) -> bool:
+        return (
+            result.best_score >= self.accept_score
+            and len(self.history) == self.history.maxlen
+            and all(self.history)
+            and self._first_stage_streak < self.verify_interval
+        )
+
+    def _run(self, backend: DetectorBackend, image: np.ndarray, region: tuple):
+        start = time.perf_counter()
+        result = backend.detect(image, region)
+        self.stage_time[backend.name] += time.perf_counter() - start
+        self.stage_calls[backend.name] += 1
+        result.stage = backend.name
+        return result
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (MediaPipeBackend, HaarBackend, DnnBackend, CascadeBackend)
+}
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """Measured cost and agreement of one backend on the calibration clip.
+
+    Attributes:
+        name (str): Backend name
+        latency (float): Mean seconds per frame, after a warm-up frame
+        agreement (float): Fraction of frames whose presence answer matches
+            the MediaPipe reference
+    """
+
+    name: str
+    latency: float
+    agreement: float
+
+
+def create_backend(config: Config) -> DetectorBackend:
+    """Build the backend selected by ``config.DETECTOR_BACKEND``.
+
+    With ``INFERENCE_PROCESSES`` set, that backend runs in worker processes
+    behind a ProcessBackend instead.
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if config.INFERENCE_PROCESSES > 0:
+        from app.core.process_pool import ProcessBackend
+
+        return ProcessBackend(config)
+    if config.DETECTOR_BACKEND == "auto":
+        return select_backend(config)
+    try:
+        backend_class = BACKENDS[config.DETECTOR_BACKEND]
+    except KeyError:
+        raise ValueError(
+            f"Unknown detector backend: {config.DETECTOR_BACKEND}"
+        ) from None
+    return backend_class(config)
+
+
+def load_calibration_frames(config: Config) -> list:
+    """Read up to ``DETECTOR_CALIBRATION_FRAMES`` frames of the calibration clip.
+
+    Returns:
+        list: BGR frames, empty if no clip is configured or it cannot be read
+    """
+    path = config.DETECTOR_CALIBRATION_PATH
+    if not path or not os.path.exists(path):
+        return []
+    clip_config = replace(
+        config,
+        FRAME_SOURCE="images" if os.path.isdir(path) else "video",
+        SOURCE_PATH=path,
+        SOURCE_REALTIME=False,
+        SOURCE_LOOP=False,
+    )
+    try:
+        source = create_frame_source(clip_config)
+    except Exception as e:
+        logger.error(f"❌ Could not open calibration clip: {e}")
+        return []
+    decoder = None
+    if config.CAPTURE_DECODE_SCALE != 1.0:
+        decoder = ReducedDecoder(config)
+        request_raw_frames(source)
+    frames = []
+    try:
+        while len(frames) < config.DETECTOR_CALIBRATION_FRAMES:
+            success, image = source.read()
+            if success and decoder is not None:
+                image = decoder(image)
+                success = image is not None
+            if not success:
+                break
+            frames.append(image)
+    finally:
+        source.release()
+    return frames
+
+
+def calibrate(backends: list, frames: list) -> list:
+    """Time each backend on ``frames`` and score it against the first one.
+
+    Args:
+        backends (list): Backends to measure; the first is the reference
+        frames (list): BGR calibration frames
+
+    Returns:
+        list: A CalibrationResult per backend, in the given order
+    """
+    answers = {}
+    results = []
+    for backend in backends:
+        backend.detect(frames[0])
+        start = time.perf_counter()
+        answers[backend.name] = [backend.detect(frame).present for frame in frames]
+        latency = (time.perf_counter() - start) / len(frames)
+        reference = answers[backends[0].name]
+        agreement = sum(
+            answer == expected
+            for answer, expected in zip(answers[backend.name], reference)
+        ) / len(frames)
+        results.append(CalibrationResult(backend.name, latency, agreement))
+    return results
+
+
+def select_backend(config: Config) -> DetectorBackend:
+    """Pick the fastest backend that agrees with MediaPipe often enough.
+
+    Every single-model backend that loads is timed on the calibration clip.
+    The cascade is left out: it embeds MediaPipe and a first-stage model, so
+    calibrating it would load both a second time, and its latency depends on
+    how often the clip makes it escalate. Backends whose presence answers
+    match MediaPipe on at least ``DETECTOR_MIN_AGREEMENT`` of the frames
+    qualify, and the one with the lowest mean latency wins; the others are
+    closed. Without a readable clip, or if no backend qualifies, MediaPipe
+    is used.
+    """
+    frames = load_calibration_frames(config)
+    if not frames:
+        logger.warning("⚠️ No calibration clip available, using MediaPipe backend")
+        return MediaPipeBackend(config)
+    backends = []
+    for name, backend_class in BACKENDS.items():
+        if name == CascadeBackend.name:
+            continue
+        try:
+            backends.append(backend_class(config))
+        except Exception as e:
+            logger.info(f"ℹ️ Skipping {name} backend: {e}")
+    results = calibrate(backends, frames) if backends else []
+    for result in results:
+        logger.info(
+            f"⏱️ {result.name}: {result.latency * 1000:.1f}ms/frame, "
+            f"{result.agreement:.0%} agreement"
+        )
+    qualified = [r for r in results if r.agreement >= config.DETECTOR_MIN_AGREEMENT]
+    if qualified:
+        name = min(qualified, key=lambda result: result.latency).name
+    else:
+        logger.warning("⚠️ No backend reached the agreement target, using MediaPipe")
+        name = MediaPipeBackend.name
+    selected = next((backend for backend in backends if backend.name == name), None)
+    for backend in backends:
+        if backend is not selected:
+            backend.close()
+    if selected is None:
+        selected = MediaPipeBackend(config)
+    logger.info(f"✅ Selected {name} detector backend")
+    return selected
@@ -1,21 +1,36 @@
-from dataclasses import dataclass
+from collections import deque
+import threading
+import time
 import cv2
-import numpy as np
+from app.core.camera_probe import CameraMode, negotiate_mode, negotiated_mode
+from app.core.decode import ReducedDecoder, request_raw_frames
+from app.core.frame_pool import Frame, FramePool
+from app.core.frame_source import create_frame_source
 from app.utils.config import Config
 from app.utils.logger import logger
+from app.utils.metrics import metrics
 
-
-@dataclass
-class Frame:
-    """Represents a single frame captured from the camera.
-
-    Attributes:
-        success (bool): Whether the frame was successfully captured
-        image (np.ndarray): The actual image data, None if capture failed
-    """
-
-    success: bool
-    image: np.ndarray = None
+READ_SECONDS = metrics.histogram(
+    "sentry_camera_read_seconds", "Time spent in Camera.read()"
+)
+FRAMES_READ = metrics.counter(
+    "sentry_camera_frames_total", "Camera reads by outcome", result="ok"
+)
+READ_FAILURES = metrics.counter(
+    "sentry_camera_frames_total", "Camera reads by outcome", result="failed"
+)
+FRAMES_DROPPED = metrics.counter(
+    "sentry_camera_dropped_frames_total", "Captured frames superseded before a read"
+)
+GRAB_SECONDS = metrics.histogram(
+    "sentry_camera_grab_seconds", "Time spent in grab() with decode on demand"
+)
+DECODE_SECONDS = metrics.histogram(
+    "sentry_camera_decode_seconds", "Time spent in retrieve() with decode on demand"
+)
+POOL_MISSES = metrics.counter(
+    "sentry_camera_pool_misses_total", "Captures that found no free pooled buffer"
+)
 
 
 class Camera:
@@ -25,9 +40,54 @@ class Camera:
     frame capture, and proper resource cleanup. It uses OpenCV for camera operations
     and supports configuration of camera parameters.
 
+    Frames come from the live device by default; ``FRAME_SOURCE`` can select
+    a recorded video, an image directory or a synthetic generator instead.
+
+    When ``CAPTURE_THREADED`` is enabled, a dedicated grabber thread keeps
+    reading from the device into a small ring buffer and ``read()`` returns
+    the newest frame immediately instead of waiting on the driver.
+
+    With ``CAPTURE_DECODE_ON_DEMAND``, the synchronous path keeps the driver
+    queue drained with ``grab()`` on every read and only pays for
+    ``retrieve()`` when the caller asks for the image. The grabber thread of
+    the threaded mode always reads full frames.
+
+    With ``CAPTURE_FRAME_POOL`` slots, frames are captured into a FramePool
+    of preallocated buffers and steady-state capture allocates nothing; the
+    consumer calls ``frame.release()`` when done with each frame. The
+    threaded mode needs ``CAPTURE_BUFFER_SIZE + 2`` slots to never miss.
+
+    With a ``CAPTURE_DECODE_SCALE`` below 1, the camera asks the backend for
+    raw JPEG frames and a ReducedDecoder decodes them straight to that
+    scale, so the detector receives frames that are already at, or closer
+    to, inference resolution.
+
+    A live device's negotiated resolution and frame rate are read back after
+    configuration, and a resolution other than the requested one is logged.
+    With ``CAMERA_PROBE``, the camera instead uses the cheapest mode that
+    meets the detector's minimum input size, found by a probe whose result
+    is cached on disk per device.
+
+    Between monitoring cycles the camera can be suspended instead of
+    released: the device stays open so the next ``start()`` resumes it
+    without reopening or repeating auto-exposure warm-up. A suspended device
+    is released once it has been idle for ``CAMERA_IDLE_TIMEOUT`` seconds.
+
     Attributes:
         config (Config): Configuration object containing camera settings
-        device (cv2.VideoCapture): OpenCV video capture device
+        device (cv2.VideoCapture): OpenCV video capture device or frame source
+        dropped_frames (int): Total frames captured but never delivered
+        suspended (bool): Whether the device is held open but idle
+        first_frame_latency (float): Seconds from opening the device to its
+            first good frame, None until that frame arrives
+        grab_time (float): Seconds the latest read spent in ``grab()``, None
+            unless decoding on demand
+        decode_time (float): Seconds the latest read spent in ``retrieve()``,
+            None if it did not decode on demand
+        pool (FramePool): Reusable capture buffers, None when disabled
+        decoder (ReducedDecoder): Reduced-resolution decoder, None at full scale
+        mode (CameraMode): Mode the device delivers, None for frame sources
+            or before the device is configured
     """
 
     def __init__(self, config: Config):
@@ -38,6 +98,35 @@ class Camera:
         """
         self.config = config
         self.device = None
+        self.dropped_frames = 0
+        self._buffer = deque(maxlen=max(1, config.CAPTURE_BUFFER_SIZE))
+        self._buffer_lock = threading.Condition()
+        self._grabber = None
+        self._stop_event = threading.Event()
+        self._grab_failed = False
+        self._grabbing = set()  # devices a grabber thread may still be reading
+        self._release_on_exit = set()  # devices their grabber thread releases
+        self._handoff_lock = threading.Lock()
+        self._captured_seq = 0
+        self._delivered_seq = 0
+        self._latest = None
+        self.suspended = False
+        self.first_frame_latency = None
+        self.grab_time = None
+        self.decode_time = None
+        self.mode = None
+        self.decoder = None
+        width, height = config.CAMERA_WIDTH, config.CAMERA_HEIGHT
+        if config.CAPTURE_DECODE_SCALE != 1.0:
+            self.decoder = ReducedDecoder(config)
+            width, height = self.decoder.output_size(width, height)
+        self.pool = None
+        if config.CAPTURE_FRAME_POOL > 0:
+            self.pool = FramePool(config.CAPTURE_FRAME_POOL, (height, width, 3))
+        self._opened_at = None
+        self._read_failed = False
+        self._idle_timer = None
+        self._lifecycle_lock = threading.RLock()
 
     def __enter__(self):
         """Context manager entry.
@@ -62,15 +151,44 @@ class Camera:
     def start(self) -> bool:
         """Initialize and configure the camera device.
 
-        Attempts to open the default camera (index 0) and configure it with
-        the settings specified in the config. If the camera is in use by
-        another application or lacks proper permissions, initialization will fail.
+        Attempts to open the configured camera (index 0 by default) or frame
+        source and configure it with the settings specified in the config. If
+        the camera is in use by another application or lacks proper
+        permissions, initialization will fail. A suspended, healthy device is
+        resumed instead of being opened again.
 
         Returns:
             bool: True if camera was successfully initialized, False otherwise
         """
-        self.device = cv2.VideoCapture(0)
+        with self._lifecycle_lock:
+            self._cancel_idle_timer()
+            if (
+                self.suspended
+                and not self._read_failed
+                and self.device is not None
+                and self.device.isOpened()
+            ):
+                return self._resume()
+            return self._open()
+
+    def _open(self) -> bool:
+        """Open and configure a fresh capture backend.
+
+        Returns:
+            bool: True if the backend opened and is delivering frames
+        """
+        self.suspended = False
+        self._read_failed = False
+        self.first_frame_latency = None
+        self._opened_at = time.perf_counter()
+        self.device = self._open_device()
         if not self.device.isOpened():
+            if self.config.FRAME_SOURCE != "device":
+                logger.error(
+                    f"⚠️ Failed to open {self.config.FRAME_SOURCE} frame source "
+                    f"'{self.config.SOURCE_PATH}'"
+                )
+                return False
             logger.error("⚠️ Camera access failed - Please verify:")
             logger.error("  • Camera permissions in System Settings")
             logger.error("  • No other application is using the camera")
@@ -78,32 +196,321 @@ class Camera:
             return False
 
         self._configure()
+        if self.config.CAPTURE_THREADED and not self._start_grabber():
+            logger.error("⚠️ Camera produced no frames after initialization")
+            self.release()
+            return False
         logger.info("📸 Camera initialized successfully")
         return True
 
+    def _resume(self) -> bool:
+        """Resume a suspended device without reopening it.
+
+        Returns:
+            bool: True if the device is delivering frames again
+        """
+        self.suspended = False
+        if self.config.CAPTURE_THREADED and not self._start_grabber():
+            logger.error("⚠️ Camera produced no frames after resuming")
+            self.release()
+            return False
+        logger.info("📸 Camera resumed")
+        return True
+
+    def suspend(self):
+        """Stop capturing but keep the device open for a quick resume.
+
+        The device is released straight away if it is failing or if
+        ``CAMERA_IDLE_TIMEOUT`` is zero; otherwise it is released once it has
+        stayed suspended for that many seconds.
+        """
+        with self._lifecycle_lock:
+            if self.suspended or not self.device or not self.device.isOpened():
+                return
+            if self._read_failed or self.config.CAMERA_IDLE_TIMEOUT <= 0:
+                self.release()
+                return
+            self._stop_grabber()
+            self.suspended = True
+            self._idle_timer = threading.Timer(
+                self.config.CAMERA_IDLE_TIMEOUT, self._release_if_idle
+            )
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+            logger.debug("📸 Camera suspended")
+
+    def _release_if_idle(self):
+        with self._lifecycle_lock:
+            if self.suspended:
+                logger.info("📸 Camera idle timeout reached")
+                self.release()
+
+    def _cancel_idle_timer(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    def _note_first_frame(self):
+        """Record the open-to-first-good-frame latency once per open."""
+        if self.first_frame_latency is None and self._opened_at is not None:
+            self.first_frame_latency = time.perf_counter() - self._opened_at
+            logger.info(
+                f"📸 First frame {self.first_frame_latency * 1000:.0f} ms after opening"
+            )
+
+    def _open_device(self):
+        """Open the live camera or the configured frame source.
+
+        Returns:
+            cv2.VideoCapture | FrameSource: The capture backend
+        """
+        if self.config.FRAME_SOURCE == "device":
+            return cv2.VideoCapture(self.config.CAMERA_INDEX)
+        return create_frame_source(self.config)
+
+    def _start_grabber(self) -> bool:
+        """Start the background grabber thread and wait for its first frame.
+
+        Returns:
+            bool: True if a frame arrived within ``CAPTURE_FIRST_FRAME_TIMEOUT``
+        """
+        self._stop_event = threading.Event()
+        self._grab_failed = False
+        self._drop_buffered()
+        self._captured_seq = 0
+        self._delivered_seq = 0
+        with self._handoff_lock:
+            self._grabbing.add(self.device)
+        self._grabber = threading.Thread(
+            target=self._grab_loop,
+            args=(self.device, self._stop_event),
+            name="camera-grabber",
+            daemon=True,
+        )
+        self._grabber.start()
+        with self._buffer_lock:
+            ready = self._buffer_lock.wait_for(
+                lambda: bool(self._buffer) or self._grab_failed,
+                timeout=self.config.CAPTURE_FIRST_FRAME_TIMEOUT,
+            )
+            return ready and not self._grab_failed
+
+    def _grab_loop(self, device, stop_event: threading.Event):
+        """Continuously read frames from the device into the ring buffer.
+
+        Runs on the grabber thread until ``stop_event`` is set or the device
+        stops delivering frames. Older frames fall off the ring buffer when
+        the consumer is slower than the camera. If ``release()`` gave up
+        waiting for this thread, the thread releases the device on exit.
+
+        Args:
+            device: Capture backend this thread reads from
+            stop_event (threading.Event): Set to stop this thread
+        """
+        try:
+            while not stop_event.is_set():
+                frame = self._capture(device=device)
+                with self._buffer_lock:
+                    if stop_event.is_set():
+                        frame.release()
+                        return
+                    if not frame.success:
+                        self._grab_failed = True
+                        self._buffer_lock.notify_all()
+                        return
+                    self._note_first_frame()
+                    if len(self._buffer) == self._buffer.maxlen:
+                        self._buffer.popleft().release()
+                    self._buffer.append(frame)
+                    self._buffer_lock.notify_all()
+        finally:
+            with self._handoff_lock:
+                self._grabbing.discard(device)
+                orphaned = device in self._release_on_exit
+                self._release_on_exit.discard(device)
+            if orphaned:
+                self._release_device(device)
+
+    def _drop_buffered(self):
+        """Release every frame held by the threaded ring buffer."""
+        with self._buffer_lock:
+            while self._buffer:
+                self._buffer.popleft().release()
+            if self._latest is not None:
+                self._latest.release()
+                self._latest = None
+
     def _configure(self):
         """Configure camera properties according to settings.
 
         Sets resolution and frame rate according to the configuration.
         These settings affect the quality and performance of the capture.
+        Raw JPEG frames are requested first when decoding at reduced scale,
+        since some drivers only accept a format change before the size.
         """
+        if self.decoder is not None:
+            request_raw_frames(self.device)
+        device = self.config.FRAME_SOURCE == "device"
+        if device and self.config.CAMERA_PROBE:
+            self.mode = negotiate_mode(self.device, self.config)
+            if self.mode is not None:
+                return
         self.device.set(cv2.CAP_PROP_FRAME_WIDTH, self.config.CAMERA_WIDTH)
         self.device.set(cv2.CAP_PROP_FRAME_HEIGHT, self.config.CAMERA_HEIGHT)
         self.device.set(cv2.CAP_PROP_FPS, self.config.CAMERA_FPS)
+        if device:
+            self.mode = self._verify_mode()
+
+    def _verify_mode(self) -> CameraMode:
+        """Read back the negotiated mode and warn if it is not the requested one."""
+        mode = negotiated_mode(self.device)
+        requested = (self.config.CAMERA_WIDTH, self.config.CAMERA_HEIGHT)
+        if (mode.width, mode.height) != requested:
+            logger.warning(
+                f"⚠️ Camera delivers {mode.width}x{mode.height} instead of the "
+                f"requested {requested[0]}x{requested[1]}"
+            )
+        return mode
 
-    def read(self) -> Frame:
+    def read(self, decode: bool = True) -> Frame:
         """Capture a single frame from the camera.
 
+        Args:
+            decode (bool): Whether the caller needs the image. With
+                ``CAPTURE_DECODE_ON_DEMAND``, False only grabs the frame and
+                returns it without image data.
+
         Returns:
             Frame: A Frame object containing the capture status and image data
         """
+        start = time.perf_counter()
+        frame = self._read(decode)
+        READ_SECONDS.observe(time.perf_counter() - start)
+        if frame.success:
+            FRAMES_READ.inc()
+            if frame.dropped:
+                FRAMES_DROPPED.inc(frame.dropped)
+        else:
+            READ_FAILURES.inc()
+        return frame
+
+    def _read(self, decode: bool) -> Frame:
         if not self.device or not self.device.isOpened():
             logger.warning("⚠️ Attempted to read from uninitialized camera")
             return Frame(success=False)
-        success, image = self.device.read()
-        if not success:
+        if self._grabber is not None:
+            return self._read_latest()
+        frame = self._capture(decode, self.device)
+        if not frame.success:
+            self._read_failed = True
             logger.warning("⚠️ Failed to capture frame from camera")
-        return Frame(success=success, image=image)
+        else:
+            self._note_first_frame()
+        return frame
+
+    def _capture(self, decode: bool = True, device=None) -> Frame:
+        """Capture the next frame from the device, into a pooled buffer if any.
+
+        Args:
+            decode (bool): Whether to decode the grabbed frame
+            device: Capture backend to read; defaults to ``self.device``
+
+        Returns:
+            Frame: The captured frame, or a failed Frame
+        """
+        frame = self.pool.acquire() if self.pool is not None else None
+        if self.pool is not None and frame is None:
+            POOL_MISSES.inc()
+        buffer = self.pool.buffers[frame.index] if frame is not None else None
+        target = buffer if self.decoder is None else None
+        device = device if device is not None else self.device
+        if self.config.CAPTURE_DECODE_ON_DEMAND:
+            success, image = self._grab(device, decode, target)
+        elif target is not None:
+            success, image = device.read(target)
+        else:
+            success, image = device.read()
+        if success and image is not None and self.decoder is not None:
+            image = self.decoder(image, buffer)
+            success = image is not None
+        if not success:
+            if frame is not None:
+                frame.release()
+            return Frame(success=False)
+        self._captured_seq += 1
+        if frame is None:
+            return Frame(
+                success=True,
+                image=image,
+                timestamp=time.monotonic(),
+                sequence=self._captured_seq,
+            )
+        if target is not None and image is not None:
+            self.pool.adopt(frame, image)
+        frame.success, frame.image, frame.dropped = True, image, 0
+        frame.timestamp, frame.sequence = time.monotonic(), self._captured_seq
+        return frame
+
+    def _grab(self, device, decode: bool, buffer=None) -> tuple:
+        """Grab the next frame and decode it only if ``decode`` is set.
+
+        Args:
+            device: Capture backend to grab from
+            decode (bool): Whether to retrieve the image
+            buffer (np.ndarray, optional): Buffer to decode into
+
+        Returns:
+            tuple: ``(success, image)``; image is None for a grab-only read
+        """
+        start = time.perf_counter()
+        success = device.grab()
+        grabbed = time.perf_counter()
+        self.grab_time, self.decode_time = grabbed - start, None
+        GRAB_SECONDS.observe(self.grab_time)
+        if not success or not decode:
+            return success, None
+        if buffer is not None:
+            success, image = device.retrieve(buffer)
+        else:
+            success, image = device.retrieve()
+        self.decode_time = time.perf_counter() - grabbed
+        DECODE_SECONDS.observe(self.decode_time)
+        return success, image
+
+    def _read_latest(self) -> Frame:
+        """Return the newest buffered frame without waiting on the device.
+
+        Frames that were captured after the previous read but superseded by
+        a newer one are counted as dropped and their buffers released. If
+        nothing new has arrived yet, the previously delivered frame is
+        returned again. The camera keeps a hold on the newest frame for such
+        repeats, and the consumer gets a hold of its own.
+
+        Returns:
+            Frame: The newest frame, or a failed Frame if the grabber stopped
+        """
+        with self._buffer_lock:
+            if self._grab_failed:
+                self._read_failed = True
+                logger.warning("⚠️ Failed to capture frame from camera")
+                return Frame(success=False)
+            if self._buffer:
+                newest = self._buffer.pop()
+                while self._buffer:
+                    self._buffer.popleft().release()
+                if self._latest is not None:
+                    self._latest.release()
+                self._latest = newest
+            if self._latest is None:
+                return Frame(success=False)
+            frame = self._latest
+            if frame.pool is not None:
+                frame.pool.retain(frame)
+            dropped = max(0, frame.sequence - self._delivered_seq - 1)
+            self._delivered_seq = max(self._delivered_seq, frame.sequence)
+            frame.dropped = dropped
+        self.dropped_frames += dropped
+        return frame
 
     def release(self):
         """Release camera resources and cleanup.
@@ -112,7 +519,34 @@ class Camera:
         to ensure proper resource cleanup and allow other applications
         to access the camera.
         """
-        if self.device and self.device.isOpened():
-            self.device.release()
+        with self._lifecycle_lock:
+            self._cancel_idle_timer()
+            self._stop_grabber()
+            self._drop_buffered()
+            self.suspended = False
+            device = self.device
+            if not device or not device.isOpened():
+                return
+            with self._handoff_lock:
+                if device in self._grabbing:
+                    # The grabber is stuck in a read; it releases the device
+                    self._release_on_exit.add(device)
+                    self.device = None
+                    logger.warning(
+                        "⚠️ Camera grabber still reading, releasing once it stops"
+                    )
+                    return
+            self._release_device(device)
+
+    def _release_device(self, device):
+        device.release()
+        if self.config.FRAME_SOURCE == "device":
             cv2.destroyAllWindows()
-            logger.info("📸 Camera resources released")
+        logger.info("📸 Camera resources released")
+
+    def _stop_grabber(self):
+        if self._grabber is not None:
+            self._stop_event.set()
+            if self._grabber is not threading.current_thread():
+                self._grabber.join(timeout=1.0)
+            self._grabber = None
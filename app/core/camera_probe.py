@@ -0,0 +1,204 @@
+from dataclasses import asdict, dataclass
+import json
+import os
+import tempfile
+import time
+import cv2
+from app.core.decode import is_encoded
+from app.utils.config import Config
+from app.utils.logger import logger
+
+CANDIDATE_MODES = (
+    (320, 240),
+    (424, 240),
+    (640, 360),
+    (640, 480),
+    (800, 600),
+    (960, 540),
+    (1280, 720),
+    (1920, 1080),
+)
+
+
+@dataclass(frozen=True)
+class CameraMode:
+    """A capture mode as the driver actually delivers it.
+
+    Attributes:
+        width (int): Negotiated frame width in pixels
+        height (int): Negotiated frame height in pixels
+        fps (float): Frame rate, measured when probed, reported by the
+            driver otherwise
+    """
+
+    width: int
+    height: int
+    fps: float
+
+    @property
+    def pixels(self) -> int:
+        return self.width * self.height
+
+    def __str__(self) -> str:
+        return f"{self.width}x{self.height}@{self.fps:.0f}"
+
+
+def negotiated_mode(device) -> CameraMode:
+    """Read back the resolution and frame rate the driver accepted."""
+    return CameraMode(
+        int(device.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        int(device.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        float(device.get(cv2.CAP_PROP_FPS)),
+    )
+
+
+def apply_mode(device, width: int, height: int, fps: float) -> CameraMode:
+    """Request a mode and return what the driver negotiated."""
+    device.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    device.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    device.set(cv2.CAP_PROP_FPS, fps)
+    return negotiated_mode(device)
+
+
+def measure_fps(device, frames: int) -> tuple:
+    """Time ``frames`` reads after one warm-up read.
+
+    Returns:
+        tuple: Delivered frames per second and the last frame, or
+            ``(0.0, None)`` if the device stopped delivering
+    """
+    success, image = device.read()
+    if not success:
+        return 0.0, None
+    start = time.perf_counter()
+    for _ in range(frames):
+        success, image = device.read()
+        if not success:
+            return 0.0, None
+    elapsed = time.perf_counter() - start
+    return (frames / elapsed if elapsed > 0 else 0.0), image
+
+
+def probe_modes(device, config: Config, candidates=CANDIDATE_MODES) -> list:
+    """Try every candidate resolution and keep the ones that really work.
+
+    A candidate counts once per negotiated resolution, and only if the
+    frames it delivers have that resolution; raw JPEG frames are taken at
+    the driver's word.
+
+    Returns:
+        list: CameraMode per working mode, with measured frame rates
+    """
+    modes = {}
+    for width, height in candidates:
+        negotiated = apply_mode(device, width, height, config.CAMERA_FPS)
+        size = (negotiated.width, negotiated.height)
+        if size in modes:
+            continue
+        fps, image = measure_fps(device, config.CAMERA_PROBE_FRAMES)
+        if image is None:
+            continue
+        delivered = image.shape[:2] == (negotiated.height, negotiated.width)
+        if delivered or is_encoded(image):
+            modes[size] = CameraMode(negotiated.width, negotiated.height, fps)
+            logger.debug(f"📸 Mode {width}x{height} delivers {modes[size]}")
+    return list(modes.values())
+
+
+def select_mode(modes: list, config: Config) -> CameraMode:
+    """Pick the cheapest mode that still feeds the detector enough pixels.
+
+    A mode qualifies when its shorter side, after ``PREPROCESS_SCALE``, is at
+    least ``DETECTOR_MIN_INPUT_SIZE`` and it delivers ``CAMERA_MIN_FPS``.
+    The one with the fewest pixels wins; ties go to the frame rate closest
+    to ``CAMERA_FPS``.
+
+    Returns:
+        CameraMode: The selected mode, or None if no mode qualifies
+    """
+    usable = [
+        mode
+        for mode in modes
+        if min(mode.width, mode.height) * config.PREPROCESS_SCALE
+        >= config.DETECTOR_MIN_INPUT_SIZE
+        and mode.fps >= config.CAMERA_MIN_FPS
+    ]
+    if not usable:
+        return None
+    return min(
+        usable, key=lambda mode: (mode.pixels, abs(mode.fps - config.CAMERA_FPS))
+    )
+
+
+def device_key(device, config: Config) -> str:
+    """Cache key of a device; OpenCV exposes no stable id, only backend and index."""
+    return f"{device.getBackendName()}:{config.CAMERA_INDEX}"
+
+
+def load_cache(path: str) -> dict:
+    try:
+        with open(path) as cache:
+            return json.load(cache)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path: str, entries: dict):
+    """Atomically write the probe cache, creating its directory if needed."""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=directory, delete=False, suffix=".tmp"
+    ) as output:
+        json.dump(entries, output, indent=2)
+    os.replace(output.name, path)
+
+
+def negotiate_mode(device, config: Config) -> CameraMode:
+    """Configure ``device`` with the cheapest working mode, probing only once.
+
+    The probed modes are cached per device in ``CAMERA_PROBE_CACHE`` and the
+    selection is made again from the cache on every start, so a device
+    without any qualifying mode is not probed again either, and changing
+    the detector settings does not need a new probe. A cached mode the
+    driver no longer accepts triggers a fresh probe. A probe in which no
+    mode delivered frames is not cached, since the device was probably
+    busy.
+
+    Args:
+        device (cv2.VideoCapture): Opened camera
+        config (Config): Application configuration
+
+    Returns:
+        CameraMode: The applied mode, or None if no probed mode qualifies
+    """
+    path = os.path.expanduser(config.CAMERA_PROBE_CACHE)
+    key = device_key(device, config)
+    entries = load_cache(path)
+    cached = entries.get(key)
+    if cached is not None:
+        mode = select_mode([CameraMode(**entry) for entry in cached], config)
+        if mode is None:
+            logger.info("📸 No cached camera mode meets the detector's minimum")
+            return None
+        negotiated = apply_mode(device, mode.width, mode.height, config.CAMERA_FPS)
+        if (negotiated.width, negotiated.height) == (mode.width, mode.height):
+            logger.info(f"📸 Using cached camera mode {mode}")
+            return mode
+        logger.warning(f"⚠️ Cached camera mode {mode} was refused - Probing again")
+
+    logger.info("🔍 Probing camera modes...")
+    modes = probe_modes(device, config)
+    if modes:
+        entries[key] = [asdict(mode) for mode in modes]
+        try:
+            save_cache(path, entries)
+        except OSError as e:
+            logger.error(f"⚠️ Failed to cache camera modes: {e}")
+    mode = select_mode(modes, config)
+    if mode is None:
+        logger.warning("⚠️ No camera mode meets the detector's minimum input size")
+        return None
+    apply_mode(device, mode.width, mode.height, config.CAMERA_FPS)
+    logger.info(f"📸 Selected camera mode {mode}")
+    return mode
@@ -0,0 +1,94 @@
+import cv2
+import numpy as np
+from app.utils.config import Config
+from app.utils.logger import logger
+
+REDUCED_DECODE_FLAGS = {
+    1.0: cv2.IMREAD_COLOR,
+    0.5: cv2.IMREAD_REDUCED_COLOR_2,
+    0.25: cv2.IMREAD_REDUCED_COLOR_4,
+    0.125: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+def request_raw_frames(device) -> bool:
+    """Ask a capture backend for undecoded JPEG frames.
+
+    V4L2 cameras deliver raw MJPEG once RGB conversion is off, and FFmpeg
+    and the frame sources hand out raw packets with ``CAP_PROP_FORMAT`` set
+    to -1. Backends that support neither keep delivering decoded frames.
+
+    Returns:
+        bool: True if the backend accepted any of the raw-mode settings
+    """
+    accepted = device.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+    accepted = device.set(cv2.CAP_PROP_CONVERT_RGB, 0) or accepted
+    return device.set(cv2.CAP_PROP_FORMAT, -1) or accepted
+
+
+def is_encoded(image: np.ndarray) -> bool:
+    """Whether ``image`` is a raw compressed buffer rather than decoded pixels."""
+    return image.ndim == 1 or (image.ndim == 2 and image.shape[0] == 1)
+
+
+class ReducedDecoder:
+    """Turns captured frames into BGR images at ``CAPTURE_DECODE_SCALE``.
+
+    This is the capture side of the resolution contract with the detector:
+    frames leave the camera already scaled by ``CAPTURE_DECODE_SCALE`` and
+    the Preprocessor only applies what remains of ``PREPROCESS_SCALE``, so no
+    frame is resized twice.
+
+    Raw JPEG data, as delivered by an MJPEG camera or a recorded clip in raw
+    mode, is decoded straight to the reduced size with
+    ``cv2.IMREAD_REDUCED_COLOR_*``, which skips most of the IDCT work.
+    Frames that arrive already decoded, because the backend ignored raw
+    mode, are downscaled once instead.
+
+    Args:
+        config (Config): Application configuration
+
+    Raises:
+        ValueError: If ``CAPTURE_DECODE_SCALE`` is not 1, 1/2, 1/4 or 1/8
+
+    Attributes:
+        scale (float): Decode scale factor
+        flag (int): ``cv2.imread`` flag matching the scale
+        fallbacks (int): Frames that had to be downscaled after a full decode
+    """
+
+    def __init__(self, config: Config):
+        if config.CAPTURE_DECODE_SCALE not in REDUCED_DECODE_FLAGS:
+            raise ValueError(f"Unsupported decode scale: {config.CAPTURE_DECODE_SCALE}")
+        self.scale = config.CAPTURE_DECODE_SCALE
+        self.flag = REDUCED_DECODE_FLAGS[self.scale]
+        self.fallbacks = 0
+
+    def output_size(self, width: int, height: int) -> tuple:
+        """Return the (width, height) a full frame is decoded to."""
+        return max(1, round(width * self.scale)), max(1, round(height * self.scale))
+
+    def __call__(self, image: np.ndarray, dst: np.ndarray = None) -> np.ndarray:
+        """Decode or downscale one captured frame.
+
+        Args:
+            image (np.ndarray): Raw JPEG bytes or a decoded BGR frame
+            dst (np.ndarray, optional): Buffer for the downscale fallback
+
+        Returns:
+            np.ndarray: BGR image at the decode scale, or None if the raw
+                data could not be decoded
+        """
+        if is_encoded(image):
+            return cv2.imdecode(image, self.flag)
+        if self.scale == 1.0:
+            return image
+        if self.fallbacks == 0:
+            logger.warning(
+                "⚠️ Capture backend delivered decoded frames - Downscaling instead"
+            )
+        self.fallbacks += 1
+        width, height = self.output_size(image.shape[1], image.shape[0])
+        if dst is not None and dst.shape[:2] != (height, width):
+            dst = None
+        return cv2.resize(image, (width, height), dst=dst, interpolation=cv2.INTER_AREA)
@@ -0,0 +1,107 @@
+FULL_FRAME = (0.0, 0.0, 1.0, 1.0)
+
+
+class DetectionResult:
+    """Compact outcome of a single detection call.
+
+    One of these is created for every sampled frame, so it uses
+    ``__slots__`` and plain tuples rather than keeping MediaPipe objects
+    alive. It is truthy when at least one face was found, which keeps
+    ``if detector.detect(frame):`` working as a presence check.
+
+    Attributes:
+        boxes (tuple): Normalised (x0, y0, x1, y1) face boxes in full-frame
+            coordinates
+        scores (tuple): Detection confidence for each box
+        inference_time (float): Seconds spent producing this result
+        stage (str): Name of the detector stage that decided the result, when
+            a cascade produced it
+    """
+
+    __slots__ = ("boxes", "scores", "inference_time", "stage")
+
+    def __init__(
+        self, boxes: tuple = (), scores: tuple = (), inference_time=0.0, stage=None
+    ):
+        self.boxes = boxes
+        self.scores = scores
+        self.inference_time = inference_time
+        self.stage = stage
+
+    @classmethod
+    def from_mediapipe(cls, detections, region: tuple = FULL_FRAME):
+        """Build a result from MediaPipe detections made on a frame region.
+
+        Args:
+            detections (list): MediaPipe detections, or None if nothing was found
+            region (tuple): Normalised (x0, y0, x1, y1) of the analysed crop
+                within the full frame
+
+        Returns:
+            DetectionResult: Result with boxes mapped to full-frame coordinates
+        """
+        if not detections:
+            return cls()
+        boxes = []
+        scores = []
+        for detection in detections:
+            box = detection.location_data.relative_bounding_box
+            boxes.append(
+                (box.xmin, box.ymin, box.xmin + box.width, box.ymin + box.height)
+            )
+            scores.append(float(detection.score[0]))
+        return cls.from_boxes(boxes, scores, region)
+
+    @classmethod
+    def from_boxes(cls, boxes, scores, region: tuple = FULL_FRAME):
+        """Build a result from normalised boxes found on a frame region.
+
+        Args:
+            boxes (iterable): Normalised (x0, y0, x1, y1) boxes within the crop;
+                parts outside the crop are clamped away
+            scores (iterable): Confidence of each box
+            region (tuple): Normalised (x0, y0, x1, y1) of the analysed crop
+                within the full frame
+
+        Returns:
+            DetectionResult: Result with boxes mapped to full-frame coordinates
+        """
+        rx0, ry0, rx1, ry1 = region
+        scale_x, scale_y = rx1 - rx0, ry1 - ry0
+        mapped = tuple(
+            (
+                rx0 + max(0.0, x0) * scale_x,
+                ry0 + max(0.0, y0) * scale_y,
+                rx0 + min(1.0, x1) * scale_x,
+                ry0 + min(1.0, y1) * scale_y,
+            )
+            for x0, y0, x1, y1 in boxes
+        )
+        return cls(mapped, tuple(float(score) for score in scores))
+
+    def __bool__(self) -> bool:
+        return len(self.scores) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"DetectionResult(faces={len(self.scores)}, "
+            f"best_score={self.best_score:.2f}, "
+            f"inference_time={self.inference_time * 1000:.1f}ms)"
+        )
+
+    @property
+    def present(self) -> bool:
+        """Whether at least one face was detected."""
+        return len(self.scores) > 0
+
+    @property
+    def best_score(self) -> float:
+        """Highest detection confidence, or 0.0 when no face was found."""
+        return max(self.scores) if self.scores else 0.0
+
+    @property
+    def best_box(self):
+        """Box of the most confident face, or None when no face was found."""
+        if not self.scores:
+            return None
+        return self.boxes[self.scores.index(max(self.scores))]
@@ -1,19 +1,232 @@
-import mediapipe as mp
-import cv2
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
 import numpy as np
+from app.core.backends import create_backend
+from app.core.detection import FULL_FRAME, DetectionResult
+from app.core.motion_gate import MotionGate
 from app.utils.config import Config
+from app.utils.metrics import metrics
+
+DETECT_SECONDS = metrics.histogram(
+    "sentry_detect_seconds", "Time spent in FaceDetector.detect() running inference"
+)
+DETECTIONS = {
+    outcome: metrics.counter(
+        "sentry_detections_total", "Detection calls by outcome", outcome=outcome
+    )
+    for outcome in ("present", "absent", "gated")
+}
 
 
 class FaceDetector:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, pool=None):
+        """Build a detector with its own model, or one that uses a shared pool.
+
+        Args:
+            config (Config): Application configuration
+            pool (InferencePool, optional): Shared inference workers. When
+                given, detection runs on the pool's threads with their
+                models, while motion-gate and ROI state stay per detector.
+        """
         self.config = config
-        self.detector = mp.solutions.face_detection.FaceDetection(
-            min_detection_confidence=config.FACE_CONFIDENCE,
-            model_selection=config.MODEL_SELECTION,
+        self.pool = pool
+        self._backend = create_backend(config) if pool is None else None
+        self.motion_gate = MotionGate(config) if config.MOTION_GATING else None
+        self.last_box = None
+        self.roi_hits = 0
+        self.full_scans = 0
+        self._roi_streak = 0
+        self.coalesced_frames = 0
+        self._executor = None
+        self._inflight = None
+        self._running = None
+        self._queued = None
+        self._queued_frame = None
+
+    @property
+    def backend(self):
+        """Backend used by the calling thread."""
+        return self._backend if self.pool is None else self.pool.backend
+
+    @property
+    def preprocess(self):
+        """Preprocessing stage of the detector's own backend, if it has one."""
+        return self._backend.preprocess if self._backend is not None else None
+
+    def detect(self, frame: np.ndarray) -> DetectionResult:
+        if self.motion_gate is not None:
+            gated, result = self.motion_gate.lookup(frame)
+            if gated:
+                DETECTIONS["gated"].inc()
+                return result
+        start = time.perf_counter()
+        result = self._detect_roi(frame) or self._detect_full(frame)
+        result.inference_time = time.perf_counter() - start
+        DETECT_SECONDS.observe(result.inference_time)
+        DETECTIONS["present" if result else "absent"].inc()
+        if self.motion_gate is not None:
+            self.motion_gate.update(result)
+        return result
+
+    def warm_up(self, width: int = None, height: int = None, runs: int = 1):
+        """Run inference on a blank frame so later calls skip lazy initialisation.
+
+        Motion-gate and ROI state are left untouched.
+        """
+        blank = np.zeros(
+            (height or self.config.CAMERA_HEIGHT, width or self.config.CAMERA_WIDTH, 3),
+            dtype=np.uint8,
+        )
+        for _ in range(runs):
+            self._process(blank)
+
+    def _process(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        return self.backend.detect(image, region)
+
+    def _detect_full(self, frame: np.ndarray) -> DetectionResult:
+        result = self._process(frame)
+        self.full_scans += 1
+        self._roi_streak = 0
+        self.last_box = result.best_box if self.config.ROI_DETECTION else None
+        return result
+
+    def _detect_roi(self, frame: np.ndarray):
+        """Look for the face only around where it was last seen.
+
+        Returns None, leaving the caller to scan the whole frame, when ROI
+        mode is off, no face is being tracked, a periodic full-frame refresh
+        is due, or the crop comes back empty.
+        """
+        if (
+            not self.config.ROI_DETECTION
+            or self.last_box is None
+            or self._roi_streak >= self.config.ROI_REFRESH_INTERVAL
+        ):
+            return None
+        height, width = frame.shape[:2]
+        region = self._expand(self.last_box)
+        x0, y0 = int(region[0] * width), int(region[1] * height)
+        x1, y1 = int(np.ceil(region[2] * width)), int(np.ceil(region[3] * height))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            return None
+        result = self._process(
+            frame[y0:y1, x0:x1], (x0 / width, y0 / height, x1 / width, y1 / height)
         )
+        if not result:
+            return None
+        self.last_box = result.best_box
+        self.roi_hits += 1
+        self._roi_streak += 1
+        return result
+
+    def _expand(self, box: tuple) -> tuple:
+        """Grow a normalised box around its centre by ``ROI_EXPANSION``."""
+        x0, y0, x1, y1 = box
+        cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+        half_w = (x1 - x0) * self.config.ROI_EXPANSION / 2
+        half_h = (y1 - y0) * self.config.ROI_EXPANSION / 2
+        return (
+            max(0.0, cx - half_w),
+            max(0.0, cy - half_h),
+            min(1.0, cx + half_w),
+            min(1.0, cy + half_h),
+        )
+
+    async def detect_async(self, frame: np.ndarray) -> DetectionResult:
+        """Run detection on the inference worker without blocking the event loop.
+
+        At most one inference runs and at most one frame waits behind it.
+        A frame submitted while another is already queued replaces it, and
+        every caller waiting on the queued slot receives the newer result,
+        so detection latency never exceeds two inference durations.
+        """
+        loop = asyncio.get_running_loop()
+        if self._queued is not None:
+            self._queued_frame = frame
+            self.coalesced_frames += 1
+            waiter = self._queued
+        else:
+            waiter = loop.create_future()
+            self._queued = waiter
+            self._queued_frame = frame
+            if self._inflight is None:
+                self._dispatch(loop)
+        return await asyncio.shield(waiter)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop):
+        waiter, frame = self._queued, self._queued_frame
+        self._queued = None
+        self._queued_frame = None
+        self._inflight = waiter
+        if self.pool is not None:
+            executor = self.pool.executor
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="face-detector"
+                )
+            executor = self._executor
+        future = executor.submit(self.detect, frame)
+        self._running = future
+
+        def notify(done):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._on_inference_done, loop, waiter, done)
+
+        future.add_done_callback(notify)
+
+    def _on_inference_done(self, loop, waiter, future):
+        if not waiter.done():
+            if future.exception() is not None:
+                waiter.set_exception(future.exception())
+            else:
+                waiter.set_result(future.result())
+        if waiter is not self._inflight:
+            return  # Dropped by reset(); the detector may serve another loop now
+        self._inflight = None
+        self._running = None
+        if self._queued is not None:
+            self._dispatch(loop)
+
+    def reset(self):
+        """Forget per-session tracking state so the detector can be reused.
+
+        A running inference is waited for first, so the worker is no longer
+        updating the state being cleared, and a queued frame is dropped. The
+        next ``detect_async()`` therefore starts afresh, even on another
+        event loop.
+        """
+        if self._running is not None:
+            wait([self._running])
+        self._running = None
+        self._inflight = None
+        self._queued = None
+        self._queued_frame = None
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
+        if self._backend is not None:
+            self._backend.reset()
+        self.last_box = None
+        self._roi_streak = 0
+
+    def close(self):
+        """Shut down the inference worker without waiting for it.
 
-    def detect(self, frame: np.ndarray) -> bool:
-        small_frame = cv2.resize(frame, (0, 0), fx=0.5, fy=0.5)
-        rgb_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
-        results = self.detector.process(rgb_frame)
-        return results.detections is not None and len(results.detections) > 0
+        A running inference is left to finish on the worker, which then
+        closes the backend, so the caller, usually the event loop, never
+        blocks on the model.
+        """
+        if self._executor is not None:
+            if self._backend is not None:
+                self._executor.submit(self._backend.close)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        elif self._backend is not None:
+            self._backend.close()
+        if self._queued is not None and not self._queued.done():
+            self._queued.cancel()
+        self._inflight = None
+        self._running = None
+        self._queued = None
+        self._queued_frame = None
@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+import threading
+import numpy as np
+
+
+@dataclass(slots=True)
+class Frame:
+    """Represents a single frame captured from the camera.
+
+    Frames taken from a FramePool share their image buffer with every other
+    use of that slot, so the consumer calls ``release()`` once it is done
+    with the image; for unpooled frames ``release()`` does nothing.
+
+    Attributes:
+        success (bool): Whether the frame was successfully captured
+        image (np.ndarray): The actual image data, None if capture failed or
+            the frame was grabbed without being decoded
+        dropped (int): Frames captured but never delivered since the previous read
+        timestamp (float): ``time.monotonic()`` when the frame was captured
+        sequence (int): Capture sequence number
+        index (int): Buffer index in the owning pool, None if unpooled
+        pool (FramePool): Pool the buffer belongs to, None if unpooled
+    """
+
+    success: bool
+    image: np.ndarray = None
+    dropped: int = 0
+    timestamp: float = 0.0
+    sequence: int = 0
+    index: int = None
+    pool: "FramePool" = field(default=None, repr=False, compare=False)
+
+    def release(self):
+        """Hand the buffer back to its pool; the image must not be used after."""
+        if self.pool is not None:
+            self.pool.release(self)
+
+
+class FramePool:
+    """Fixed set of preallocated image buffers, each bound to a reusable Frame.
+
+    ``acquire()`` hands out a free slot with one reference, ``retain()`` adds
+    a holder, e.g. when the threaded camera keeps the frame it delivered,
+    and the slot is free again once every holder has called ``release()``.
+    When all slots are busy ``acquire()`` returns None and the caller falls
+    back to a freshly allocated image, so a consumer that forgets to release
+    degrades to the unpooled behaviour instead of stalling capture. The most
+    recently released slot is handed out first, while it is still in cache.
+
+    Attributes:
+        buffers (list): One image buffer per slot
+        frames (list): The Frame bound to each slot
+        misses (int): ``acquire()`` calls that found no free slot
+    """
+
+    def __init__(self, size: int, shape: tuple, dtype=np.uint8):
+        self.buffers = [np.empty(shape, dtype=dtype) for _ in range(size)]
+        self.frames = [
+            Frame(success=False, index=index, pool=self) for index in range(size)
+        ]
+        self.misses = 0
+        self._refs = [0] * size
+        self._free = list(reversed(range(size)))
+        self._lock = threading.Lock()
+
+    @property
+    def in_use(self) -> int:
+        """Number of slots currently held by at least one consumer."""
+        return len(self.buffers) - len(self._free)
+
+    def acquire(self) -> Frame:
+        """Take a free slot.
+
+        Returns:
+            Frame: The slot's Frame, or None if every slot is in use
+        """
+        with self._lock:
+            if not self._free:
+                self.misses += 1
+                return None
+            index = self._free.pop()
+            self._refs[index] = 1
+        return self.frames[index]
+
+    def retain(self, frame: Frame):
+        """Add a holder to a pooled frame."""
+        with self._lock:
+            self._refs[frame.index] += 1
+
+    def release(self, frame: Frame):
+        """Drop a holder; the slot is reused once nobody holds it."""
+        with self._lock:
+            if self._refs[frame.index] == 0:
+                return
+            self._refs[frame.index] -= 1
+            if self._refs[frame.index] == 0:
+                self._free.append(frame.index)
+
+    def adopt(self, frame: Frame, image: np.ndarray):
+        """Keep ``image`` as the slot's buffer if capture had to reallocate.
+
+        OpenCV writes into the supplied buffer only if its shape and type
+        match the frame, so the first frame at a different resolution
+        replaces the buffer and later ones reuse it.
+        """
+        if image is not self.buffers[frame.index]:
+            self.buffers[frame.index] = image
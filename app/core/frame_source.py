@@ -0,0 +1,263 @@
+import os
+import time
+import cv2
+import numpy as np
+from app.utils.config import Config
+from app.utils.logger import logger
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class Pacer:
+    """Spaces out frame delivery to match a target frame rate.
+
+    In real-time mode ``wait()`` sleeps until the next frame is due, so a
+    recorded or synthetic source behaves like a live camera. Otherwise frames
+    are delivered as fast as the consumer asks for them.
+
+    Attributes:
+        fps (float): Target frame rate
+        realtime (bool): Whether to pace delivery to ``fps``
+    """
+
+    def __init__(self, fps: float, realtime: bool):
+        self.fps = fps if fps and fps > 0 else 30.0
+        self.realtime = realtime
+        self._next_due = None
+
+    def wait(self):
+        """Block until the next frame is due, if pacing is enabled."""
+        if not self.realtime:
+            return
+        period = 1.0 / self.fps
+        now = time.perf_counter()
+        if self._next_due is None or now - self._next_due > period:
+            self._next_due = now
+        elif self._next_due > now:
+            time.sleep(self._next_due - now)
+        self._next_due += period
+
+    def reset(self):
+        """Restart the schedule, e.g. after the source loops back."""
+        self._next_due = None
+
+
+def copy_into(buffer, image):
+    """Copy ``image`` into ``buffer`` if it fits, as OpenCV does for ``read``.
+
+    Returns:
+        np.ndarray: ``buffer`` holding the frame, or ``image`` if it does not fit
+    """
+    if buffer is None or buffer.shape != image.shape or buffer.dtype != image.dtype:
+        return image
+    np.copyto(buffer, image)
+    return buffer
+
+
+class FrameSource:
+    """Base class for non-device frame sources.
+
+    Sources expose the subset of the ``cv2.VideoCapture`` interface that
+    ``Camera`` relies on, so recorded and generated frames flow through the
+    same capture path as a live webcam. That includes the ``grab()`` and
+    ``retrieve()`` split: by default ``grab()`` produces the whole image and
+    ``retrieve()`` hands it over, and sources with a real decode step defer
+    it to ``retrieve()``. Those sources also honour the raw mode requested
+    with ``CAP_PROP_FORMAT`` set to -1 and then return the undecoded bytes.
+    """
+
+    def __init__(self, config: Config, fps: float = None):
+        self.config = config
+        self.pacer = Pacer(fps or config.CAMERA_FPS, config.SOURCE_REALTIME)
+        self._opened = False
+        self._grabbed = None
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """Accept capture properties; recorded sources keep their native format."""
+        return False
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FPS:
+            return float(self.pacer.fps)
+        return 0.0
+
+    def read(self, image=None):
+        """Return the next frame as a ``(success, image)`` tuple.
+
+        Like ``VideoCapture.read``, the frame is written into ``image`` when
+        that buffer matches its shape and type.
+        """
+        if not self.grab():
+            return False, None
+        return self.retrieve(image)
+
+    def grab(self) -> bool:
+        """Advance to the next frame without handing it over."""
+        self._grabbed = self._next_image() if self._opened else None
+        if self._grabbed is None:
+            return False
+        self.pacer.wait()
+        return True
+
+    def retrieve(self, image=None):
+        """Return the grabbed frame as a ``(success, image)`` tuple."""
+        if self._grabbed is None:
+            return False, None
+        return True, copy_into(image, self._grabbed)
+
+    def _next_image(self):
+        raise NotImplementedError
+
+    def release(self):
+        self._opened = False
+
+
+class VideoFileSource(FrameSource):
+    """Replays a recorded video file, optionally looping at the end."""
+
+    def __init__(self, config: Config):
+        self.capture = cv2.VideoCapture(config.SOURCE_PATH)
+        super().__init__(config, fps=self.capture.get(cv2.CAP_PROP_FPS))
+        self._opened = self.capture.isOpened()
+
+    def grab(self) -> bool:
+        """Advance the video without decoding the frame."""
+        if not self._opened:
+            return False
+        success = self.capture.grab()
+        if not success and self.config.SOURCE_LOOP:
+            self.capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.pacer.reset()
+            success = self.capture.grab()
+        if success:
+            self.pacer.wait()
+        return success
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """Forward raw mode to the decoder; the format stays native otherwise."""
+        if prop_id == cv2.CAP_PROP_FORMAT:
+            return self.capture.set(prop_id, value)
+        return False
+
+    def retrieve(self, image=None):
+        return self.capture.retrieve(image)
+
+    def release(self):
+        super().release()
+        self.capture.release()
+
+
+class ImageSequenceSource(FrameSource):
+    """Replays a directory of still images in filename order."""
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        path = config.SOURCE_PATH
+        names = sorted(os.listdir(path)) if os.path.isdir(path) else []
+        self.paths = [
+            os.path.join(path, name)
+            for name in names
+            if name.lower().endswith(IMAGE_EXTENSIONS)
+        ]
+        self.index = 0
+        self.raw = False
+        self._opened = bool(self.paths)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        """Switch raw mode, in which files are returned undecoded."""
+        if prop_id == cv2.CAP_PROP_FORMAT:
+            self.raw = value == -1
+            return True
+        return False
+
+    def _next_image(self):
+        path = self._next_path()
+        return None if path is None else cv2.imread(path)
+
+    def _next_path(self):
+        if self.index >= len(self.paths):
+            if not self.config.SOURCE_LOOP:
+                return None
+            self.index = 0
+            self.pacer.reset()
+        self.index += 1
+        return self.paths[self.index - 1]
+
+    def grab(self) -> bool:
+        """Move to the next image file without reading it."""
+        self._grabbed = self._next_path() if self._opened else None
+        if self._grabbed is None:
+            return False
+        self.pacer.wait()
+        return True
+
+    def retrieve(self, image=None):
+        if self._grabbed is None:
+            return False, None
+        if self.raw:
+            return True, np.fromfile(self._grabbed, dtype=np.uint8)
+        decoded = cv2.imread(self._grabbed)
+        if decoded is None:
+            return False, None
+        return True, copy_into(image, decoded)
+
+
+class SyntheticSource(FrameSource):
+    """Generates a deterministic stream of frames without any hardware.
+
+    Every frame is a fixed noise background with a bright square sweeping
+    across it, derived only from ``SYNTHETIC_SEED`` and the frame index, so
+    two runs with the same settings produce identical input.
+    """
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        rng = np.random.default_rng(config.SYNTHETIC_SEED)
+        self.background = rng.integers(
+            0,
+            64,
+            size=(config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3),
+            dtype=np.uint8,
+        )
+        self.index = 0
+        self._opened = True
+
+    def _next_image(self):
+        height, width = self.background.shape[:2]
+        size = max(1, min(height, width) // 4)
+        x = (self.index * 8) % max(1, width - size)
+        y = (height - size) // 2
+        image = self.background.copy()
+        image[y : y + size, x : x + size] = 255
+        self.index += 1
+        return image
+
+
+SOURCES = {
+    "video": VideoFileSource,
+    "images": ImageSequenceSource,
+    "synthetic": SyntheticSource,
+}
+
+
+def create_frame_source(config: Config) -> FrameSource:
+    """Build the frame source selected by ``config.FRAME_SOURCE``.
+
+    Args:
+        config (Config): Configuration selecting and describing the source
+
+    Returns:
+        FrameSource: An opened (or failed-to-open) frame source
+
+    Raises:
+        ValueError: If ``FRAME_SOURCE`` names an unknown backend
+    """
+    try:
+        source_class = SOURCES[config.FRAME_SOURCE]
+    except KeyError:
+        raise ValueError(f"Unknown frame source: {config.FRAME_SOURCE}") from None
+    logger.info(f"🎞️ Using {config.FRAME_SOURCE} frame source")
+    return source_class(config)
@@ -0,0 +1,103 @@
+import time
+import cv2
+import numpy as np
+from app.utils.config import Config
+
+
+class MotionGate:
+    """Skips face detection while the scene in front of the camera is static.
+
+    Each frame is reduced to a tiny greyscale thumbnail and compared with the
+    thumbnail of the last frame that actually went through inference. While
+    the mean absolute difference stays below ``MOTION_THRESHOLD`` the previous
+    detection result is reused, until it is older than
+    ``MOTION_MAX_STALENESS`` seconds and a fresh inference is forced.
+
+    Someone leaving the frame changes the scene, so absence is still picked
+    up on the next sample.
+
+    Attributes:
+        threshold (float): Mean grey-level difference (0-255) that counts as motion
+        max_staleness (float): Maximum age in seconds of a reused result
+        thumbnail_width (int): Width of the comparison thumbnail in pixels
+        frames_seen (int): Frames checked by the gate
+        frames_gated (int): Frames answered from the cached result
+    """
+
+    def __init__(self, config: Config):
+        self.threshold = config.MOTION_THRESHOLD
+        self.max_staleness = config.MOTION_MAX_STALENESS
+        self.thumbnail_width = config.MOTION_THUMBNAIL_WIDTH
+        self.frames_seen = 0
+        self.frames_gated = 0
+        self._reference = None
+        self._candidate = None
+        self._result = None
+        self._result_time = None
+
+    @property
+    def gated_ratio(self) -> float:
+        """Fraction of checked frames that skipped inference."""
+        return self.frames_gated / self.frames_seen if self.frames_seen else 0.0
+
+    def thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """Downsample a frame to a small greyscale image for comparison.
+
+        Args:
+            frame (np.ndarray): BGR or greyscale input frame
+
+        Returns:
+            np.ndarray: Greyscale thumbnail ``thumbnail_width`` pixels wide
+        """
+        height, width = frame.shape[:2]
+        target_width = min(self.thumbnail_width, width)
+        target_height = max(1, round(height * target_width / width))
+        small = cv2.resize(
+            frame, (target_width, target_height), interpolation=cv2.INTER_AREA
+        )
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
+
+    def difference(self, thumbnail: np.ndarray) -> float:
+        """Mean absolute difference between a thumbnail and the reference."""
+        return float(cv2.absdiff(thumbnail, self._reference).mean())
+
+    def lookup(self, frame: np.ndarray) -> tuple:
+        """Decide whether a frame can reuse the last detection result.
+
+        Args:
+            frame (np.ndarray): The frame about to be analysed
+
+        Returns:
+            tuple: ``(True, result)`` if the cached result applies,
+            ``(False, None)`` if inference must run
+        """
+        self.frames_seen += 1
+        self._candidate = self.thumbnail(frame)
+        if (
+            self._reference is None
+            or self._reference.shape != self._candidate.shape
+            or time.monotonic() - self._result_time > self.max_staleness
+            or self.difference(self._candidate) >= self.threshold
+        ):
+            return False, None
+        self.frames_gated += 1
+        return True, self._result
+
+    def update(self, result):
+        """Record a fresh inference result for the frame passed to ``lookup``.
+
+        Args:
+            result: The detection result to reuse while the scene is static
+        """
+        self._reference = self._candidate
+        self._result = result
+        self._result_time = time.monotonic()
+
+    def reset(self):
+        """Forget the cached result so the next frame runs inference."""
+        self._reference = None
+        self._candidate = None
+        self._result = None
+        self._result_time = None
@@ -0,0 +1,140 @@
+import cv2
+import numpy as np
+from app.utils.config import Config
+
+INTERPOLATIONS = {
+    "nearest": cv2.INTER_NEAREST,
+    "linear": cv2.INTER_LINEAR,
+    "area": cv2.INTER_AREA,
+    "cubic": cv2.INTER_CUBIC,
+}
+
+
+class Preprocessor:
+    """Downscales BGR frames and converts their colour into reused buffers.
+
+    ``cv2.resize`` and ``cv2.cvtColor`` write through their ``dst=`` outputs
+    into two flat byte arenas owned by the preprocessor, viewed with the
+    shape of each input. Views are cached per input shape, so steady-state
+    frames allocate no pixel memory; an arena only grows when a larger
+    input than any before arrives. The returned image is overwritten by the
+    next call and must be consumed before then.
+
+    Frames from the camera are already scaled by ``CAPTURE_DECODE_SCALE``,
+    so only the remaining factor up to ``PREPROCESS_SCALE`` is applied here;
+    when both agree the frame is only colour converted.
+
+    Args:
+        config (Config): Application configuration
+        conversion (int, optional): ``cv2.cvtColor`` code applied after
+            resizing, e.g. ``cv2.COLOR_BGR2GRAY``; None keeps BGR.
+            Defaults to ``cv2.COLOR_BGR2RGB``.
+
+    Attributes:
+        scale (float): Downscale factor applied to captured frames
+        conversion (int): Colour conversion code, or None
+        channels (int): Channels in the output image
+        interpolation (int): OpenCV interpolation flag used for resizing
+        frames (int): Frames preprocessed so far
+        bytes_allocated (int): Total pixel buffer bytes allocated
+        last_allocated (int): Bytes allocated while preprocessing the last frame
+    """
+
+    MAX_CACHED_SHAPES = 8
+
+    def __init__(self, config: Config, conversion=cv2.COLOR_BGR2RGB):
+        if config.PREPROCESS_INTERPOLATION not in INTERPOLATIONS:
+            raise ValueError(
+                f"Unknown interpolation: {config.PREPROCESS_INTERPOLATION}"
+            )
+        if not 0.0 < config.PREPROCESS_SCALE <= 1.0:
+            raise ValueError(f"Invalid downscale factor: {config.PREPROCESS_SCALE}")
+        if config.PREPROCESS_SCALE > config.CAPTURE_DECODE_SCALE:
+            raise ValueError(
+                f"Frames are decoded at {config.CAPTURE_DECODE_SCALE}, below the "
+                f"inference scale {config.PREPROCESS_SCALE}"
+            )
+        self.scale = config.PREPROCESS_SCALE / config.CAPTURE_DECODE_SCALE
+        self.conversion = conversion
+        self.channels = 1 if conversion == cv2.COLOR_BGR2GRAY else 3
+        self.interpolation = INTERPOLATIONS[config.PREPROCESS_INTERPOLATION]
+        self.frames = 0
+        self.bytes_allocated = 0
+        self.last_allocated = 0
+        self._resized_arena = np.empty(0, dtype=np.uint8)
+        self._converted_arena = np.empty(0, dtype=np.uint8)
+        self._views = {}
+
+    @property
+    def bytes_per_frame(self) -> float:
+        """Average pixel buffer bytes allocated per preprocessed frame."""
+        return self.bytes_allocated / self.frames if self.frames else 0.0
+
+    def output_size(self, width: int, height: int) -> tuple:
+        """Return the (width, height) a frame of the given size is scaled to."""
+        return max(1, round(width * self.scale)), max(1, round(height * self.scale))
+
+    def __call__(self, image: np.ndarray) -> np.ndarray:
+        """Downscale a BGR image and convert its colour.
+
+        Args:
+            image (np.ndarray): BGR frame or crop, contiguous or not
+
+        Returns:
+            np.ndarray: View into the preprocessor's buffer, or ``image``
+                itself when there is nothing to do
+        """
+        self.last_allocated = 0
+        self.frames += 1
+        resized, converted = self._buffers(image.shape)
+        if resized is not None:
+            cv2.resize(
+                image,
+                (resized.shape[1], resized.shape[0]),
+                dst=resized,
+                interpolation=self.interpolation,
+            )
+            image = resized
+        if converted is None:
+            return image
+        cv2.cvtColor(image, self.conversion, dst=converted)
+        return converted
+
+    def _buffers(self, shape: tuple) -> tuple:
+        views = self._views.get(shape)
+        if views is not None:
+            return views
+        height, width = shape[:2]
+        out_width, out_height = self.output_size(width, height)
+        resize = self.scale < 1.0
+        pixels = out_height * out_width
+        if resize and self._resized_arena.size < pixels * 3:
+            self._resized_arena = self._allocate(pixels * 3)
+            self._views.clear()
+        if self.conversion is not None and self._converted_arena.size < (
+            pixels * self.channels
+        ):
+            self._converted_arena = self._allocate(pixels * self.channels)
+            self._views.clear()
+        if len(self._views) >= self.MAX_CACHED_SHAPES:
+            self._views.clear()
+        resized = converted = None
+        if resize:
+            resized = self._resized_arena[: pixels * 3].reshape(
+                out_height, out_width, 3
+            )
+        if self.conversion is not None:
+            out_shape = (out_height, out_width)
+            if self.channels > 1:
+                out_shape += (self.channels,)
+            converted = self._converted_arena[: pixels * self.channels].reshape(
+                out_shape
+            )
+        views = (resized, converted)
+        self._views[shape] = views
+        return views
+
+    def _allocate(self, size: int) -> np.ndarray:
+        self.bytes_allocated += size
+        self.last_allocated += size
+        return np.empty(size, dtype=np.uint8)
@@ -0,0 +1,312 @@
+from dataclasses import replace
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import queue
+import threading
+import numpy as np
+from app.core.backends import DetectorBackend, create_backend
+from app.core.detection import FULL_FRAME, DetectionResult
+from app.utils.config import Config
+from app.utils.logger import logger
+
+
+class WorkerFailure(RuntimeError):
+    """An inference worker process died or stopped answering."""
+
+
+def _worker_main(config: Config, index: int, generation: int, conn):
+    """Entry point of an inference worker process.
+
+    Builds a backend, reports ready, then answers tasks that point at frames
+    in the parent's shared-memory ring until it receives None or the parent
+    goes away. A backend that cannot be built is reported as an error.
+    """
+    try:
+        backend = create_backend(config)
+    except Exception as e:
+        conn.send(("error", repr(e)))
+        return
+    conn.send(("ready", index, generation))
+    ring = None
+    try:
+        while True:
+            try:
+                task = conn.recv()
+            except EOFError:
+                break
+            if task is None:
+                break
+            name, offset, shape, region = task
+            try:
+                if ring is None or ring.name != name:
+                    if ring is not None:
+                        ring.close()
+                    ring = SharedMemory(name=name)
+                image = np.ndarray(
+                    shape, dtype=np.uint8, buffer=ring.buf, offset=offset
+                )
+                result = backend.detect(image, region)
+                del image
+                conn.send((result.boxes, result.scores, None))
+            except Exception as e:
+                conn.send(((), (), repr(e)))
+    finally:
+        if ring is not None:
+            ring.close()
+
+
+class _SharedRing:
+    """Fixed-size frame slots in one shared-memory segment."""
+
+    def __init__(self, slots: int, slot_size: int):
+        self.slot_size = slot_size
+        self.shm = SharedMemory(create=True, size=slots * slot_size)
+        self.name = self.shm.name
+        self.free = queue.Queue()
+        for slot in range(slots):
+            self.free.put(slot)
+
+    def write(self, slot: int, image: np.ndarray) -> int:
+        """Copy ``image`` into a slot and return the slot's byte offset."""
+        offset = slot * self.slot_size
+        view = np.ndarray(
+            image.shape, dtype=np.uint8, buffer=self.shm.buf, offset=offset
+        )
+        np.copyto(view, image)
+        return offset
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class _Worker:
+    def __init__(self, index: int):
+        self.index = index
+        self.generation = 0
+        self.process = None
+        self.conn = None
+        self.start_failures = 0
+
+
+class ProcessInferencePool:
+    """Runs a detector backend in worker processes fed through shared memory.
+
+    Each frame is copied once into a slot of a shared-memory ring buffer;
+    only the slot offset, shape, region and results cross the process
+    boundary, over a private pipe per worker, never the pixels. Workers run
+    in ``spawn``-started processes, so inference does not hold the app's GIL
+    and a native crash in the model only takes down that worker.
+
+    A health thread restarts workers that died. A task whose worker dies or
+    exceeds ``INFERENCE_TASK_TIMEOUT`` is retried once on another worker. A
+    worker that fails to start ``INFERENCE_START_ATTEMPTS`` times in a row is
+    given up on; once every worker is, detection raises the workers' error.
+
+    Attributes:
+        config (Config): Configuration the worker backends are built from
+        workers (int): Number of worker processes
+        restarts (int): Workers restarted after a crash or hang
+    """
+
+    def __init__(self, config: Config, workers: int):
+        self.config = replace(config, INFERENCE_PROCESSES=0)
+        self.workers = max(1, workers)
+        self.task_timeout = config.INFERENCE_TASK_TIMEOUT
+        self.start_timeout = config.INFERENCE_START_TIMEOUT
+        self.health_interval = config.INFERENCE_HEALTH_INTERVAL
+        self.start_attempts = max(1, config.INFERENCE_START_ATTEMPTS)
+        self.restarts = 0
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = [_Worker(index) for index in range(self.workers)]
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._ring = None
+        self._retired_rings = []
+        self._slot_size = config.CAMERA_WIDTH * config.CAMERA_HEIGHT * 3
+        self._closed = threading.Event()
+        for worker in self._workers:
+            self._start(worker)
+        self._health = threading.Thread(
+            target=self._check_health, name="inference-health", daemon=True
+        )
+        self._health.start()
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        """Run detection on a worker process and wait for the result.
+
+        Args:
+            image (np.ndarray): uint8 BGR frame or crop
+            region (tuple): Normalised region of the crop in the full frame
+
+        Returns:
+            DetectionResult: Result mapped to full-frame coordinates
+
+        Raises:
+            WorkerFailure: If no worker is available, none could be started
+                or the retry also fails
+            RuntimeError: If the backend raised inside the worker
+        """
+        image = np.ascontiguousarray(image, dtype=np.uint8)
+        for attempt in range(2):
+            worker, conn = self._take_worker()
+            try:
+                boxes, scores, error = self._run(conn, image, region)
+            except WorkerFailure as e:
+                logger.warning(f"⚠️ Inference worker {worker.index} failed: {e}")
+                if worker.process.is_alive():
+                    worker.process.kill()
+                if attempt:
+                    raise
+                continue
+            self._idle.put((worker, conn))
+            if error is not None:
+                raise RuntimeError(f"Inference failed in worker: {error}")
+            return DetectionResult(boxes, scores)
+
+    def _take_worker(self):
+        """Wait for a ready worker, skipping entries left by restarted ones."""
+        while True:
+            try:
+                worker, conn = self._idle.get(timeout=self.start_timeout)
+            except queue.Empty:
+                raise WorkerFailure("No inference worker became available") from None
+            if worker is None:
+                # Every worker was given up on; conn carries their last error.
+                # Put the marker back so other waiting callers fail too.
+                self._idle.put((None, conn))
+                raise WorkerFailure(f"Inference workers failed to start: {conn}")
+            if conn is worker.conn and worker.process.is_alive():
+                return worker, conn
+
+    def _run(self, conn, image: np.ndarray, region: tuple):
+        ring = self._ring_for(image.nbytes)
+        slot = ring.free.get()
+        try:
+            offset = ring.write(slot, image)
+            try:
+                conn.send((ring.name, offset, image.shape, region))
+                if not conn.poll(self.task_timeout):
+                    raise WorkerFailure("timed out")
+                return conn.recv()
+            except (EOFError, OSError):
+                raise WorkerFailure("worker process exited") from None
+        finally:
+            ring.free.put(slot)
+
+    def _ring_for(self, nbytes: int) -> _SharedRing:
+        """Return the current ring, replacing it if a frame no longer fits."""
+        with self._lock:
+            if self._ring is None or nbytes > self._ring.slot_size:
+                if self._ring is not None:
+                    self._retired_rings.append(self._ring)
+                self._slot_size = max(self._slot_size, nbytes)
+                self._ring = _SharedRing(self.workers, self._slot_size)
+            return self._ring
+
+    def _start(self, worker: _Worker):
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.generation += 1
+        worker.conn, child_conn = self._context.Pipe()
+        worker.process = self._context.Process(
+            target=_worker_main,
+            args=(self.config, worker.index, worker.generation, child_conn),
+            name=f"inference-{worker.index}",
+            daemon=True,
+        )
+        worker.process.start()
+        child_conn.close()
+        threading.Thread(
+            target=self._await_ready,
+            args=(worker, worker.conn),
+            name=f"inference-start-{worker.index}",
+            daemon=True,
+        ).start()
+
+    def _await_ready(self, worker: _Worker, conn):
+        error = "did not report ready"
+        try:
+            if conn.poll(self.start_timeout):
+                message = conn.recv()
+                if message[0] == "ready":
+                    worker.start_failures = 0
+                    self._idle.put((worker, conn))
+                    return
+                error = message[1]
+        except (EOFError, OSError):
+            error = "exited during startup"
+        if self._closed.is_set():
+            return
+        logger.warning(f"⚠️ Inference worker {worker.index} did not start: {error}")
+        if conn is worker.conn and worker.process.is_alive():
+            worker.process.kill()
+        with self._lock:
+            worker.start_failures += 1
+            if self._given_up(worker) and all(map(self._given_up, self._workers)):
+                logger.error(f"❌ Inference workers failed to start: {error}")
+                self._idle.put((None, error))
+
+    def _given_up(self, worker: _Worker) -> bool:
+        return worker.start_failures >= self.start_attempts
+
+    def _check_health(self):
+        while not self._closed.wait(self.health_interval):
+            for worker in self._workers:
+                if worker.process.is_alive() or self._closed.is_set():
+                    continue
+                if self._given_up(worker):
+                    continue
+                logger.warning(
+                    f"⚠️ Inference worker {worker.index} exited "
+                    f"({worker.process.exitcode}), restarting..."
+                )
+                self.restarts += 1
+                self._start(worker)
+
+    def close(self):
+        """Stop the workers and release the shared memory."""
+        self._closed.set()
+        self._health.join()
+        for worker in self._workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=2.0)
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+            worker.conn.close()
+        for ring in self._retired_rings + [self._ring]:
+            if ring is not None:
+                ring.close()
+        self._ring = None
+        self._retired_rings = []
+
+
+class ProcessBackend(DetectorBackend):
+    """Backend that forwards detection to a ProcessInferencePool.
+
+    The pool starts on first use and is shut down by ``close()``; a later
+    detection starts it again.
+    """
+
+    name = "process"
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.pool = None
+
+    def detect(self, image: np.ndarray, region: tuple = FULL_FRAME):
+        if self.pool is None:
+            self.pool = ProcessInferencePool(
+                self.config, self.config.INFERENCE_PROCESSES
+            )
+        return self.pool.detect(image, region)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
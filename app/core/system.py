@@ -1,6 +1,51 @@
+import functools
 import os
-import Quartz
+import time
 from app.utils.logger import logger
+from app.utils.metrics import metrics
+
+try:
+    import Quartz
+except ImportError:  # Not on macOS, e.g. headless benchmark runs
+    Quartz = None
+
+LOCK_ACTIONS = metrics.counter(
+    "sentry_lock_actions_total", "Screen lock commands issued"
+)
+
+
+def probe_metrics(probe: str):
+    """Return the duration histogram and error counter of a system probe."""
+    return (
+        metrics.histogram(
+            "sentry_system_probe_seconds",
+            "Time spent probing system state",
+            probe=probe,
+        ),
+        metrics.counter(
+            "sentry_system_probe_errors_total",
+            "System state probes that failed",
+            probe=probe,
+        ),
+    )
+
+
+def timed_probe(probe: str):
+    """Decorate a probe to record its duration under ``probe``."""
+    seconds, _ = probe_metrics(probe)
+
+    def decorate(func):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                seconds.observe(time.perf_counter() - start)
+
+        return timed
+
+    return decorate
 
 
 class SystemController:
@@ -27,6 +72,7 @@ class SystemController:
             bool: True if the lock command was executed successfully
         """
         logger.info("🔐 Initiating system lock sequence...")
+        LOCK_ACTIONS.inc()
         applescript = """
         tell application "System Events" to keystroke "q" using {control down, command down}
         """
@@ -35,6 +81,7 @@ class SystemController:
         return True
 
     @staticmethod
+    @timed_probe("sleep")
     def is_sleep_mode():
         """Check if the system is in sleep mode.
 
@@ -54,9 +101,11 @@ class SystemController:
             return is_sleeping
         except Exception as e:
             logger.error(f"⚠️ Failed to check sleep state: {e}")
+            probe_metrics("sleep")[1].inc()
             return False
 
     @staticmethod
+    @timed_probe("screen_lock")
     def is_screen_locked():
         """Check if the screen is currently locked.
 
@@ -76,9 +125,11 @@ class SystemController:
             return False
         except Exception as e:
             logger.error(f"⚠️ Failed to check screen lock state: {e}")
+            probe_metrics("screen_lock")[1].inc()
             return False
 
     @staticmethod
+    @timed_probe("user_activity")
     def is_user_inactive():
         """Check if the user is currently inactive.
 
@@ -99,4 +150,5 @@ class SystemController:
             return is_inactive
         except Exception as e:
             logger.error(f"⚠️ Failed to check user activity state: {e}")
+            probe_metrics("user_activity")[1].inc()
             return False
@@ -1,15 +1,15 @@
+from app.utils.startup import startup  # first: timings include the imports below
+import multiprocessing
 import os
 import rumps
 import sys
 import threading
 import datetime
-
-os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
-
 import asyncio
 from app.utils.config import Config
-from app.services.monitor import SecurityMonitor
+from app.services.preload import preload_detector
 from app.utils.logger import logger
+from app.utils.metrics import start_exporters
 import subprocess
 
 
@@ -99,6 +99,10 @@ class SentryApp(rumps.App):
         self.update_monitoring_menu()
         self.menu["Launch at Login"].state = get_login_item_status()
 
+        startup.mark("menu_bar_ready")
+        self.detector_ready = preload_detector(Config())
+        self.metrics_exporters = start_exporters(Config())
+
     def update_monitoring_menu(self):
         """Updates the menu text based on monitoring state."""
         menu_item = self.menu["Toggle Monitoring"]
@@ -128,6 +132,9 @@ class SentryApp(rumps.App):
     async def _start_monitoring(self):
         """Starts monitoring with current configuration."""
         try:
+            from app.services.monitor import SecurityMonitor
+
+            await self._wait_for_models()
             config = Config()
             self.monitor = SecurityMonitor(config)
             await self.monitor.monitor()
@@ -137,6 +144,16 @@ class SentryApp(rumps.App):
             self.menu["Start Monitoring"].state = False
             self.menu["Stop Monitoring"].state = True
 
+    async def _wait_for_models(self):
+        """Wait for the background model preload without blocking the loop.
+
+        If the preload failed, SecurityMonitor builds its detector itself.
+        """
+        try:
+            await asyncio.wrap_future(self.detector_ready)
+        except Exception:
+            pass
+
     def toggle_launch_at_login(self, sender):
         """Toggles launch at login setting."""
         sender.state = not sender.state
@@ -170,6 +187,8 @@ Shortcuts:
     def quit(self, _):
         if self._monitoring:
             run_async(self.cleanup())
+        for stop_exporter in self.metrics_exporters:
+            stop_exporter()
         rumps.quit_application()
 
     async def cleanup(self):
@@ -191,4 +210,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,118 @@
+from concurrent.futures import Future
+import threading
+from app.utils.config import Config
+from app.utils.logger import logger
+from app.utils.startup import startup
+
+
+def _default_factory():
+    """Return FaceDetector, imported on first use to keep MediaPipe off the caller.
+
+    Resolving to the class itself, rather than wrapping it, gives detectors
+    built by default and those requested with ``factory=FaceDetector`` the
+    same pool key.
+    """
+    from app.core.face_detector import FaceDetector
+
+    return FaceDetector
+
+
+class DetectorRegistry:
+    """Process-wide pool of initialised, warmed-up face detectors.
+
+    Building a detector loads the MediaPipe model, so detectors are kept
+    after use and handed out again to any monitor with the same
+    configuration. Each detector serves one borrower at a time; borrowing
+    while all matching detectors are in use builds another one.
+
+    Attributes:
+        warm_up_runs (int): Blank-frame inferences run on each new detector
+    """
+
+    def __init__(self, warm_up_runs: int = None):
+        self.warm_up_runs = warm_up_runs
+        self._idle = {}
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, config: Config, factory=None):
+        """Borrow a ready detector for ``config``, building one if none is idle.
+
+        Args:
+            config (Config): Configuration the detector must match
+            factory (callable, optional): Builds a detector from a config.
+                Defaults to FaceDetector; detectors are pooled per factory.
+
+        Returns:
+            FaceDetector: A warmed-up detector reserved for the caller
+        """
+        factory = factory or _default_factory()
+        key = (factory, config)
+        with self._lock:
+            idle = self._idle.get(key)
+            detector = idle.pop() if idle else None
+        if detector is None:
+            detector = self._create(config, factory)
+        with self._lock:
+            self._in_use[id(detector)] = key
+        return detector
+
+    def release(self, detector):
+        """Return a borrowed detector to the pool after clearing its state.
+
+        Detectors that were not borrowed from this registry are ignored.
+        """
+        with self._lock:
+            key = self._in_use.pop(id(detector), None)
+        if key is None:
+            return
+        detector.reset()
+        with self._lock:
+            self._idle.setdefault(key, []).append(detector)
+
+    def preload(self, config: Config, factory=None) -> Future:
+        """Build and warm a detector for ``config`` on a background thread.
+
+        Args:
+            config (Config): Configuration to preload
+            factory (callable, optional): Detector factory, as for ``acquire``
+
+        Returns:
+            Future: Resolves once a ready detector is idle in the pool
+        """
+        future = Future()
+
+        def load():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                build = factory or _default_factory()
+                detector = self._create(config, build)
+            except Exception as e:
+                logger.error(f"❌ Failed to preload face detection model: {e}")
+                future.set_exception(e)
+                return
+            with self._lock:
+                self._idle.setdefault((build, config), []).append(detector)
+            startup.mark("models_ready")
+            future.set_result(detector)
+
+        threading.Thread(target=load, name="model-preload", daemon=True).start()
+        return future
+
+    def clear(self):
+        """Drop all idle detectors and shut down their inference workers."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for detectors in idle.values():
+            for detector in detectors:
+                detector.close()
+
+    def _create(self, config: Config, factory):
+        detector = factory(config)
+        runs = self.warm_up_runs
+        detector.warm_up(runs=config.DETECTOR_WARM_UP_RUNS if runs is None else runs)
+        return detector
+
+
+detectors = DetectorRegistry()
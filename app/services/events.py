@@ -0,0 +1,162 @@
+import asyncio
+from enum import Enum
+import threading
+
+
+class SystemEvent(Enum):
+    """System state transitions published on the event bus."""
+
+    LOCK = "lock"
+    UNLOCK = "unlock"
+    SLEEP = "sleep"
+    WAKE = "wake"
+    IDLE_START = "idle_start"
+    IDLE_END = "idle_end"
+
+
+class EventSubscription:
+    """Async iterator over the events published on a SystemEventBus.
+
+    Each subscription is bound to the event loop it was created on and
+    buffers events until they are consumed, so publishers on any thread can
+    deliver to it. ``close()`` is also thread-safe and ends the iteration,
+    waking any pending ``next()``.
+
+    Attributes:
+        kinds (frozenset): Events this subscription receives; all if empty
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, bus, loop: asyncio.AbstractEventLoop, kinds=()):
+        self.kinds = frozenset(kinds)
+        self._bus = bus
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._closed = False
+
+    def wants(self, event: SystemEvent) -> bool:
+        return not self.kinds or event in self.kinds
+
+    def deliver(self, event):
+        """Queue an event from any thread."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+        except RuntimeError:  # Loop closed between the check and the call
+            pass
+
+    async def next(self, timeout: float = None):
+        """Wait for the next event.
+
+        Args:
+            timeout (float, optional): Seconds to wait before giving up
+
+        Returns:
+            SystemEvent | None: The event, or None on timeout or after close
+        """
+        if self._closed and self._queue.empty():
+            return None
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is self._CLOSED:
+            self._closed = True
+            return None
+        return event
+
+    async def wait_for(self, *kinds: SystemEvent, timeout: float = None):
+        """Wait until one of ``kinds`` is published.
+
+        Args:
+            *kinds (SystemEvent): Events to wait for
+            timeout (float, optional): Overall deadline in seconds
+
+        Returns:
+            SystemEvent | None: The matching event, or None on timeout or close
+        """
+        deadline = None if timeout is None else self._loop.time() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - self._loop.time()
+            if remaining is not None and remaining <= 0:
+                return None
+            event = await self.next(remaining)
+            if event is None or event in kinds:
+                return event
+
+    def close(self):
+        """Unsubscribe and wake any waiter; safe to call from any thread."""
+        self._bus.unsubscribe(self)
+        self.deliver(self._CLOSED)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> SystemEvent:
+        event = await self.next()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SystemEventBus:
+    """Thread-safe fan-out of system state transitions to asyncio consumers.
+
+    Backends with native notifications and the polling adapter in
+    ``SystemStateService`` both publish here; consumers either iterate over a
+    subscription or hold an ``asyncio.Event`` that is set on a given event.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        self._events = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, *kinds: SystemEvent) -> EventSubscription:
+        """Subscribe the running event loop to the given events (all if none).
+
+        Returns:
+            EventSubscription: Async iterator over matching events
+        """
+        subscription = EventSubscription(self, asyncio.get_running_loop(), kinds)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def event(self, kind: SystemEvent) -> asyncio.Event:
+        """Return an ``asyncio.Event`` that is set whenever ``kind`` is published.
+
+        The caller clears it after handling. The event belongs to the running
+        event loop.
+        """
+        event = asyncio.Event()
+        with self._lock:
+            self._events.append((asyncio.get_running_loop(), kind, event))
+        return event
+
+    def publish(self, event: SystemEvent):
+        """Deliver an event to every interested subscriber, from any thread."""
+        with self._lock:
+            subscriptions = [sub for sub in self._subscriptions if sub.wants(event)]
+            self._events = [entry for entry in self._events if not entry[0].is_closed()]
+            targets = [entry for entry in self._events if entry[1] is event]
+        for subscription in subscriptions:
+            subscription.deliver(event)
+        for loop, _, flag in targets:
+            try:
+                loop.call_soon_threadsafe(flag.set)
+            except RuntimeError:
+                pass
@@ -0,0 +1,23 @@
+FUSION_RULES = {
+    "any": any,
+    "all": all,
+    "majority": lambda votes: sum(votes) * 2 > len(votes),
+}
+
+
+def get_fusion_rule(name: str):
+    """Return the rule that combines per-source presence answers into one.
+
+    Args:
+        name (str): ``any``, ``all`` or ``majority``
+
+    Returns:
+        callable: Takes a non-empty list of booleans and returns a boolean
+
+    Raises:
+        ValueError: If the rule is unknown
+    """
+    try:
+        return FUSION_RULES[name]
+    except KeyError:
+        raise ValueError(f"Unknown presence fusion rule: {name}") from None
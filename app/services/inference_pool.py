@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from app.core.backends import create_backend
+from app.utils.config import Config
+
+
+class InferencePool:
+    """Worker threads that run face detection for several frame sources.
+
+    Models are not safe to call from two threads at once, so every worker
+    thread lazily builds its own backend on its first detection. The number of model
+    instances therefore follows ``workers``, not the number of sources, and
+    CPU cost follows the total number of frames submitted.
+
+    Attributes:
+        config (Config): Configuration the backends are built from
+        workers (int): Number of worker threads and backends
+        executor (ThreadPoolExecutor): Executor detections are submitted to
+    """
+
+    def __init__(self, config: Config, workers: int = 1):
+        self.config = config
+        self.workers = max(1, workers)
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="inference"
+        )
+        self._local = threading.local()
+        self._backends = []
+        self._backends_lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def backend(self):
+        """The calling worker thread's backend, built on first use."""
+        backend = getattr(self._local, "backend", None)
+        if backend is None:
+            backend = create_backend(self.config)
+            self._local.backend = backend
+            with self._backends_lock:
+                self._backends.append(backend)
+        return backend
+
+    def close(self):
+        """Shut down the workers without waiting for running detections.
+
+        One closing task per worker is queued behind the pending work. The
+        tasks meet at a barrier, so each worker thread takes exactly one and
+        closes its own backend once its running detection has finished.
+        This stops the worker processes and shared memory of out-of-process
+        backends, and the caller, usually the event loop, never blocks.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        barrier = threading.Barrier(self.workers)
+        for _ in range(self.workers):
+            self.executor.submit(self._close_backend, barrier)
+        self.executor.shutdown(wait=False)
+
+    def _close_backend(self, barrier: threading.Barrier):
+        try:
+            barrier.wait(timeout=self.config.INFERENCE_START_TIMEOUT)
+        except threading.BrokenBarrierError:
+            pass
+        backend = getattr(self._local, "backend", None)
+        if backend is not None:
+            self._local.backend = None
+            with self._backends_lock:
+                self._backends.remove(backend)
+            backend.close()
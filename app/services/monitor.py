@@ -1,9 +1,65 @@
 import asyncio
+from dataclasses import dataclass, replace
+import threading
+import time
 from app.core.camera import Camera
 from app.core.face_detector import FaceDetector
 from app.core.system import SystemController
+from app.services.detector_registry import detectors
+from app.services.fusion import get_fusion_rule
+from app.services.inference_pool import InferencePool
+from app.services.presence import ABSENT, PresenceStateMachine, confidence_of
+from app.services.scheduler import create_scheduler
+from app.services.system_state import MacOSStateBackend, SystemStateService
 from app.utils.config import Config
 from app.utils.logger import logger
+from app.utils.metrics import metrics
+from app.utils.startup import startup
+
+STATES = (
+    "idle",
+    "monitoring",
+    "camera_retry",
+    "sleeping",
+    "locked",
+    "absence_lock",
+    "inactivity_lock",
+    "stopped",
+)
+STATE_ENTRIES = {
+    state: metrics.counter(
+        "sentry_monitor_transitions_total", "Monitor state transitions", to=state
+    )
+    for state in STATES
+}
+STATE_ACTIVE = {
+    state: metrics.gauge("sentry_monitor_state", "Current monitor state", state=state)
+    for state in STATES
+}
+ABSENCE_EVIDENCE = metrics.gauge(
+    "sentry_monitor_absence_evidence", "Accumulated log-likelihood ratio of absence"
+)
+
+
+@dataclass
+class MonitoredSource:
+    """A camera with its own detector state and sampling schedule.
+
+    Attributes:
+        camera (Camera): Camera feeding this source
+        detector (FaceDetector): Detector holding the source's tracking state
+        scheduler (FixedSamplingScheduler): Sampling schedule of this source
+        frame_count (int): Frames read from this source in the current session
+        present (bool): Latest presence answer, None until the source is sampled
+        confidence (float): Presence confidence of the latest answer
+    """
+
+    camera: Camera
+    detector: FaceDetector
+    scheduler: object
+    frame_count: int = 0
+    present: bool = None
+    confidence: float = 0.0
 
 
 class SecurityMonitor:
@@ -15,35 +71,111 @@ class SecurityMonitor:
     - Handling security actions (screen locking, surveillance pausing)
     - Coordinating the interaction between all components
 
+    With several ``CAMERA_INDICES``, every camera is read in turn and
+    sampled on its own schedule. The latest answers of all sources are
+    combined with the ``PRESENCE_FUSION`` rule, and detection for all of
+    them runs on one shared InferencePool of ``INFERENCE_WORKERS`` threads.
+
+    Whether the user has left is decided by a PresenceStateMachine fed with
+    the fused confidence of every round of samples, so the lock fires after
+    ``ABSENCE_TIMEOUT`` seconds of sufficient evidence however fast frames
+    are sampled.
+
     Attributes:
         config (Config): Application configuration
-        camera (Camera): Camera management instance
-        detector (FaceDetector): Face detection service
+        sources (list): MonitoredSource for each camera
+        camera (Camera): Camera of the first source
+        detector (FaceDetector): Detector of the first source
         system (SystemController): System state controller
-        absence_timer (int): Counter for frames without face detection
+        scheduler (FixedSamplingScheduler): Schedule of the first source
+        pool (InferencePool): Shared inference workers, None for one camera
+        presence (PresenceStateMachine): Absence decision over fused samples
         frame_count (int): Total processed frames counter
         running (bool): Monitor's operational state flag
+        state (str): Current entry of ``STATES``, exported as metrics
     """
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        system: SystemController = None,
+        detector: FaceDetector = None,
+    ):
         """Initialize the security monitor with required components.
 
         Args:
             config (Config): Application configuration object
+            system (SystemController, optional): System controller to use,
+                e.g. a stub when benchmarking. Defaults to a new SystemController,
+                wrapped in a background SystemStateService when
+                ``SYSTEM_STATE_POLLING`` is enabled.
+            detector (FaceDetector, optional): Detector to use with a single
+                camera. Defaults to one borrowed from the process-wide
+                registry and returned on stop.
         """
         self.config = config
-        self.camera = Camera(config)
-        self.detector = FaceDetector(config)
-        self.system = SystemController()
-        self.absence_timer = 0
+        self._fuse = get_fusion_rule(config.PRESENCE_FUSION)
+        indices = config.CAMERA_INDICES or (config.CAMERA_INDEX,)
+        self.pool = None
+        if len(indices) > 1:
+            self.pool = InferencePool(config, config.INFERENCE_WORKERS)
+        self._borrowed_detector = detector is None and self.pool is None
+        if self._borrowed_detector:
+            detector = detectors.acquire(config, factory=FaceDetector)
+        self.sources = []
+        for position, index in enumerate(indices):
+            source_config = config
+            if self.pool is not None:
+                skips = config.CAMERA_FRAME_SKIPS
+                source_config = replace(
+                    config,
+                    CAMERA_INDEX=index,
+                    FRAME_SKIP=(
+                        skips[position] if position < len(skips) else config.FRAME_SKIP
+                    ),
+                )
+                detector = FaceDetector(config, pool=self.pool)
+            self.sources.append(
+                MonitoredSource(
+                    Camera(source_config), detector, create_scheduler(source_config)
+                )
+            )
+        self.camera = self.sources[0].camera
+        self.detector = self.sources[0].detector
+        if system is None:
+            system = SystemController()
+            if config.SYSTEM_STATE_POLLING:
+                system = SystemStateService(config, MacOSStateBackend(system))
+        self.system = system
+        self.scheduler = self.sources[0].scheduler
+        self.presence = PresenceStateMachine(config)
         self.frame_count = 0
         self.running = True
+        self.state = None
+        self._enter("idle")
+        self._events = None
+        self._looping = False
+        self._detector_lock = threading.Lock()
+        self._detector_returned = False
 
     async def stop(self):
         """Stop the monitor gracefully and cleanup resources."""
         logger.info("🛑 Initiating graceful shutdown...")
         self.running = False
-        self.camera.release()
+        self._enter("stopped")
+        self._release_cameras()
+        if self._borrowed_detector:
+            if not self._looping:
+                self._return_detector()
+        else:
+            for source in self.sources:
+                source.detector.close()
+        if self.pool is not None:
+            self.pool.close()
+        if self._events is not None:
+            self._events.close()
+        if isinstance(self.system, SystemStateService):
+            self.system.close()
 
     async def monitor(self):
         """Main monitoring loop that coordinates security operations.
@@ -54,6 +186,36 @@ class SecurityMonitor:
         3. Processes frames for face detection
         4. Triggers security actions when needed
         """
+        self._looping = True
+        if isinstance(self.system, SystemStateService):
+            # Take the first snapshot off the loop; the probes spawn processes
+            await asyncio.to_thread(self.system.refresh)
+            self.system.start()
+            self._events = self.system.events.subscribe()
+        try:
+            await self._monitor_loop()
+        finally:
+            self._looping = False
+            if self._events is not None:
+                self._events.close()
+                self._events = None
+            if self._borrowed_detector:
+                self._return_detector()
+
+    def _return_detector(self):
+        """Give the borrowed detector back to the registry, exactly once.
+
+        ``stop()`` may run on another thread while the loop is still
+        detecting, so the loop returns the detector itself once it has
+        exited; ``stop()`` only does so when no loop is running.
+        """
+        with self._detector_lock:
+            if self._detector_returned:
+                return
+            self._detector_returned = True
+        detectors.release(self.detector)
+
+    async def _monitor_loop(self):
         while self.running:
             if self.system.is_screen_locked():
                 await self._wait_for_unlock()
@@ -61,7 +223,9 @@ class SecurityMonitor:
                     break
                 continue
 
-            if not self.camera.start():
+            active = await self._start_cameras()
+            if not active:
+                self._enter("camera_retry")
                 logger.error(
                     "🔄 Camera initialization failed, retrying in 5 seconds..."
                 )
@@ -71,6 +235,13 @@ class SecurityMonitor:
                 continue
 
             logger.info("👀 Sentry active - Monitoring for presence...")
+            self._enter("monitoring")
+            self.presence.reset()
+            ABSENCE_EVIDENCE.set(0)
+            for source in self.sources:
+                source.scheduler.reset()
+                source.frame_count = 0
+                source.present = None
 
             try:
                 while self.running:
@@ -78,36 +249,108 @@ class SecurityMonitor:
                         await self._handle_sleep_mode()
                         break
 
-                    frame = self.camera.read()
-                    if not frame.success:
+                    sampled = []
+                    for source in list(active):
+                        sample = source.scheduler.should_sample(source.frame_count + 1)
+                        frame = source.camera.read(decode=sample)
+                        if not frame.success:
+                            active.remove(source)
+                            source.present = None
+                            continue
+                        self.frame_count += 1
+                        source.frame_count += 1
+                        if sample:
+                            sampled.append((source, frame))
+                        else:
+                            frame.release()
+                    if not active:
                         break
-
-                    self.frame_count += 1
-                    if self.frame_count % self.config.FRAME_SKIP != 0:
+                    if not sampled:
                         continue
 
-                    if self.detector.detect(frame.image):
-                        self.absence_timer = 0
-                    else:
-                        self.absence_timer += 1
-                        if self.absence_timer >= self.config.ABSENCE_THRESHOLD:
-                            await self._handle_absence()
-                            break
+                    try:
+                        results = await asyncio.gather(
+                            *(
+                                source.detector.detect_async(frame.image)
+                                for source, frame in sampled
+                            )
+                        )
+                    finally:
+                        for _, frame in sampled:
+                            frame.release()
+                    startup.mark("first_detection")
+                    for (source, _), result in zip(sampled, results):
+                        source.present = bool(result)
+                        source.confidence = confidence_of(result)
+                    state = self.presence.update(
+                        self._fused_confidence(active), time.monotonic()
+                    )
+                    ABSENCE_EVIDENCE.set(self.presence.evidence)
+                    if state == ABSENT:
+                        await self._handle_absence()
+                        break
+                    for (source, _), result in zip(sampled, results):
+                        source.scheduler.record(result, self.presence.doubtful)
 
                     if self.system.is_user_inactive():
                         logger.info(
                             "💤 User inactivity detected - Engaging security measures..."
                         )
-                        self.camera.release()
+                        self._enter("inactivity_lock")
+                        self._release_cameras()
                         self.system.lock_screen()
-                        while self.running and self.system.is_user_inactive():
-                            await asyncio.sleep(1)
+                        await self._wait_while(self.system.is_user_inactive)
                         break
 
-                    await asyncio.sleep(self.config.CHECK_INTERVAL)
+                    await asyncio.sleep(
+                        min(source.scheduler.interval for source in active)
+                    )
 
             finally:
-                self.camera.release()
+                self._suspend_cameras()
+
+    def _fused_presence(self, sources: list) -> bool:
+        """Combine the latest answers of ``sources`` with the fusion rule."""
+        return self._fuse(
+            [source.present for source in sources if source.present is not None]
+        )
+
+    def _fused_confidence(self, sources: list) -> float:
+        """Confidence of the fused answer: the best face seen, 0.0 if absent."""
+        if not self._fused_presence(sources):
+            return 0.0
+        return max(source.confidence for source in sources if source.present)
+
+    def _enter(self, state: str):
+        """Record a transition to ``state`` in the monitor metrics."""
+        if state == self.state:
+            return
+        if self.state is not None:
+            STATE_ACTIVE[self.state].set(0)
+        STATE_ACTIVE[state].set(1)
+        STATE_ENTRIES[state].inc()
+        self.state = state
+
+    async def _start_cameras(self) -> list:
+        """Start every camera on a worker thread and return the sources that opened.
+
+        Opening a device, and probing its modes with ``CAMERA_PROBE``, can
+        block for seconds, so it runs off the event loop.
+        """
+        started = await asyncio.gather(
+            *(asyncio.to_thread(source.camera.start) for source in self.sources)
+        )
+        return [source for source, ok in zip(self.sources, started) if ok]
+
+    def _release_cameras(self):
+        """Close every device at once, e.g. before locking the screen."""
+        for source in self.sources:
+            source.camera.release()
+
+    def _suspend_cameras(self):
+        """Stop capturing, keeping devices open for ``CAMERA_IDLE_TIMEOUT``."""
+        for source in self.sources:
+            source.camera.suspend()
 
     async def _handle_sleep_mode(self):
         """Handle system sleep mode transitions.
@@ -116,10 +359,10 @@ class SecurityMonitor:
         ensuring proper resource management and state transitions.
         """
         logger.info("💤 System entering sleep mode - Pausing operations...")
-        self.camera.release()
+        self._enter("sleeping")
+        self._suspend_cameras()
 
-        while self.running and self.system.is_sleep_mode():
-            await asyncio.sleep(1)
+        await self._wait_while(self.system.is_sleep_mode)
 
         logger.info("⚡ System resumed from sleep - Reactivating surveillance...")
 
@@ -130,7 +373,8 @@ class SecurityMonitor:
         including screen locking and resource cleanup.
         """
         logger.info("🚨 Extended absence detected - Engaging security protocol...")
-        self.camera.release()
+        self._enter("absence_lock")
+        self._release_cameras()
         self.system.lock_screen()
 
     async def _wait_for_unlock(self):
@@ -140,6 +384,22 @@ class SecurityMonitor:
         back to active surveillance when the system is unlocked.
         """
         logger.info("🔒 System locked - Awaiting unlock event...")
-        while self.running and self.system.is_screen_locked():
-            await asyncio.sleep(1)
+        self._enter("locked")
+        await self._wait_while(self.system.is_screen_locked)
         logger.info("🔓 System unlocked - Resuming surveillance...")
+
+    async def _wait_while(self, condition):
+        """Wait until ``condition()`` turns false or the monitor stops.
+
+        With a SystemStateService, the wait sleeps on its event bus and wakes
+        as soon as a transition is published. Otherwise the condition is
+        polled once per second.
+
+        Args:
+            condition (callable): System query to wait on, e.g. is_screen_locked
+        """
+        while self.running and condition():
+            if self._events is None:
+                await asyncio.sleep(1)
+            elif await self._events.next() is None:
+                break
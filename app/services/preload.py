@@ -0,0 +1,20 @@
+from concurrent.futures import Future
+from app.services.detector_registry import detectors
+from app.utils.config import Config
+
+
+def preload_detector(config: Config) -> Future:
+    """Import OpenCV and MediaPipe and warm up a detector in the background.
+
+    The heavy imports and the MediaPipe graph construction run on a daemon
+    thread so the menu bar can appear first. The detector is warmed on a
+    blank frame and parked in the process-wide registry, where the first
+    SecurityMonitor picks it up.
+
+    Args:
+        config (Config): Configuration for the detector to build
+
+    Returns:
+        Future: Resolves to the ready FaceDetector, or to the loading error
+    """
+    return detectors.preload(config)
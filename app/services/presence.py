@@ -0,0 +1,118 @@
+import math
+from app.core.detection import DetectionResult
+from app.utils.config import Config
+
+PRESENT = "present"
+DOUBT = "doubt"
+ABSENT = "absent"
+
+
+def confidence_of(result) -> float:
+    """Presence confidence of a detection outcome, in ``[0, 1]``.
+
+    Args:
+        result: DetectionResult, or a plain truthy/falsy presence answer
+
+    Returns:
+        float: The best face score, or 1.0/0.0 for a plain answer
+    """
+    if isinstance(result, DetectionResult):
+        return result.best_score
+    return float(bool(result))
+
+
+class PresenceStateMachine:
+    """Decides presence from a stream of timed detection confidences.
+
+    Evidence of absence is accumulated as a one-sided sequential likelihood
+    test (CUSUM): every sample adds the log-likelihood ratio of "nobody
+    there" against "user there", so a frame without any face weighs more
+    than a face the detector is unsure of, and evidence never drops below
+    zero. Any face the detector accepts, i.e. scoring at least
+    ``FACE_CONFIDENCE``, settles presence at once, so misses spread among
+    detections never add up to a lock.
+
+    The machine is ``present`` while no evidence is pending, ``doubt`` while
+    some is, and turns ``absent`` once the evidence reaches
+    ``PRESENCE_EVIDENCE`` *and* the doubt has lasted ``ABSENCE_TIMEOUT``
+    seconds. The lock delay is therefore set in wall-clock time rather than
+    in samples, and strong evidence needs only a couple of inferences.
+
+    Attributes:
+        config (Config): Application configuration
+        state (str): ``present``, ``doubt`` or ``absent``
+        evidence (float): Accumulated log-likelihood ratio of absence
+        doubt_since (float): Timestamp of the first doubtful sample, or None
+        confidence (float): Confidence of the latest sample
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.reset()
+
+    def reset(self):
+        """Start over from presence, e.g. when a new session begins."""
+        self.state = PRESENT
+        self.evidence = 0.0
+        self.doubt_since = None
+        self.confidence = 1.0
+
+    @property
+    def doubtful(self) -> bool:
+        """Whether any evidence of absence is pending."""
+        return self.state != PRESENT
+
+    @property
+    def max_step(self) -> float:
+        """Evidence added by a sample without any face."""
+        noise = self.config.PRESENCE_NOISE
+        return math.log((1 + noise) / noise)
+
+    def log_likelihood_ratio(self, confidence: float) -> float:
+        """Evidence of absence carried by one sample of the given confidence."""
+        noise = self.config.PRESENCE_NOISE
+        return math.log((1 - confidence + noise) / (confidence + noise))
+
+    def update(self, confidence: float, now: float) -> str:
+        """Take one sample into account.
+
+        Args:
+            confidence (float): Presence confidence of the sample, see
+                ``confidence_of``
+            now (float): ``time.monotonic()`` when the frame was analysed
+
+        Returns:
+            str: The new state
+        """
+        self.confidence = confidence
+        if confidence >= self.config.FACE_CONFIDENCE:
+            self.evidence = 0.0
+        else:
+            self.evidence = max(
+                0.0, self.evidence + self.log_likelihood_ratio(confidence)
+            )
+        if self.evidence == 0.0:
+            self.state, self.doubt_since = PRESENT, None
+            return self.state
+        if self.doubt_since is None:
+            self.doubt_since = now
+        decided = self.evidence >= self.config.PRESENCE_EVIDENCE
+        timed_out = now - self.doubt_since >= self.config.ABSENCE_TIMEOUT
+        self.state = ABSENT if decided and timed_out else DOUBT
+        return self.state
+
+    def decision_delay(self, interval: float) -> float:
+        """Seconds from the first faceless sample to ``absent``.
+
+        Args:
+            interval (float): Seconds between samples while in doubt
+
+        Returns:
+            float: Delay when every sample sees no face at all
+        """
+        samples = math.ceil(self.config.PRESENCE_EVIDENCE / self.max_step - 1e-9)
+        if interval > 0:
+            samples = max(
+                samples, math.ceil(self.config.ABSENCE_TIMEOUT / interval - 1e-9) + 1
+            )
+        return (max(samples, 1) - 1) * interval
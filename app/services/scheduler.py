@@ -0,0 +1,94 @@
+from app.services.presence import PresenceStateMachine, confidence_of
+from app.utils.config import Config
+
+
+class FixedSamplingScheduler:
+    """Samples every ``FRAME_SKIP``-th frame and waits ``CHECK_INTERVAL`` after it.
+
+    This is the original monitor behaviour, kept as the default.
+
+    Attributes:
+        interval (float): Seconds to wait after each analysed frame
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.interval = config.CHECK_INTERVAL
+
+    def should_sample(self, frame_count: int) -> bool:
+        """Whether the frame with the given running count should be analysed."""
+        return frame_count % self.config.FRAME_SKIP == 0
+
+    def record(self, result, doubtful: bool):
+        """Take a detection outcome into account; fixed sampling ignores it."""
+
+    def reset(self):
+        """Return to the initial sampling rate."""
+        self.interval = self.config.CHECK_INTERVAL
+
+
+class AdaptiveSamplingScheduler(FixedSamplingScheduler):
+    """Slows sampling down during stable presence and speeds up on doubt.
+
+    Every captured frame is eligible; the pace is set entirely by
+    ``interval``. Each confident detection with no absence building up
+    stretches the interval by ``SAMPLING_BACKOFF``, and any miss,
+    low-confidence hit or pending doubt about presence snaps it back to
+    ``SAMPLING_MIN_INTERVAL``.
+
+    The stretched interval is capped so that the worst case, where the user
+    leaves right after a slow sample, still locks within
+    ``SAMPLING_LOCK_BUDGET`` seconds: one long wait followed by the
+    presence state machine's decision delay at the fast rate.
+
+    Attributes:
+        min_interval (float): Interval used whenever presence is in doubt
+        max_interval (float): Longest interval allowed by the lock budget
+        decision_delay (float): Seconds the presence state machine needs to
+            confirm an absence when sampling at ``min_interval``
+    """
+
+    def __init__(self, config: Config):
+        super().__init__(config)
+        self.min_interval = config.SAMPLING_MIN_INTERVAL
+        self.decision_delay = PresenceStateMachine(config).decision_delay(
+            self.min_interval
+        )
+        budget_interval = config.SAMPLING_LOCK_BUDGET - self.decision_delay
+        self.max_interval = max(
+            self.min_interval, min(config.SAMPLING_MAX_INTERVAL, budget_interval)
+        )
+        self.interval = self.min_interval
+
+    @property
+    def worst_case_lock_delay(self) -> float:
+        """Longest time from leaving to lock implied by the current bounds."""
+        return self.max_interval + self.decision_delay
+
+    def should_sample(self, frame_count: int) -> bool:
+        return True
+
+    def record(self, result, doubtful: bool):
+        """Adjust the interval after a detection.
+
+        Args:
+            result: DetectionResult (or bool) returned by the detector
+            doubtful (bool): Whether evidence of absence is pending
+        """
+        score = confidence_of(result)
+        if result and not doubtful and score >= self.config.SAMPLING_CONFIDENCE:
+            self.interval = min(
+                self.max_interval, self.interval * self.config.SAMPLING_BACKOFF
+            )
+        else:
+            self.interval = self.min_interval
+
+    def reset(self):
+        self.interval = self.min_interval
+
+
+def create_scheduler(config: Config) -> FixedSamplingScheduler:
+    """Build the sampling scheduler selected by ``ADAPTIVE_SAMPLING``."""
+    if config.ADAPTIVE_SAMPLING:
+        return AdaptiveSamplingScheduler(config)
+    return FixedSamplingScheduler(config)
@@ -0,0 +1,340 @@
+from dataclasses import dataclass, replace
+import subprocess
+import threading
+import time
+from app.core import system as system_module
+from app.core.system import SystemController, probe_metrics
+from app.services.events import SystemEvent, SystemEventBus
+from app.utils.config import Config
+from app.utils.logger import logger
+
+TRANSITIONS = {
+    "locked": (SystemEvent.UNLOCK, SystemEvent.LOCK),
+    "sleeping": (SystemEvent.WAKE, SystemEvent.SLEEP),
+    "inactive": (SystemEvent.IDLE_END, SystemEvent.IDLE_START),
+}
+
+
+@dataclass(frozen=True)
+class SystemState:
+    """Point-in-time view of the lock, sleep and idle status.
+
+    Attributes:
+        locked (bool): Whether the screen is locked
+        sleeping (bool): Whether the system is in or entering sleep
+        idle_ns (int): Nanoseconds since the last user input
+        inactive (bool): Whether ``idle_ns`` exceeds the inactivity threshold
+        timestamp (float): ``time.monotonic()`` when the state was probed
+    """
+
+    locked: bool = False
+    sleeping: bool = False
+    idle_ns: int = 0
+    inactive: bool = False
+    timestamp: float = 0.0
+
+    @property
+    def age(self) -> float:
+        """Seconds since this snapshot was taken."""
+        return time.monotonic() - self.timestamp
+
+
+class SystemStateBackend:
+    """Source of raw system state for ``SystemStateService``.
+
+    Backends are called from the service's poller thread and may block,
+    but should bound every external call by ``timeout`` seconds.
+    """
+
+    def probe_locked(self, timeout: float) -> bool:
+        raise NotImplementedError
+
+    def probe_sleeping(self, timeout: float) -> bool:
+        raise NotImplementedError
+
+    def probe_idle_ns(self, timeout: float) -> int:
+        raise NotImplementedError
+
+    def lock_screen(self) -> bool:
+        raise NotImplementedError
+
+    def watch(self, on_change) -> bool:
+        """Register for native state-change notifications, if available.
+
+        Args:
+            on_change (callable): Called as ``on_change(field, value)`` with a
+                ``SystemState`` field name, e.g. ``("locked", True)``
+
+        Returns:
+            bool: True if native notifications were registered
+        """
+        return False
+
+    def close(self):
+        """Unregister any native notifications set up by ``watch()``."""
+
+
+class MacOSStateBackend(SystemStateBackend):
+    """Reads state from Quartz, ``pmset`` and ``ioreg`` without a shell.
+
+    Args:
+        controller (SystemController, optional): Controller used to lock the
+            screen. Defaults to a new SystemController.
+    """
+
+    def __init__(self, controller: SystemController = None):
+        self.controller = controller if controller is not None else SystemController()
+        self._observer = None
+        self._on_change = None
+
+    def probe_locked(self, timeout: float) -> bool:
+        session = system_module.Quartz.CGSessionCopyCurrentDictionary()
+        return bool(session and session.get("CGSSessionScreenIsLocked", False))
+
+    def probe_sleeping(self, timeout: float) -> bool:
+        output = self._run(["pmset", "-g", "ps"], timeout).lower()
+        return "sleep" in output
+
+    def probe_idle_ns(self, timeout: float) -> int:
+        output = self._run(["ioreg", "-c", "IOHIDSystem"], timeout)
+        for line in output.splitlines():
+            if "HIDIdleTime" in line:
+                return int(line.split()[-1])
+        raise ValueError("HIDIdleTime not reported by ioreg")
+
+    def lock_screen(self) -> bool:
+        return self.controller.lock_screen()
+
+    def watch(self, on_change) -> bool:
+        """Observe the screen lock/unlock distributed notifications.
+
+        Notifications are delivered through the application's main run loop,
+        which rumps provides; polling still covers sleep and idle state. A
+        single observer is registered however often this is called; later
+        calls only replace ``on_change``.
+        """
+        self._on_change = on_change
+        if self._observer is not None:
+            return True
+        try:
+            from Foundation import NSDistributedNotificationCenter, NSObject
+        except ImportError:
+            return False
+
+        backend = self
+
+        class LockObserver(NSObject):
+            def screenLocked_(self, notification):
+                backend._on_change("locked", True)
+
+            def screenUnlocked_(self, notification):
+                backend._on_change("locked", False)
+
+        self._observer = LockObserver.alloc().init()
+        center = NSDistributedNotificationCenter.defaultCenter()
+        center.addObserver_selector_name_object_(
+            self._observer, "screenLocked:", "com.apple.screenIsLocked", None
+        )
+        center.addObserver_selector_name_object_(
+            self._observer, "screenUnlocked:", "com.apple.screenIsUnlocked", None
+        )
+        return True
+
+    def close(self):
+        """Remove the lock observer registered by ``watch()``."""
+        if self._observer is None:
+            return
+        from Foundation import NSDistributedNotificationCenter
+
+        NSDistributedNotificationCenter.defaultCenter().removeObserver_(self._observer)
+        self._observer = None
+
+    @staticmethod
+    def _run(command: list, timeout: float) -> str:
+        return subprocess.run(
+            command, capture_output=True, text=True, timeout=timeout, check=False
+        ).stdout
+
+
+class FakeStateBackend(SystemStateBackend):
+    """In-memory backend for tests and non-macOS runs.
+
+    Attributes:
+        locked (bool): Reported lock state; set by ``lock_screen()``
+        sleeping (bool): Reported sleep state
+        idle_ns (int): Reported idle time in nanoseconds
+        lock_count (int): Number of ``lock_screen()`` calls
+    """
+
+    def __init__(self, locked=False, sleeping=False, idle_ns=0):
+        self.locked = locked
+        self.sleeping = sleeping
+        self.idle_ns = idle_ns
+        self.lock_count = 0
+        self.on_change = None
+
+    def probe_locked(self, timeout: float) -> bool:
+        return self.locked
+
+    def probe_sleeping(self, timeout: float) -> bool:
+        return self.sleeping
+
+    def probe_idle_ns(self, timeout: float) -> int:
+        return self.idle_ns
+
+    def lock_screen(self) -> bool:
+        self.locked = True
+        self.lock_count += 1
+        return True
+
+    def watch(self, on_change) -> bool:
+        self.on_change = on_change
+        return True
+
+    def close(self):
+        self.on_change = None
+
+    def notify(self, field: str, value: bool):
+        """Simulate a native notification, updating the reported state too."""
+        setattr(self, field, value)
+        if self.on_change is not None:
+            self.on_change(field, value)
+
+
+class SystemStateService:
+    """Polls system state in the background and serves cached snapshots.
+
+    A daemon thread refreshes the lock, sleep and idle status every
+    ``SYSTEM_POLL_INTERVAL`` seconds, so the monitor loop never waits on a
+    process spawn. It offers the same query methods as SystemController,
+    answered from the latest snapshot; ``snapshot.age`` tells how stale that
+    answer is. A probe that fails or times out keeps its previous value.
+
+    Every change between snapshots is published on ``events``, which makes
+    the poller the fallback adapter for backends without native
+    notifications. Backends that do have them push changes straight in.
+
+    Attributes:
+        config (Config): Application configuration
+        backend (SystemStateBackend): Source of raw state
+        events (SystemEventBus): Bus carrying lock, sleep and idle transitions
+        native (bool): Whether the backend delivers native notifications
+    """
+
+    def __init__(self, config: Config, backend: SystemStateBackend = None):
+        self.config = config
+        self.backend = backend if backend is not None else MacOSStateBackend()
+        self._snapshot = SystemState()
+        self._snapshot_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.events = SystemEventBus()
+        self.native = False
+
+    @property
+    def snapshot(self) -> SystemState:
+        """The most recent state, refreshed synchronously if none exists yet."""
+        if self._snapshot.timestamp == 0.0:
+            self.refresh()
+        return self._snapshot
+
+    def start(self):
+        """Start the background poller if it is not already running.
+
+        Nothing is probed on the calling thread; the poller takes the first
+        snapshot unless one exists already.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event = threading.Event()
+        if not self.native:
+            self.native = self.backend.watch(self._on_native_change)
+        self._thread = threading.Thread(
+            target=self._poll,
+            args=(self._stop_event,),
+            name="system-state",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def close(self):
+        """Stop the background poller and native notifications.
+
+        The poller is signalled rather than joined, so closing never waits on
+        a probe in progress; it exits once that probe returns.
+        """
+        self._stop_event.set()
+        self._thread = None
+        if self.native:
+            self.backend.close()
+            self.native = False
+
+    def _poll(self, stop_event: threading.Event):
+        if self._snapshot.timestamp == 0.0:
+            self.refresh()
+        while not stop_event.wait(self.config.SYSTEM_POLL_INTERVAL):
+            self.refresh()
+
+    def refresh(self) -> SystemState:
+        """Probe the backend now and publish a new snapshot.
+
+        Returns:
+            SystemState: The refreshed snapshot
+        """
+        previous = self._snapshot
+        locked = self._probe("screen lock", self.backend.probe_locked, previous.locked)
+        sleeping = self._probe("sleep", self.backend.probe_sleeping, previous.sleeping)
+        idle_ns = self._probe(
+            "user activity", self.backend.probe_idle_ns, previous.idle_ns
+        )
+        return self._apply(
+            locked=locked,
+            sleeping=sleeping,
+            idle_ns=idle_ns,
+            inactive=idle_ns > self.config.INACTIVITY_THRESHOLD,
+        )
+
+    def _apply(self, **changes) -> SystemState:
+        """Store a new snapshot and publish the transitions it implies."""
+        with self._snapshot_lock:
+            previous = self._snapshot
+            state = replace(previous, timestamp=time.monotonic(), **changes)
+            self._snapshot = state
+        if previous.timestamp:
+            for field, (falling, rising) in TRANSITIONS.items():
+                before, after = getattr(previous, field), getattr(state, field)
+                if before != after:
+                    self.events.publish(rising if after else falling)
+        return state
+
+    def _on_native_change(self, field: str, value: bool):
+        self._apply(**{field: value})
+
+    def _probe(self, name: str, probe, fallback):
+        seconds, errors = probe_metrics(name.replace(" ", "_"))
+        start = time.perf_counter()
+        try:
+            return probe(self.config.SYSTEM_PROBE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning(f"⚠️ Timed out checking {name} state")
+        except Exception as e:
+            logger.error(f"⚠️ Failed to check {name} state: {e}")
+        finally:
+            seconds.observe(time.perf_counter() - start)
+        errors.inc()
+        return fallback
+
+    def is_screen_locked(self) -> bool:
+        return self.snapshot.locked
+
+    def is_sleep_mode(self) -> bool:
+        return self.snapshot.sleeping
+
+    def is_user_inactive(self) -> bool:
+        return self.snapshot.inactive
+
+    def lock_screen(self) -> bool:
+        """Lock the screen through the backend and record it immediately."""
+        result = self.backend.lock_screen()
+        self._apply(locked=True)
+        return result
@@ -4,16 +4,114 @@ from dataclasses import dataclass
 @dataclass(frozen=True)
 class Config:
     # Camera settings
+    CAMERA_INDEX: int = 0
     CAMERA_WIDTH: int = 640
     CAMERA_HEIGHT: int = 480
     CAMERA_FPS: int = 30
     FRAME_SKIP: int = 3
 
+    # Multi-camera settings
+    CAMERA_INDICES: tuple = ()  # several device indices; empty uses CAMERA_INDEX
+    CAMERA_FRAME_SKIPS: tuple = ()  # per-camera FRAME_SKIP, in CAMERA_INDICES order
+    PRESENCE_FUSION: str = "any"  # any, all or majority
+    INFERENCE_WORKERS: int = 1  # shared detection threads for several cameras
+
+    # Process inference settings
+    INFERENCE_PROCESSES: int = 0  # worker processes; 0 runs inference in-process
+    INFERENCE_TASK_TIMEOUT: float = 5.0  # seconds before a worker counts as hung
+    INFERENCE_START_TIMEOUT: float = 30.0  # seconds to wait for a ready worker
+    INFERENCE_START_ATTEMPTS: int = 3  # failed starts in a row before giving up
+    INFERENCE_HEALTH_INTERVAL: float = 1.0
+
+    # Camera probing settings
+    CAMERA_PROBE: bool = False  # probe modes once and use the cheapest usable one
+    CAMERA_PROBE_CACHE: str = "~/.sentry_ai/camera_modes.json"  # per-device results
+    CAMERA_PROBE_FRAMES: int = 10  # frames timed per probed mode
+    CAMERA_MIN_FPS: float = 10.0  # slowest delivered frame rate a mode may have
+    DETECTOR_MIN_INPUT_SIZE: int = 128  # shorter side the detector needs, scaled
+
+    # Frame source settings
+    FRAME_SOURCE: str = "device"  # device, video, images or synthetic
+    SOURCE_PATH: str = ""
+    SOURCE_REALTIME: bool = True
+    SOURCE_LOOP: bool = False
+    SYNTHETIC_SEED: int = 0
+
+    # Capture settings
+    CAPTURE_THREADED: bool = False
+    CAPTURE_BUFFER_SIZE: int = 2
+    CAPTURE_FIRST_FRAME_TIMEOUT: float = 2.0
+    CAPTURE_DECODE_ON_DEMAND: bool = False  # grab() every frame, decode sampled ones
+    CAPTURE_FRAME_POOL: int = 0  # preallocated capture buffers; 0 lets OpenCV allocate
+    CAPTURE_DECODE_SCALE: float = 1.0  # 1, 0.5, 0.25 or 0.125; JPEG decoded reduced
+    CAMERA_IDLE_TIMEOUT: float = 5.0  # seconds a suspended camera stays open
+
     # Detection settings
     FACE_CONFIDENCE: float = 0.5
     MODEL_SELECTION: int = 1
-    ABSENCE_THRESHOLD: int = 5
     CHECK_INTERVAL: float = 0.1
+    DETECTOR_WARM_UP_RUNS: int = 2
+
+    # Presence settings
+    ABSENCE_TIMEOUT: float = 1.0  # seconds of doubt before absence can lock
+    PRESENCE_EVIDENCE: float = 4.0  # log-likelihood ratio that confirms absence
+    PRESENCE_NOISE: float = 0.1  # detector error floor; bounds each sample's weight
+
+    # Detector backend settings
+    DETECTOR_BACKEND: str = "mediapipe"  # mediapipe, haar, dnn, cascade or auto
+    DETECTOR_CALIBRATION_PATH: str = ""  # clip used by the auto backend
+    DETECTOR_CALIBRATION_FRAMES: int = 60
+    DETECTOR_MIN_AGREEMENT: float = 0.9  # vs MediaPipe, for the auto backend
+    HAAR_CASCADE_PATH: str = ""  # defaults to OpenCV's frontal face cascade
+    HAAR_MIN_NEIGHBORS: int = 5
+    DNN_MODEL_PATH: str = ""
+    DNN_CONFIG_PATH: str = ""
+    DNN_INPUT_SIZE: int = 300
+
+    # Detector cascade settings
+    CASCADE_FIRST_STAGE: str = "haar"
+    CASCADE_FIRST_STAGE_SCALE: float = 0.25
+    CASCADE_ACCEPT_SCORE: float = 0.9  # first-stage score that needs no second look
+    CASCADE_HISTORY: int = 3  # past decisions the first stage must agree with
+    CASCADE_VERIFY_INTERVAL: int = 10  # first-stage decisions between checks
+
+    # Preprocessing settings
+    PREPROCESS_SCALE: float = 0.5  # downscale factor before inference
+    PREPROCESS_INTERPOLATION: str = "linear"  # nearest, linear, area or cubic
+
+    # Adaptive sampling settings
+    ADAPTIVE_SAMPLING: bool = False
+    SAMPLING_MIN_INTERVAL: float = 0.1
+    SAMPLING_MAX_INTERVAL: float = 1.0
+    SAMPLING_BACKOFF: float = 1.5
+    SAMPLING_CONFIDENCE: float = 0.8
+    SAMPLING_LOCK_BUDGET: float = 1.5  # worst-case seconds from leaving to lock
+
+    # Region-of-interest settings
+    ROI_DETECTION: bool = False
+    ROI_EXPANSION: float = 2.0  # crop size relative to the last face box
+    ROI_REFRESH_INTERVAL: int = 10  # ROI detections between full-frame scans
+
+    # Motion gating settings
+    MOTION_GATING: bool = False
+    MOTION_THRESHOLD: float = 4.0  # mean grey-level difference, 0-255
+    MOTION_MAX_STALENESS: float = 1.0  # seconds
+    MOTION_THUMBNAIL_WIDTH: int = 32
 
     # System settings
     INACTIVITY_THRESHOLD: int = 30_000_000_000  # 30 seconds
+    SYSTEM_STATE_POLLING: bool = False
+    SYSTEM_POLL_INTERVAL: float = 1.0
+    SYSTEM_PROBE_TIMEOUT: float = 2.0
+
+    # Logging settings
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "plain"  # plain, logfmt or json
+    LOG_QUEUE_SIZE: int = 10_000  # records beyond this are dropped, not blocked on
+    LOG_RATE_LIMIT_WINDOW: float = 10.0  # seconds; 0 disables rate limiting
+    LOG_RATE_LIMIT_BURST: int = 3  # identical lines allowed per window
+
+    # Metrics settings
+    METRICS_PORT: int = 0  # serve Prometheus metrics on localhost; 0 disables
+    METRICS_FILE: str = ""  # periodically write Prometheus metrics here
+    METRICS_FILE_INTERVAL: float = 10.0
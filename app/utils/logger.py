@@ -1,16 +1,228 @@
+import atexit
+import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import sys
+import threading
+import time
+from app.utils.config import Config
 
 
-def setup_logger():
+class RateLimitFilter(logging.Filter):
+    """Collapses bursts of identical log lines into one line with a count.
+
+    The first ``burst`` occurrences of a message from the same call site
+    within ``window`` seconds pass through; later ones are dropped and
+    counted. If the message recurs after the window closes, that record
+    carries the count as ``record.suppressed``. Otherwise, once the window
+    has closed, a copy of the last dropped record is passed to ``emit``
+    with the count, so a storm that stops is still reported.
+
+    Args:
+        window (float): Seconds a burst allowance lasts; 0 disables limiting
+        burst (int): Occurrences let through per window
+        emit (callable, optional): Receives summary records, e.g. a handler's
+            ``emit``; without it counts are only reported on recurrence
+    """
+
+    def __init__(self, window: float, burst: int, emit=None):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.emit = emit
+        self._seen = {}
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window <= 0:
+            return True
+        key = (record.pathname, record.lineno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            started, count, suppressed, last = self._seen.get(key, (now, 0, 0, None))
+            if now - started >= self.window:
+                started, count = now, 0
+            if count < self.burst:
+                self._seen[key] = (started, count + 1, 0, None)
+                if len(self._seen) > 1024:
+                    self._prune(now)
+            else:
+                self._seen[key] = (started, count, suppressed + 1, record)
+                self._schedule(started + self.window - now)
+                return False
+        record.suppressed = suppressed
+        return True
+
+    def flush(self, force: bool = False):
+        """Report the counts of every window that closed with drops pending.
+
+        Args:
+            force (bool): Report open windows too, e.g. before shutdown
+        """
+        now = time.monotonic()
+        summaries = []
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = []
+            for key, (started, count, suppressed, last) in self._seen.items():
+                if not suppressed:
+                    continue
+                if force or now - started >= self.window:
+                    self._seen[key] = (started, count, 0, None)
+                    summary = logging.makeLogRecord(last.__dict__)
+                    summary.suppressed = suppressed
+                    summaries.append(summary)
+                else:
+                    pending.append(started + self.window - now)
+            if pending:
+                self._schedule(min(pending))
+        for summary in summaries:
+            self.emit(summary)
+
+    def _schedule(self, delay: float):
+        if self.emit is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(max(0.0, delay), self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _prune(self, now: float):
+        self._seen = {
+            key: entry
+            for key, entry in self._seen.items()
+            if now - entry[0] < self.window or entry[2]
+        }
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full.
+
+    Attributes:
+        dropped (int): Records discarded because the listener fell behind
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StderrHandler(logging.StreamHandler):
+    """StreamHandler that writes to ``sys.stderr`` as it is at emit time.
+
+    The listener thread may write after ``sys.stderr`` was replaced, e.g. by
+    a test runner's capture or at interpreter exit, and a stream bound at
+    setup would then be closed.
+    """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as plain text, logfmt or JSON.
+
+    ``plain`` keeps the bare emoji messages; ``logfmt`` and ``json`` add the
+    timestamp, level, logger and thread. A non-zero suppression count from
+    RateLimitFilter is appended in every style.
+    """
+
+    def __init__(self, style: str = "plain"):
+        if style not in ("plain", "logfmt", "json"):
+            raise ValueError(f"Unknown log format: {style}")
+        super().__init__()
+        self.style = style
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if record.exc_info:
+            message = f"{message}\n{self.formatException(record.exc_info)}"
+        suppressed = getattr(record, "suppressed", 0)
+        if self.style == "plain":
+            if suppressed:
+                message = f"{message} (suppressed {suppressed} repeats)"
+            return message
+        fields = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": message,
+        }
+        if suppressed:
+            fields["suppressed"] = suppressed
+        if self.style == "json":
+            return json.dumps(fields, ensure_ascii=False)
+        return " ".join(
+            f"{key}={_logfmt_value(value)}" for key, value in fields.items()
+        )
+
+
+def _logfmt_value(value) -> str:
+    text = str(value)
+    if not text or any(char in text for char in ' ="\n'):
+        return json.dumps(text, ensure_ascii=False)
+    return text
+
+
+def setup_logger(config: Config = None):
+    """Configure the ``sentry`` logger to write through a background thread.
+
+    Records are rate limited, then handed to a QueueHandler; a QueueListener
+    thread formats and writes them, so a failure storm on the capture path
+    never waits on stderr. Level and format come from ``LOG_LEVEL`` and
+    ``LOG_FORMAT``.
+
+    Returns:
+        logging.Logger: The configured logger; its listener is stored as
+            ``logger.listener`` and stopped at exit
+    """
+    config = config or Config()
     logger = logging.getLogger("sentry")
-    logger.setLevel(logging.INFO)
+    logger.setLevel(config.LOG_LEVEL)
+    _stop_listener(logger)  # while the old handlers are attached, to flush them
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
 
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("%(message)s")
-    handler.setFormatter(formatter)
+    stream = StderrHandler()
+    stream.setFormatter(StructuredFormatter(config.LOG_FORMAT))
+    log_queue = queue.Queue(maxsize=config.LOG_QUEUE_SIZE)
+    handler = DroppingQueueHandler(log_queue)
+    handler.addFilter(
+        RateLimitFilter(
+            config.LOG_RATE_LIMIT_WINDOW, config.LOG_RATE_LIMIT_BURST, handler.emit
+        )
+    )
     logger.addHandler(handler)
 
+    logger.listener = QueueListener(log_queue, stream)
+    logger.listener.start()
     return logger
 
 
+def _stop_listener(logger: logging.Logger):
+    """Flush and stop the logger's listener thread, if one is running."""
+    listener = getattr(logger, "listener", None)
+    if listener is not None and listener._thread is not None:
+        for handler in logger.handlers:
+            for log_filter in handler.filters:
+                if isinstance(log_filter, RateLimitFilter):
+                    log_filter.flush(force=True)
+        listener.stop()
+
+
 logger = setup_logger()
+atexit.register(_stop_listener, logger)
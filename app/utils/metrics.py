@@ -0,0 +1,230 @@
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import tempfile
+import threading
+from app.utils.logger import logger
+
+DEFAULT_BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1.0, 5.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return (
+        "{"
+        + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+        + "}"
+    )
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonically increasing count, e.g. frames captured.
+
+    Attributes:
+        value (float): Current count
+    """
+
+    kind = "counter"
+
+    def __init__(self, labels: dict):
+        self.labels = labels
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str):
+        yield name, self.labels, self.value
+
+
+class Gauge(Counter):
+    """Value that can go up and down, e.g. the current absence count."""
+
+    kind = "gauge"
+
+    def set(self, value: float):
+        self.value = value
+
+    def dec(self, amount: float = 1):
+        self.inc(-amount)
+
+
+class Histogram:
+    """Distribution of observations over fixed, cumulative buckets.
+
+    Attributes:
+        buckets (tuple): Upper bounds of the buckets, ascending
+        count (int): Number of observations
+        sum (float): Sum of all observations
+    """
+
+    kind = "histogram"
+
+    def __init__(self, labels: dict, buckets: tuple = DEFAULT_BUCKETS):
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def samples(self, name: str):
+        with self._lock:
+            counts, total, count = list(self._counts), self.sum, self.count
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += bucket_count
+            yield f"{name}_bucket", {
+                **self.labels,
+                "le": _format_value(bound),
+            }, cumulative
+        yield f"{name}_sum", self.labels, total
+        yield f"{name}_count", self.labels, count
+
+
+class MetricsRegistry:
+    """Process-wide collection of named metrics with Prometheus text export.
+
+    Metrics are created once, usually at module import, and updated on the
+    hot path with a single uncontended lock. Asking for an existing name and
+    label set returns the same metric, so modules can share series.
+    """
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, **labels) -> Counter:
+        return self._get(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str, **labels) -> Gauge:
+        return self._get(Gauge, name, help, labels)
+
+    def histogram(
+        self, name: str, help: str, buckets: tuple = DEFAULT_BUCKETS, **labels
+    ) -> Histogram:
+        return self._get(Histogram, name, help, labels, buckets)
+
+    def _get(self, kind, name: str, help: str, labels: dict, *args):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            family = self._families.setdefault(name, (kind, help, {}))
+            if family[0] is not kind:
+                raise ValueError(f"Metric {name} is already a {family[0].kind}")
+            series = family[2]
+            if key not in series:
+                series[key] = kind(labels, *args)
+            return series[key]
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            families = [
+                (name, kind, help, list(series.values()))
+                for name, (kind, help, series) in sorted(self._families.items())
+            ]
+        lines = []
+        for name, kind, help, series in families:
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {kind.kind}")
+            for metric in series:
+                for sample, labels, value in metric.samples(name):
+                    lines.append(
+                        f"{sample}{_format_labels(labels)} {_format_value(value)}"
+                    )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Atomically write the exposition text to ``path``."""
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, delete=False, suffix=".tmp"
+        ) as output:
+            output.write(self.render())
+        os.replace(output.name, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``/metrics`` on a daemon thread; port 0 picks a free port.
+
+        Returns:
+            ThreadingHTTPServer: The running server; call ``shutdown()`` to stop
+        """
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(
+            target=server.serve_forever, name="metrics-http", daemon=True
+        ).start()
+        return server
+
+
+metrics = MetricsRegistry()
+
+
+def start_exporters(config, registry: MetricsRegistry = metrics) -> list:
+    """Start the exporters enabled in ``config``.
+
+    ``METRICS_PORT`` serves the registry on localhost, and ``METRICS_FILE`` is
+    rewritten every ``METRICS_FILE_INTERVAL`` seconds.
+
+    Returns:
+        list: Callables that stop the started exporters
+    """
+    stoppers = []
+    if config.METRICS_PORT:
+        server = registry.serve(config.METRICS_PORT)
+        logger.info(
+            f"📈 Serving metrics on http://127.0.0.1:{config.METRICS_PORT}/metrics"
+        )
+        stoppers.append(server.shutdown)
+    if config.METRICS_FILE:
+        stop = threading.Event()
+
+        def write_periodically():
+            while not stop.wait(config.METRICS_FILE_INTERVAL):
+                try:
+                    registry.write(config.METRICS_FILE)
+                except OSError as e:
+                    logger.error(f"⚠️ Failed to write metrics file: {e}")
+
+        threading.Thread(
+            target=write_periodically, name="metrics-file", daemon=True
+        ).start()
+        logger.info(f"📈 Writing metrics to {config.METRICS_FILE}")
+        stoppers.append(stop.set)
+    return stoppers
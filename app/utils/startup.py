@@ -0,0 +1,58 @@
+import time
+from app import LAUNCHED
+from app.utils.logger import logger
+
+
+class StartupTimer:
+    """Records how long startup milestones take from application launch.
+
+    Each milestone is recorded once, the first time it is marked, and handed
+    to every registered hook as ``hook(name, seconds)``. The default hook
+    logs the timing.
+
+    The shared ``startup`` timer measures from ``app.LAUNCHED``, taken when
+    app.main first imports the package, before OpenCV, MediaPipe and rumps
+    are loaded; only the interpreter's own start-up precedes it.
+
+    Attributes:
+        origin (float): ``time.perf_counter()`` value milestones are measured from
+        marks (dict): Milestone name to seconds since ``origin``
+    """
+
+    def __init__(self, origin: float = None):
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.marks = {}
+        self.hooks = [self._log]
+
+    def add_hook(self, hook):
+        """Register ``hook(name, seconds)`` to be called for each new milestone."""
+        self.hooks.append(hook)
+
+    def mark(self, name: str) -> float:
+        """Record a milestone if it has not been recorded yet.
+
+        Args:
+            name (str): Milestone name, e.g. ``"menu_bar_ready"``
+
+        Returns:
+            float: Seconds from ``origin`` to the first time ``name`` was marked
+        """
+        if name in self.marks:
+            return self.marks[name]
+        elapsed = time.perf_counter() - self.origin
+        self.marks[name] = elapsed
+        for hook in self.hooks:
+            try:
+                hook(name, elapsed)
+            except Exception as e:
+                logger.error(f"⚠️ Startup timing hook failed: {e}")
+        return elapsed
+
+    @staticmethod
+    def _log(name: str, seconds: float):
+        logger.info(
+            f"⏱️ {name.replace('_', ' ').capitalize()} after {seconds * 1000:.0f} ms"
+        )
+
+
+startup = StartupTimer(origin=LAUNCHED)
@@ -0,0 +1,288 @@
+import time
+from unittest.mock import Mock, patch
+import cv2
+import numpy as np
+import pytest
+from app.core import backends
+from app.core.backends import (
+    CascadeBackend,
+    DnnBackend,
+    HaarBackend,
+    MediaPipeBackend,
+    calibrate,
+    create_backend,
+    load_calibration_frames,
+    select_backend,
+)
+from app.core.detection import DetectionResult
+from app.utils.config import Config
+
+
+def fake_backend(name, answers, cost=0.0):
+    """Build a backend answering presence from a per-frame list."""
+    backend = Mock()
+    backend.name = name
+
+    def detect(frame):
+        if cost:
+            time.sleep(cost)
+        present = answers[int(frame[0, 0, 0]) % len(answers)]
+        return (
+            DetectionResult(((0, 0, 1, 1),), (0.9,)) if present else DetectionResult()
+        )
+
+    backend.detect.side_effect = detect
+    return backend
+
+
+@pytest.fixture
+def frames():
+    """Fixture providing frames tagged with their index in the first pixel."""
+    return [np.full((8, 8, 3), index, dtype=np.uint8) for index in range(4)]
+
+
+class TestBackends:
+    """Test suite for the individual detector backends."""
+
+    def test_create_backend_defaults_to_mediapipe(self):
+        """Test MediaPipe is used unless another backend is configured."""
+        with patch("app.core.backends.mp"):
+            assert isinstance(create_backend(Config()), MediaPipeBackend)
+
+    def test_mediapipe_backend_closes_graph(self):
+        """Test closing the backend frees MediaPipe's native graph."""
+        with patch("app.core.backends.mp"):
+            backend = create_backend(Config())
+        model = backend.model
+        backend.close()
+        backend.close()
+
+        model.close.assert_called_once()
+
+    def test_create_backend_rejects_unknown_name(self):
+        """Test an unknown backend name raises a ValueError."""
+        with pytest.raises(ValueError):
+            create_backend(Config(DETECTOR_BACKEND="yolo"))
+
+    def test_haar_backend_on_blank_frame(self):
+        """Test the bundled Haar cascade loads and finds nothing in a blank frame."""
+        backend = create_backend(Config(DETECTOR_BACKEND="haar"))
+
+        assert isinstance(backend, HaarBackend)
+        assert not backend.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+        assert backend.preprocess.channels == 1
+
+    def test_haar_backend_maps_boxes(self):
+        """Test cascade hits are normalised and scored from their weights."""
+        backend = HaarBackend(Config())
+        backend.model = Mock()
+        backend.model.detectMultiScale3.return_value = (
+            np.array([[80, 60, 80, 60], [0, 0, 10, 10]]),
+            np.array([[20], [20]]),
+            np.array([[3.0], [-3.0]]),
+        )
+
+        result = backend.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert len(result.boxes) == 1
+        assert result.best_box == pytest.approx((0.25, 0.25, 0.5, 0.5))
+        assert result.best_score == pytest.approx(0.9526, abs=1e-4)
+
+    def test_dnn_backend_requires_model(self):
+        """Test the DNN backend refuses to start without model files."""
+        with pytest.raises(RuntimeError):
+            DnnBackend(Config())
+
+    def test_dnn_backend_filters_by_confidence(self):
+        """Test SSD rows below FACE_CONFIDENCE are dropped."""
+        with patch("app.core.backends.cv2.dnn.readNet") as read_net:
+            backend = DnnBackend(Config(DNN_MODEL_PATH="model.caffemodel"))
+        read_net.return_value.forward.return_value = np.array(
+            [[[[0, 1, 0.95, 0.1, 0.2, 0.3, 0.4], [0, 1, 0.2, 0.5, 0.5, 0.6, 0.6]]]]
+        )
+
+        result = backend.detect(np.zeros((300, 300, 3), dtype=np.uint8))
+
+        assert result.scores == pytest.approx((0.95,))
+        assert result.best_box == pytest.approx((0.1, 0.2, 0.3, 0.4))
+
+
+class TestAutoSelection:
+    """Test suite for latency-based backend selection."""
+
+    def test_calibrate_scores_against_reference(self, frames):
+        """Test agreement is measured against the first backend's answers."""
+        reference = fake_backend("mediapipe", [True, True, False, False])
+        candidate = fake_backend("haar", [True, False, False, False])
+
+        results = calibrate([reference, candidate], frames)
+
+        assert [r.agreement for r in results] == [1.0, 0.75]
+        assert all(r.latency >= 0 for r in results)
+
+    def test_selects_fastest_accurate_backend(self, frames):
+        """Test the cheapest backend meeting the agreement target wins."""
+        slow = fake_backend("mediapipe", [True, False], cost=0.01)
+        fast = fake_backend("haar", [True, False])
+        wrong = fake_backend("dnn", [False, True])
+        classes = {
+            backend.name: Mock(return_value=backend, **{"name": backend.name})
+            for backend in (slow, fast, wrong)
+        }
+        with patch.object(backends, "BACKENDS", classes), patch.object(
+            backends, "load_calibration_frames", return_value=frames
+        ):
+            assert select_backend(Config(DETECTOR_BACKEND="auto")) is fast
+
+        slow.close.assert_called_once()
+        wrong.close.assert_called_once()
+        fast.close.assert_not_called()
+
+    def test_cascade_is_not_calibrated(self, frames):
+        """Test auto selection never builds the cascade's duplicate models."""
+        reference = fake_backend("mediapipe", [True])
+        cascade = Mock(name="cascade")
+        classes = {"mediapipe": Mock(return_value=reference), "cascade": cascade}
+        with patch.object(backends, "BACKENDS", classes), patch.object(
+            backends, "load_calibration_frames", return_value=frames
+        ):
+            assert select_backend(Config()) is reference
+
+        cascade.assert_not_called()
+
+    def test_falls_back_to_mediapipe_without_agreement(self, frames):
+        """Test selection uses MediaPipe when no backend meets the target."""
+        reference = fake_backend("mediapipe", [True, False])
+        other = fake_backend("haar", [False, True])
+        classes = {
+            backend.name: Mock(return_value=backend) for backend in (reference, other)
+        }
+        with patch.object(backends, "BACKENDS", classes), patch.object(
+            backends, "load_calibration_frames", return_value=frames
+        ):
+            config = Config(DETECTOR_MIN_AGREEMENT=1.01)
+            assert select_backend(config) is reference
+
+        other.close.assert_called_once()
+
+    def test_unavailable_backends_are_skipped(self, frames):
+        """Test backends that fail to load do not block selection."""
+        reference = fake_backend("mediapipe", [True])
+        broken = Mock(side_effect=RuntimeError("no model"))
+        broken.name = "dnn"
+        classes = {"mediapipe": Mock(return_value=reference), "dnn": broken}
+        with patch.object(backends, "BACKENDS", classes), patch.object(
+            backends, "load_calibration_frames", return_value=frames
+        ):
+            assert select_backend(Config()) is reference
+
+    def test_without_clip_uses_mediapipe(self):
+        """Test auto mode falls back to MediaPipe when no clip is configured."""
+        with patch("app.core.backends.mp"):
+            backend = create_backend(Config(DETECTOR_BACKEND="auto"))
+        assert isinstance(backend, MediaPipeBackend)
+
+    def test_loads_calibration_images(self, tmp_path):
+        """Test calibration frames are read from an image directory."""
+        for index in range(3):
+            cv2.imwrite(str(tmp_path / f"{index}.png"), np.zeros((8, 8, 3), np.uint8))
+
+        frames = load_calibration_frames(
+            Config(
+                DETECTOR_CALIBRATION_PATH=str(tmp_path), DETECTOR_CALIBRATION_FRAMES=2
+            )
+        )
+
+        assert len(frames) == 2
+
+    def test_calibration_frames_follow_decode_scale(self, tmp_path):
+        """Test calibration frames are decoded at the capture resolution."""
+        for index in range(2):
+            cv2.imwrite(str(tmp_path / f"{index}.jpg"), np.zeros((8, 8, 3), np.uint8))
+
+        frames = load_calibration_frames(
+            Config(DETECTOR_CALIBRATION_PATH=str(tmp_path), CAPTURE_DECODE_SCALE=0.5)
+        )
+
+        assert [frame.shape for frame in frames] == [(4, 4, 3)] * 2
+
+
+@pytest.fixture
+def cascade():
+    """Fixture providing a cascade with scripted first and second stages."""
+    with patch("app.core.backends.mp"):
+        backend = CascadeBackend(
+            Config(
+                DETECTOR_BACKEND="cascade", CASCADE_HISTORY=2, CASCADE_VERIFY_INTERVAL=3
+            )
+        )
+    backend.first_stage = Mock()
+    backend.first_stage.name = "haar"
+    backend.second_stage = Mock()
+    backend.second_stage.name = "mediapipe"
+    backend.second_stage.detect.side_effect = lambda image, region: face(0.95)
+    return backend
+
+
+def face(score):
+    return DetectionResult(((0.4, 0.4, 0.6, 0.6),), (score,))
+
+
+class TestCascade:
+    """Test suite for the two-stage detector cascade."""
+
+    def run(self, cascade, first_stage_results):
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        cascade.first_stage.detect.side_effect = [
+            result() for result in first_stage_results
+        ]
+        return [cascade.detect(frame).stage for _ in first_stage_results]
+
+    def test_confident_hits_skip_second_stage_once_history_agrees(self, cascade):
+        """Test the first stage decides once recent history shows presence."""
+        stages = self.run(cascade, [lambda: face(0.99)] * 3)
+
+        assert stages == ["mediapipe", "mediapipe", "haar"]
+        assert cascade.decisions == {"haar": 1, "mediapipe": 2}
+        assert cascade.escalation_ratio == pytest.approx(2 / 3)
+
+    def test_absence_and_weak_hits_escalate(self, cascade):
+        """Test a missing or low-confidence first-stage answer goes to MediaPipe."""
+        cascade.history.extend([True, True])
+
+        stages = self.run(cascade, [DetectionResult, lambda: face(0.6)])
+
+        assert stages == ["mediapipe", "mediapipe"]
+
+    def test_disagreement_with_history_escalates(self, cascade):
+        """Test a face after recent absences is confirmed by MediaPipe."""
+        cascade.history.extend([True, False])
+
+        assert self.run(cascade, [lambda: face(0.99)]) == ["mediapipe"]
+
+    def test_periodic_verification(self, cascade):
+        """Test a long first-stage streak is interrupted by a MediaPipe check."""
+        cascade.history.extend([True, True])
+
+        stages = self.run(cascade, [lambda: face(0.99)] * 5)
+
+        assert stages == ["haar", "haar", "haar", "mediapipe", "haar"]
+
+    def test_records_stage_timings(self, cascade):
+        """Test each stage's calls and time are accumulated."""
+        self.run(cascade, [DetectionResult] * 2)
+
+        assert cascade.stage_calls == {"haar": 2, "mediapipe": 2}
+        assert all(seconds >= 0 for seconds in cascade.stage_time.values())
+
+    def test_reset_clears_history(self, cascade):
+        """Test a reset cascade distrusts the first stage again."""
+        cascade.history.extend([True, True])
+        cascade.reset()
+
+        assert self.run(cascade, [lambda: face(0.99)]) == ["mediapipe"]
+
+    def test_rejects_unknown_first_stage(self):
+        """Test the cascade cannot use itself or an unknown first stage."""
+        with pytest.raises(ValueError):
+            CascadeBackend(Config(CASCADE_FIRST_STAGE="cascade"))
@@ -0,0 +1,185 @@
+import argparse
+import dataclasses
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from app.benchmark import (
+    PipelineBenchmark,
+    StageTimer,
+    main,
+    parse_override,
+    percentile,
+)
+from app.utils.config import Config
+
+
+@pytest.fixture
+def mock_detector():
+    """Fixture replacing the face detector with one that never sees a face."""
+    with patch("app.services.monitor.FaceDetector") as mock_class:
+        detector = Mock()
+        detector.detect.return_value = False
+        detector.motion_gate = None
+        detector.preprocess = None
+        detector.detect_async = AsyncMock(
+            side_effect=lambda image: detector.detect(image)
+        )
+        mock_class.return_value = detector
+        yield detector
+
+
+@pytest.fixture
+def config():
+    """Fixture providing a fast synthetic benchmark configuration."""
+    return Config(
+        FRAME_SOURCE="synthetic",
+        SOURCE_REALTIME=False,
+        CHECK_INTERVAL=0,
+        ABSENCE_TIMEOUT=0.0,
+        CAMERA_WIDTH=64,
+        CAMERA_HEIGHT=48,
+    )
+
+
+class TestStatistics:
+    """Test suite for the latency statistics helpers."""
+
+    def test_percentile_interpolates(self):
+        """Test percentiles interpolate between samples."""
+        values = [1.0, 2.0, 3.0, 4.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([7.0], 99) == 7.0
+
+    def test_stage_timer_summary(self):
+        """Test summaries report counts and histogram buckets."""
+        timer = StageTimer()
+        timer.samples = [0.0005, 0.003, 0.004, 2.0]
+        summary = timer.summary()
+        assert summary["count"] == 4
+        assert summary["histogram_ms"]["le_1"] == 1
+        assert summary["histogram_ms"]["le_5"] == 2
+        assert summary["histogram_ms"]["le_inf"] == 1
+        assert summary["max_ms"] == pytest.approx(2000.0)
+
+    def test_stage_timer_empty(self):
+        """Test an unused stage reports a zero count."""
+        assert StageTimer().summary() == {"count": 0}
+
+    def test_stage_timer_wrap_records(self):
+        """Test wrapped callables record one sample per call."""
+        timer = StageTimer()
+        wrapped = timer.wrap(lambda value: value * 2)
+        assert wrapped(3) == 6
+        assert len(timer.samples) == 1
+
+
+class TestOverrides:
+    """Test suite for command-line config overrides."""
+
+    def test_parse_typed_values(self):
+        """Test overrides are converted to the field's type."""
+        assert parse_override(Config(), "FRAME_SKIP=1") == ("FRAME_SKIP", 1)
+        assert parse_override(Config(), "CHECK_INTERVAL=0.5") == (
+            "CHECK_INTERVAL",
+            0.5,
+        )
+        assert parse_override(Config(), "CAPTURE_THREADED=true") == (
+            "CAPTURE_THREADED",
+            True,
+        )
+
+    def test_parse_tuple_override(self):
+        """Test tuple fields are parsed as comma-separated integers."""
+        assert parse_override(Config(), "CAMERA_INDICES=0,1") == (
+            "CAMERA_INDICES",
+            (0, 1),
+        )
+        assert parse_override(Config(), "CAMERA_FRAME_SKIPS=") == (
+            "CAMERA_FRAME_SKIPS",
+            (),
+        )
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_override(Config(), "CAMERA_INDICES=0,front")
+
+    def test_parse_rejects_unknown_field(self):
+        """Test unknown fields are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_override(Config(), "NOT_A_FIELD=1")
+
+    def test_parse_rejects_invalid_value(self):
+        """Test values of the wrong type are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_override(Config(), "FRAME_SKIP=fast")
+
+
+class TestPipelineBenchmark:
+    """Test suite for the end-to-end benchmark run."""
+
+    @pytest.mark.asyncio
+    async def test_run_until_lock(self, mock_detector, config):
+        """Test an empty scene runs until the stubbed lock fires."""
+        report = await PipelineBenchmark(config, duration=5).run()
+
+        assert report["locked"] is True
+        assert report["time_to_lock_s"] is not None
+        # Two faceless samples carry PRESENCE_EVIDENCE; there is no timeout.
+        assert report["frames_sampled"] == 2
+        assert report["frames_read"] == 2 * config.FRAME_SKIP
+        assert report["stages"]["inference"]["count"] == 2
+        assert report["peak_rss_bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_decode_on_demand_reports_grab_and_decode(
+        self, mock_detector, config
+    ):
+        """Test grab and decode are timed separately when decoding on demand."""
+        config = dataclasses.replace(config, CAPTURE_DECODE_ON_DEMAND=True)
+        report = await PipelineBenchmark(config, duration=5).run()
+
+        stages = report["stages"]
+        assert stages["grab"]["count"] == report["frames_read"]
+        assert stages["decode"]["count"] == report["frames_sampled"]
+
+    @pytest.mark.asyncio
+    async def test_frame_pool_is_never_exhausted(self, mock_detector, config):
+        """Test the monitor hands every pooled frame back."""
+        config = dataclasses.replace(config, CAPTURE_FRAME_POOL=2)
+        report = await PipelineBenchmark(config, duration=5).run()
+
+        assert report["locked"] is True
+        assert report["frame_pool_misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_run_stops_at_duration(self, mock_detector, config):
+        """Test the run ends at the time limit when no lock occurs."""
+        mock_detector.detect.return_value = True
+        report = await PipelineBenchmark(config, duration=0.2).run()
+
+        assert report["locked"] is False
+        assert report["time_to_lock_s"] is None
+        assert report["frames_read"] > 0
+
+    def test_main_writes_json(self, mock_detector, tmp_path):
+        """Test the command line entry point writes a JSON report."""
+        output = tmp_path / "report.json"
+        main(
+            [
+                "--duration",
+                "5",
+                "--set",
+                "CHECK_INTERVAL=0",
+                "--set",
+                "ABSENCE_TIMEOUT=0",
+                "--set",
+                "CAMERA_WIDTH=64",
+                "--set",
+                "CAMERA_HEIGHT=48",
+                "--output",
+                str(output),
+            ]
+        )
+        report = json.loads(output.read_text())
+        assert report["config"]["FRAME_SOURCE"] == "synthetic"
+        assert report["locked"] is True
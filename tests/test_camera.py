@@ -1,10 +1,23 @@
+import threading
 import pytest
 from unittest.mock import Mock, patch, call
+import cv2
 import numpy as np
 from app.core.camera import Camera, Frame
 from app.utils.config import Config
 
 
+def device_mock(width=640, height=480, fps=30.0):
+    """Build a mocked capture device that reports the given mode."""
+    device = Mock()
+    device.get.side_effect = {
+        cv2.CAP_PROP_FRAME_WIDTH: width,
+        cv2.CAP_PROP_FRAME_HEIGHT: height,
+        cv2.CAP_PROP_FPS: fps,
+    }.get
+    return device
+
+
 @pytest.fixture
 def config():
     """Fixture providing a test configuration."""
@@ -17,7 +30,7 @@ def mock_camera():
     with patch("app.core.camera.cv2") as mock_cv2:
         camera = Camera(Config())
 
-        mock_device = Mock()
+        mock_device = device_mock()
         mock_cv2.VideoCapture.return_value = mock_device
         camera.device = mock_device
         yield camera, mock_cv2
@@ -88,6 +101,36 @@ class TestCamera:
         assert frame.image is None
         camera.device.read.assert_called_once()
 
+    def test_decode_on_demand(self):
+        """Test grab-only reads skip retrieve() and timings are split."""
+        with patch("app.core.camera.cv2"):
+            camera = Camera(Config(CAPTURE_DECODE_ON_DEMAND=True))
+        camera.device = Mock()
+        camera.device.grab.return_value = True
+        camera.device.retrieve.return_value = (True, np.zeros((4, 4, 3)))
+
+        skipped = camera.read(decode=False)
+        assert skipped.success is True
+        assert skipped.image is None
+        assert camera.grab_time is not None and camera.decode_time is None
+
+        frame = camera.read()
+        assert frame.image.shape == (4, 4, 3)
+        assert camera.decode_time is not None
+        assert camera.device.grab.call_count == 2
+        camera.device.retrieve.assert_called_once()
+        camera.device.read.assert_not_called()
+
+    def test_decode_on_demand_grab_failure(self):
+        """Test a failed grab is reported without decoding."""
+        with patch("app.core.camera.cv2"):
+            camera = Camera(Config(CAPTURE_DECODE_ON_DEMAND=True))
+        camera.device = Mock()
+        camera.device.grab.return_value = False
+
+        assert camera.read().success is False
+        camera.device.retrieve.assert_not_called()
+
     def test_read_uninitialized(self, config):
         """Test read attempt with uninitialized camera."""
         camera = Camera(config)
@@ -134,3 +177,210 @@ class TestCamera:
         frame = Frame(success=False)
         assert frame.success is False
         assert frame.image is None
+
+
+@pytest.fixture
+def threaded_camera():
+    """Fixture providing a threaded Camera instance with mocked cv2."""
+    with patch("app.core.camera.cv2") as mock_cv2:
+        camera = Camera(Config(CAPTURE_THREADED=True, CAPTURE_BUFFER_SIZE=2))
+        mock_device = device_mock()
+        mock_device.isOpened.return_value = True
+        mock_cv2.VideoCapture.return_value = mock_device
+        yield camera, mock_device
+        camera.release()
+
+
+class TestThreadedCamera:
+    """Test suite for the threaded capture mode."""
+
+    def test_start_waits_for_first_frame(self, threaded_camera):
+        """Test threaded start succeeds once the grabber delivers a frame."""
+        camera, device = threaded_camera
+        device.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert camera.start() is True
+        frame = camera.read()
+        assert frame.success is True
+        assert frame.image.shape == (480, 640, 3)
+
+    def test_start_records_first_frame_latency(self, threaded_camera):
+        """Test the grabber's first frame sets the open-to-frame latency."""
+        camera, device = threaded_camera
+        device.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+
+        assert camera.start() is True
+        assert camera.first_frame_latency is not None
+
+    def test_start_fails_when_device_yields_nothing(self, threaded_camera):
+        """Test threaded start fails when the device cannot deliver frames."""
+        camera, device = threaded_camera
+        device.read.return_value = (False, None)
+
+        assert camera.start() is False
+        device.release.assert_called_once()
+
+    def test_read_returns_newest_and_counts_dropped(self, threaded_camera):
+        """Test read returns the newest frame and counts superseded ones."""
+        camera, device = threaded_camera
+        camera.device = device
+        camera._grabber = Mock()
+        for seq in range(1, 6):
+            image = np.full((2, 2), seq, dtype=np.uint8)
+            camera._buffer.append(Frame(success=True, image=image, sequence=seq))
+        camera._captured_seq = 5
+
+        frame = camera.read()
+        assert frame.success is True
+        assert frame.image[0, 0] == 5
+        assert frame.dropped == 4
+        assert camera.dropped_frames == 4
+
+        camera._grabber = None
+
+    def test_read_repeats_latest_without_blocking(self, threaded_camera):
+        """Test read returns the last frame again when nothing new arrived."""
+        camera, device = threaded_camera
+        camera.device = device
+        camera._grabber = Mock()
+        image = np.ones((2, 2), dtype=np.uint8)
+        camera._buffer.append(Frame(success=True, image=image, sequence=1))
+
+        first = camera.read()
+        second = camera.read()
+        assert second.success is True
+        assert second.image is first.image
+        assert second.dropped == 0
+
+        camera._grabber = None
+
+    def test_read_after_grab_failure(self, threaded_camera):
+        """Test read reports failure once the grabber thread stopped."""
+        camera, device = threaded_camera
+        camera.device = device
+        camera._grabber = Mock()
+        camera._grab_failed = True
+
+        assert camera.read().success is False
+
+        camera._grabber = None
+
+    def test_release_stops_grabber(self, threaded_camera):
+        """Test release joins the grabber thread before closing the device."""
+        camera, device = threaded_camera
+        device.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+        assert camera.start() is True
+        grabber = camera._grabber
+
+        camera.release()
+        assert camera._grabber is None
+        assert not grabber.is_alive()
+        device.release.assert_called_once()
+
+    def test_release_defers_to_stuck_grabber(self, threaded_camera):
+        """Test a grabber stuck in a read releases the device when it returns."""
+        camera, device = threaded_camera
+        unblock = threading.Event()
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        def read(*args):
+            if device.read.call_count > 1:
+                unblock.wait(5)
+            return True, image
+
+        device.read.side_effect = read
+        assert camera.start() is True
+        grabber = camera._grabber
+
+        camera.release()
+        assert grabber.is_alive()
+        device.release.assert_not_called()
+        assert camera.device is None
+
+        unblock.set()
+        grabber.join(timeout=1)
+        device.release.assert_called_once()
+
+
+@pytest.fixture
+def lifecycle_camera():
+    """Fixture providing a Camera with a working mocked device."""
+    with patch("app.core.camera.cv2") as mock_cv2:
+        camera = Camera(Config(CAMERA_IDLE_TIMEOUT=60.0))
+        mock_device = device_mock()
+        mock_device.isOpened.return_value = True
+        mock_device.read.return_value = (True, np.zeros((4, 4, 3), dtype=np.uint8))
+        mock_cv2.VideoCapture.return_value = mock_device
+        yield camera, mock_cv2, mock_device
+        camera.release()
+
+
+class TestCameraLifecycle:
+    """Test suite for suspending and resuming the camera."""
+
+    def test_suspend_keeps_device_open(self, lifecycle_camera):
+        """Test suspending does not release the device."""
+        camera, _, device = lifecycle_camera
+        camera.start()
+        camera.suspend()
+
+        assert camera.suspended is True
+        device.release.assert_not_called()
+
+    def test_start_resumes_suspended_device(self, lifecycle_camera):
+        """Test starting after a suspend reuses the open device."""
+        camera, mock_cv2, device = lifecycle_camera
+        camera.start()
+        camera.suspend()
+
+        assert camera.start() is True
+        assert camera.suspended is False
+        mock_cv2.VideoCapture.assert_called_once()
+        assert device.set.call_count == 3
+
+    def test_failed_device_is_released_on_suspend(self, lifecycle_camera):
+        """Test a device that failed to read is torn down, not kept."""
+        camera, mock_cv2, device = lifecycle_camera
+        camera.start()
+        device.read.return_value = (False, None)
+        camera.read()
+        camera.suspend()
+
+        device.release.assert_called_once()
+        camera.start()
+        assert mock_cv2.VideoCapture.call_count == 2
+
+    def test_idle_timeout_releases_device(self):
+        """Test a suspended device is released after the idle timeout."""
+        with patch("app.core.camera.cv2") as mock_cv2:
+            device = device_mock()
+            device.isOpened.return_value = True
+            mock_cv2.VideoCapture.return_value = device
+            camera = Camera(Config(CAMERA_IDLE_TIMEOUT=0.01))
+            camera.start()
+            camera.suspend()
+            camera._idle_timer.join(timeout=1.0)
+
+            device.release.assert_called_once()
+            assert camera.suspended is False
+
+    def test_zero_timeout_releases_immediately(self, mock_camera):
+        """Test a zero idle timeout restores release-on-suspend."""
+        camera, _ = mock_camera
+        camera.config = Config(CAMERA_IDLE_TIMEOUT=0)
+        camera.device.isOpened.return_value = True
+
+        camera.suspend()
+        camera.device.release.assert_called_once()
+
+    def test_first_frame_latency_recorded(self, lifecycle_camera):
+        """Test the open-to-first-frame latency is measured once per open."""
+        camera, _, _ = lifecycle_camera
+        camera.start()
+        assert camera.first_frame_latency is None
+
+        camera.read()
+        latency = camera.first_frame_latency
+        assert latency is not None and latency >= 0
+        camera.read()
+        assert camera.first_frame_latency == latency
@@ -0,0 +1,157 @@
+import json
+from dataclasses import replace
+from unittest.mock import patch
+import cv2
+import numpy as np
+import pytest
+from app.core.camera import Camera
+from app.core.camera_probe import (
+    CameraMode,
+    negotiate_mode,
+    probe_modes,
+    select_mode,
+)
+from app.utils.config import Config
+
+
+class FakeDevice:
+    """Capture device that snaps requests to the nearest supported mode.
+
+    ``lies`` maps a reported resolution to the one actually delivered.
+    """
+
+    def __init__(self, supported=((320, 240), (640, 480), (1280, 720)), lies=None):
+        self.supported = supported
+        self.lies = lies or {}
+        self.size = supported[-1]
+        self.reads = 0
+
+    def set(self, prop_id, value):
+        if prop_id == cv2.CAP_PROP_FRAME_WIDTH:
+            self.size = min(self.supported, key=lambda size: abs(size[0] - value))
+        return True
+
+    def get(self, prop_id):
+        return {
+            cv2.CAP_PROP_FRAME_WIDTH: self.size[0],
+            cv2.CAP_PROP_FRAME_HEIGHT: self.size[1],
+            cv2.CAP_PROP_FPS: 30.0,
+        }.get(prop_id, 0.0)
+
+    def read(self):
+        self.reads += 1
+        width, height = self.lies.get(self.size, self.size)
+        return True, np.zeros((height, width, 3), dtype=np.uint8)
+
+    def getBackendName(self):
+        return "FAKE"
+
+    def isOpened(self):
+        return True
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Fixture providing a probing configuration with a temporary cache."""
+    return Config(
+        CAMERA_PROBE=True,
+        CAMERA_PROBE_CACHE=str(tmp_path / "modes.json"),
+        CAMERA_PROBE_FRAMES=2,
+        PREPROCESS_SCALE=0.5,
+        DETECTOR_MIN_INPUT_SIZE=128,
+    )
+
+
+class TestCameraProbe:
+    """Test suite for camera mode probing and selection."""
+
+    def test_probe_lists_each_working_mode_once(self, config):
+        """Test candidates are deduplicated by the resolution negotiated."""
+        modes = probe_modes(FakeDevice(), config)
+
+        assert [(mode.width, mode.height) for mode in modes] == [
+            (320, 240),
+            (640, 480),
+            (1280, 720),
+        ]
+        assert all(mode.fps > 0 for mode in modes)
+
+    def test_probe_drops_modes_with_wrong_frames(self, config):
+        """Test a mode whose frames do not match the reported size is skipped."""
+        device = FakeDevice(lies={(1280, 720): (1920, 1080)})
+
+        modes = probe_modes(device, config)
+
+        assert (1280, 720) not in [(mode.width, mode.height) for mode in modes]
+
+    def test_select_cheapest_mode_meeting_minimum(self, config):
+        """Test the smallest mode with enough detector input is selected."""
+        modes = [
+            CameraMode(1280, 720, 30.0),
+            CameraMode(320, 240, 30.0),
+            CameraMode(640, 480, 30.0),
+            CameraMode(640, 360, 5.0),
+        ]
+
+        assert select_mode(modes, config) == CameraMode(640, 480, 30.0)
+        assert select_mode(modes[1:2], config) is None
+
+    def test_negotiated_mode_is_cached(self, config):
+        """Test the probe runs once and later opens reuse the cached mode."""
+        first = FakeDevice()
+        mode = negotiate_mode(first, config)
+
+        assert (mode.width, mode.height) == (640, 480)
+        assert first.size == (640, 480)
+        cached = json.loads(open(config.CAMERA_PROBE_CACHE).read())
+        assert [entry["width"] for entry in cached["FAKE:0"]] == [320, 640, 1280]
+
+        second = FakeDevice()
+        assert negotiate_mode(second, config) == mode
+        assert second.reads == 0
+        assert second.size == (640, 480)
+
+    def test_missing_qualifying_mode_is_cached(self, config):
+        """Test a device with no usable mode is not probed on every start.
+
+        The cache keeps the probed modes, so relaxed settings select from it.
+        """
+        config = replace(config, DETECTOR_MIN_INPUT_SIZE=1000)
+        assert negotiate_mode(FakeDevice(), config) is None
+
+        device = FakeDevice()
+        assert negotiate_mode(device, config) is None
+        assert device.reads == 0
+
+        mode = negotiate_mode(device, replace(config, DETECTOR_MIN_INPUT_SIZE=128))
+        assert (mode.width, mode.height) == (640, 480)
+        assert device.reads == 0
+
+    def test_refused_cached_mode_probes_again(self, config):
+        """Test a cached mode the driver no longer accepts is re-probed."""
+        negotiate_mode(FakeDevice(), config)
+        device = FakeDevice(supported=((800, 600), (1280, 720)))
+
+        mode = negotiate_mode(device, config)
+
+        assert (mode.width, mode.height) == (800, 600)
+        assert device.reads > 0
+
+    def test_camera_uses_probed_mode(self, config):
+        """Test a probing camera records the selected mode."""
+        with patch("app.core.camera.cv2") as mock_cv2:
+            mock_cv2.VideoCapture.return_value = FakeDevice()
+            camera = Camera(config)
+            assert camera.start() is True
+
+        assert (camera.mode.width, camera.mode.height) == (640, 480)
+
+    def test_camera_reports_renegotiated_resolution(self, caplog):
+        """Test a driver that ignores the requested size is noticed."""
+        with patch("app.core.camera.cv2") as mock_cv2:
+            mock_cv2.VideoCapture.return_value = FakeDevice(supported=((1280, 720),))
+            camera = Camera(Config())
+            camera.start()
+
+        assert camera.mode == CameraMode(1280, 720, 30.0)
+        assert "1280x720 instead of the requested 640x480" in caplog.text
@@ -0,0 +1,85 @@
+import cv2
+import numpy as np
+import pytest
+from app.core.camera import Camera
+from app.core.decode import ReducedDecoder, is_encoded
+from app.core.frame_source import ImageSequenceSource
+from app.utils.config import Config
+
+
+@pytest.fixture
+def jpeg():
+    """Fixture providing a 64x48 frame encoded as JPEG bytes."""
+    image = np.full((48, 64, 3), 120, dtype=np.uint8)
+    return cv2.imencode(".jpg", image)[1]
+
+
+@pytest.fixture
+def jpeg_dir(tmp_path):
+    """Fixture providing a directory with two 64x48 JPEG images."""
+    for index in range(2):
+        cv2.imwrite(str(tmp_path / f"{index}.jpg"), np.zeros((48, 64, 3), np.uint8))
+    return tmp_path
+
+
+class TestReducedDecoder:
+    """Test suite for reduced-resolution capture decoding."""
+
+    def test_decodes_jpeg_at_reduced_size(self, jpeg):
+        """Test raw JPEG data is decoded straight to the configured scale."""
+        decoder = ReducedDecoder(Config(CAPTURE_DECODE_SCALE=0.25))
+
+        image = decoder(jpeg)
+
+        assert is_encoded(jpeg) and not is_encoded(image)
+        assert image.shape == (12, 16, 3)
+        assert decoder.fallbacks == 0
+
+    def test_downscales_decoded_frames_once(self):
+        """Test frames a backend already decoded are downscaled into ``dst``."""
+        decoder = ReducedDecoder(Config(CAPTURE_DECODE_SCALE=0.5))
+        dst = np.empty((24, 32, 3), dtype=np.uint8)
+
+        image = decoder(np.zeros((48, 64, 3), dtype=np.uint8), dst)
+
+        assert image is dst
+        assert decoder.fallbacks == 1
+
+    def test_invalid_data_and_scales(self):
+        """Test corrupt data yields None and unsupported scales are refused."""
+        decoder = ReducedDecoder(Config(CAPTURE_DECODE_SCALE=0.5))
+        assert decoder(np.zeros(16, dtype=np.uint8)) is None
+        with pytest.raises(ValueError):
+            ReducedDecoder(Config(CAPTURE_DECODE_SCALE=0.3))
+
+    def test_image_sequence_raw_mode(self, jpeg_dir):
+        """Test raw mode returns the undecoded file contents."""
+        source = ImageSequenceSource(Config(SOURCE_PATH=str(jpeg_dir)))
+
+        assert source.set(cv2.CAP_PROP_FORMAT, -1) is True
+        success, data = source.read()
+
+        assert success is True
+        assert is_encoded(data)
+        assert data.tobytes() == (jpeg_dir / "0.jpg").read_bytes()
+
+    def test_camera_delivers_frames_at_decode_scale(self, jpeg_dir):
+        """Test the camera hands out frames already at the reduced size."""
+        config = Config(
+            FRAME_SOURCE="images",
+            SOURCE_PATH=str(jpeg_dir),
+            SOURCE_REALTIME=False,
+            CAPTURE_DECODE_SCALE=0.5,
+            CAPTURE_FRAME_POOL=2,
+        )
+        with Camera(config) as camera:
+            assert camera.start() is True
+            frame = camera.read()
+
+        assert frame.image.shape == (24, 32, 3)
+        assert camera.pool.buffers[0].shape == (
+            config.CAMERA_HEIGHT // 2,
+            config.CAMERA_WIDTH // 2,
+            3,
+        )
+        assert camera.decoder.fallbacks == 0
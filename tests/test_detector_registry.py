@@ -0,0 +1,167 @@
+import asyncio
+from unittest.mock import Mock, patch
+import pytest
+from app.services.detector_registry import DetectorRegistry
+from app.services.monitor import SecurityMonitor
+from app.utils.config import Config
+
+
+def idle_system():
+    system = Mock()
+    system.is_screen_locked.return_value = False
+    system.is_sleep_mode.return_value = False
+    system.is_user_inactive.return_value = False
+    return system
+
+
+@pytest.fixture
+def registry():
+    return DetectorRegistry()
+
+
+@pytest.fixture
+def factory():
+    return Mock(side_effect=lambda config: Mock())
+
+
+class TestDetectorRegistry:
+    """Test suite for the process-wide detector registry."""
+
+    def test_acquire_builds_and_warms_detector(self, registry, factory):
+        """Test a new detector is warmed on creation with the configured runs."""
+        detector = registry.acquire(Config(DETECTOR_WARM_UP_RUNS=3), factory)
+
+        factory.assert_called_once()
+        detector.warm_up.assert_called_once_with(runs=3)
+
+    def test_released_detector_is_reused(self, registry, factory):
+        """Test a returned detector is reset and handed out again."""
+        config = Config()
+        first = registry.acquire(config, factory)
+        registry.release(first)
+        second = registry.acquire(config, factory)
+
+        assert second is first
+        assert factory.call_count == 1
+        first.reset.assert_called_once()
+
+    def test_detectors_are_keyed_by_config(self, registry, factory):
+        """Test a different config never receives a pooled detector."""
+        first = registry.acquire(Config(), factory)
+        registry.release(first)
+        second = registry.acquire(Config(MODEL_SELECTION=0), factory)
+
+        assert second is not first
+        assert factory.call_count == 2
+
+    def test_borrowed_detector_is_not_shared(self, registry, factory):
+        """Test concurrent borrowers each get their own detector."""
+        config = Config()
+        first = registry.acquire(config, factory)
+        second = registry.acquire(config, factory)
+
+        assert first is not second
+
+    def test_release_ignores_foreign_and_repeated_detectors(self, registry, factory):
+        """Test releasing twice or releasing an unknown detector is harmless."""
+        detector = registry.acquire(Config(), factory)
+        registry.release(detector)
+        registry.release(detector)
+        registry.release(Mock())
+
+        assert detector.reset.call_count == 1
+        assert registry.acquire(Config(), factory) is detector
+        assert registry.acquire(Config(), factory) is not detector
+
+    def test_preload_parks_detector_for_acquire(self, registry, factory):
+        """Test a preloaded detector is the one the next borrower gets."""
+        config = Config()
+        preloaded = registry.preload(config, factory).result(timeout=5)
+
+        assert registry.acquire(config, factory) is preloaded
+        assert factory.call_count == 1
+
+    def test_clear_closes_idle_detectors(self, registry, factory):
+        """Test clearing the registry shuts down pooled detectors."""
+        detector = registry.acquire(Config(), factory)
+        registry.release(detector)
+        registry.clear()
+
+        detector.close.assert_called_once()
+        assert registry.acquire(Config(), factory) is not detector
+
+
+class TestMonitorBorrowing:
+    """Test SecurityMonitor borrows detectors across restarts."""
+
+    @pytest.mark.asyncio
+    async def test_restarted_monitor_reuses_detector(self, registry):
+        """Test a stopped monitor's detector is reused by the next one."""
+        with patch("app.services.monitor.detectors", registry), patch(
+            "app.services.monitor.Camera"
+        ), patch("app.services.monitor.FaceDetector") as mock_detector:
+            config = Config()
+            first = SecurityMonitor(config, system=Mock())
+            await first.stop()
+            second = SecurityMonitor(config, system=Mock())
+
+        assert second.detector is first.detector
+        mock_detector.assert_called_once_with(config)
+        first.detector.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_monitor_borrows_preloaded_detector(self, registry):
+        """Test the detector preloaded at startup is the one the monitor gets."""
+        config = Config()
+        with patch("app.core.backends.mp"), patch(
+            "app.services.monitor.detectors", registry
+        ), patch("app.services.monitor.Camera"):
+            preloaded = registry.preload(config).result(timeout=5)
+            monitor = SecurityMonitor(config, system=Mock())
+
+            assert monitor.detector is preloaded
+            await monitor.stop()
+            assert registry.acquire(config) is preloaded
+
+    @pytest.mark.asyncio
+    async def test_detector_returns_after_loop_exits(self, registry):
+        """Test a stop during detection leaves the detector with the loop."""
+        gate = asyncio.Event()
+        detecting = asyncio.Event()
+
+        async def detect_async(image):
+            detecting.set()
+            await gate.wait()
+            return True
+
+        with patch("app.services.monitor.detectors", registry), patch(
+            "app.services.monitor.Camera"
+        ), patch("app.services.monitor.FaceDetector") as detector_class:
+            detector = detector_class.return_value
+            detector.detect_async.side_effect = detect_async
+            config = Config(CHECK_INTERVAL=0.0)
+            monitor = SecurityMonitor(config, system=idle_system())
+            task = asyncio.create_task(monitor.monitor())
+            await asyncio.wait_for(detecting.wait(), timeout=1.0)
+
+            await monitor.stop()
+            assert not registry._idle
+            detector.reset.assert_not_called()
+
+            gate.set()
+            await asyncio.wait_for(task, timeout=1.0)
+            detector.reset.assert_called_once()
+            assert registry.acquire(config, detector_class) is detector
+
+    @pytest.mark.asyncio
+    async def test_injected_detector_is_closed(self, registry):
+        """Test an explicitly passed detector is closed, not pooled."""
+        detector = Mock()
+        with patch("app.services.monitor.detectors", registry), patch(
+            "app.services.monitor.Camera"
+        ):
+            monitor = SecurityMonitor(Config(), system=Mock(), detector=detector)
+            await monitor.stop()
+
+        detector.close.assert_called_once()
+        detector.reset.assert_not_called()
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import pytest
+from app.services.events import SystemEvent, SystemEventBus
+
+
+@pytest.fixture
+def bus():
+    """Fixture providing an empty event bus."""
+    return SystemEventBus()
+
+
+class TestSystemEventBus:
+    """Test suite for the SystemEventBus class."""
+
+    @pytest.mark.asyncio
+    async def test_subscription_receives_events(self, bus):
+        """Test published events reach a subscription in order."""
+        subscription = bus.subscribe()
+        bus.publish(SystemEvent.LOCK)
+        bus.publish(SystemEvent.UNLOCK)
+
+        assert await subscription.next(timeout=1) is SystemEvent.LOCK
+        assert await subscription.next(timeout=1) is SystemEvent.UNLOCK
+
+    @pytest.mark.asyncio
+    async def test_subscription_filters_kinds(self, bus):
+        """Test a filtered subscription only sees the requested events."""
+        subscription = bus.subscribe(SystemEvent.WAKE)
+        bus.publish(SystemEvent.SLEEP)
+        bus.publish(SystemEvent.WAKE)
+
+        assert await subscription.next(timeout=1) is SystemEvent.WAKE
+
+    @pytest.mark.asyncio
+    async def test_publish_from_other_thread(self, bus):
+        """Test events published on another thread wake the waiting loop."""
+        subscription = bus.subscribe()
+        timer = threading.Timer(0.05, bus.publish, args=(SystemEvent.UNLOCK,))
+        timer.start()
+
+        event = await subscription.wait_for(SystemEvent.UNLOCK, timeout=1)
+        assert event is SystemEvent.UNLOCK
+        timer.join()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_times_out(self, bus):
+        """Test wait_for gives up after the timeout."""
+        subscription = bus.subscribe()
+        bus.publish(SystemEvent.IDLE_START)
+
+        assert await subscription.wait_for(SystemEvent.UNLOCK, timeout=0.05) is None
+
+    @pytest.mark.asyncio
+    async def test_close_ends_iteration(self, bus):
+        """Test closing from another thread ends async iteration."""
+        subscription = bus.subscribe()
+        bus.publish(SystemEvent.SLEEP)
+        threading.Timer(0.05, subscription.close).start()
+
+        events = [event async for event in subscription]
+        assert events == [SystemEvent.SLEEP]
+        bus.publish(SystemEvent.WAKE)
+        assert await subscription.next(timeout=0.05) is None
+
+    @pytest.mark.asyncio
+    async def test_asyncio_event_view(self, bus):
+        """Test an asyncio.Event can be bound to one kind of event."""
+        unlocked = bus.event(SystemEvent.UNLOCK)
+        bus.publish(SystemEvent.LOCK)
+        await asyncio.sleep(0)
+        assert not unlocked.is_set()
+
+        bus.publish(SystemEvent.UNLOCK)
+        await asyncio.wait_for(unlocked.wait(), timeout=1)
@@ -1,10 +1,22 @@
+import asyncio
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
 import numpy as np
-from app.core.face_detector import FaceDetector
+from app.core.face_detector import DetectionResult, FaceDetector
 from app.utils.config import Config
 
 
+def make_detection(xmin, ymin, width, height, score=0.9):
+    """Build a mock MediaPipe detection with a relative bounding box."""
+    detection = Mock()
+    detection.score = [score]
+    box = detection.location_data.relative_bounding_box
+    box.xmin, box.ymin, box.width, box.height = xmin, ymin, width, height
+    return detection
+
+
 @pytest.fixture
 def config():
     """Fixture providing a test configuration."""
@@ -14,7 +26,7 @@ def config():
 @pytest.fixture
 def mock_detector():
     """Fixture providing a FaceDetector instance with mocked mediapipe."""
-    with patch("app.core.face_detector.mp") as mock_mp:
+    with patch("app.core.backends.mp") as mock_mp:
         detector = FaceDetector(Config())
         yield detector, mock_mp
 
@@ -30,7 +42,7 @@ class TestFaceDetector:
             model_selection=config.MODEL_SELECTION,
         )
 
-    @patch("app.core.face_detector.cv2")
+    @patch("app.core.preprocess.cv2")
     def test_detect_face_present(self, mock_cv2, mock_detector):
         """Test face detection when a face is present."""
         detector, _ = mock_detector
@@ -39,15 +51,15 @@ class TestFaceDetector:
         mock_cv2.cvtColor.return_value = test_frame
 
         mock_detections = Mock()
-        mock_detections.detections = [Mock()]
-        detector.detector.process.return_value = mock_detections
+        mock_detections.detections = [make_detection(0.4, 0.3, 0.2, 0.3)]
+        detector.backend.model.process.return_value = mock_detections
 
-        assert detector.detect(test_frame) is True
+        assert detector.detect(test_frame).present is True
         mock_cv2.resize.assert_called_once()
         mock_cv2.cvtColor.assert_called_once()
-        detector.detector.process.assert_called_once()
+        detector.backend.model.process.assert_called_once()
 
-    @patch("app.core.face_detector.cv2")
+    @patch("app.core.preprocess.cv2")
     def test_detect_no_face(self, mock_cv2, mock_detector):
         """Test face detection when no face is present."""
         detector, _ = mock_detector
@@ -57,14 +69,14 @@ class TestFaceDetector:
 
         mock_detections = Mock()
         mock_detections.detections = None
-        detector.detector.process.return_value = mock_detections
+        detector.backend.model.process.return_value = mock_detections
 
-        assert detector.detect(test_frame) is False
+        assert detector.detect(test_frame).present is False
         mock_cv2.resize.assert_called_once()
         mock_cv2.cvtColor.assert_called_once()
-        detector.detector.process.assert_called_once()
+        detector.backend.model.process.assert_called_once()
 
-    @patch("app.core.face_detector.cv2")
+    @patch("app.core.preprocess.cv2")
     def test_detect_empty_detections(self, mock_cv2, mock_detector):
         """Test face detection with empty detections list."""
         detector, _ = mock_detector
@@ -74,14 +86,14 @@ class TestFaceDetector:
 
         mock_detections = Mock()
         mock_detections.detections = []
-        detector.detector.process.return_value = mock_detections
+        detector.backend.model.process.return_value = mock_detections
 
-        assert detector.detect(test_frame) is False
+        assert detector.detect(test_frame).present is False
         mock_cv2.resize.assert_called_once()
         mock_cv2.cvtColor.assert_called_once()
-        detector.detector.process.assert_called_once()
+        detector.backend.model.process.assert_called_once()
 
-    @patch("app.core.face_detector.cv2")
+    @patch("app.core.preprocess.cv2")
     def test_detect_image_preprocessing(self, mock_cv2, mock_detector):
         """Test image preprocessing in face detection."""
         detector, _ = mock_detector
@@ -93,12 +105,263 @@ class TestFaceDetector:
         mock_cv2.COLOR_BGR2RGB = 4
 
         mock_detections = Mock()
-        mock_detections.detections = [Mock()]
-        detector.detector.process.return_value = mock_detections
+        mock_detections.detections = [make_detection(0.4, 0.3, 0.2, 0.3)]
+        detector.backend.model.process.return_value = mock_detections
 
         detector.detect(test_frame)
 
-        mock_cv2.resize.assert_called_once_with(test_frame, (0, 0), fx=0.5, fy=0.5)
-        mock_cv2.cvtColor.assert_called_once_with(test_frame, mock_cv2.COLOR_BGR2RGB)
+        resized, rgb = detector.preprocess._views[test_frame.shape]
+        mock_cv2.resize.assert_called_once_with(
+            test_frame,
+            (320, 240),
+            dst=resized,
+            interpolation=detector.preprocess.interpolation,
+        )
+        mock_cv2.cvtColor.assert_called_once_with(
+            resized, mock_cv2.COLOR_BGR2RGB, dst=rgb
+        )
+        detector.backend.model.process.assert_called_once_with(rgb)
+
+
+class TestFaceDetectorAsync:
+    """Test suite for the asynchronous detection path."""
+
+    @pytest.mark.asyncio
+    async def test_detect_async_returns_result(self, mock_detector):
+        """Test detect_async runs detection on the worker thread."""
+        detector, _ = mock_detector
+        detector.detect = Mock(return_value=True)
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        assert await detector.detect_async(frame) is True
+        detector.detect.assert_called_once_with(frame)
+        detector.close()
+
+    @pytest.mark.asyncio
+    async def test_detect_async_coalesces_queued_frames(self, mock_detector):
+        """Test only the newest queued frame is processed behind the in-flight one."""
+        detector, _ = mock_detector
+        release = threading.Event()
+        seen = []
+
+        def slow_detect(frame):
+            release.wait(timeout=1.0)
+            seen.append(int(frame[0, 0]))
+            return bool(frame[0, 0] % 2)
+
+        detector.detect = slow_detect
+        frames = [np.full((2, 2), value, dtype=np.uint8) for value in range(4)]
+
+        tasks = [asyncio.create_task(detector.detect_async(f)) for f in frames]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert seen == [0, 3]
+        assert results == [False, True, True, True]
+        assert detector.coalesced_frames == 2
+        detector.close()
+
+    @pytest.mark.asyncio
+    async def test_detect_async_propagates_errors(self, mock_detector):
+        """Test inference errors are raised to the awaiting caller."""
+        detector, _ = mock_detector
+        detector.detect = Mock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await detector.detect_async(np.zeros((2, 2, 3), dtype=np.uint8))
+        detector.close()
+
+    @pytest.mark.asyncio
+    async def test_close_does_not_wait_for_inference(self, mock_detector):
+        """Test close returns at once and the backend closes after inference."""
+        detector, _ = mock_detector
+        started, release = threading.Event(), threading.Event()
+
+        def slow_detect(frame):
+            started.set()
+            release.wait(timeout=1.0)
+            return False
+
+        detector.detect = slow_detect
+        closed = threading.Event()
+        detector._backend.close = Mock(side_effect=closed.set)
+        task = asyncio.create_task(detector.detect_async(np.zeros((2, 2))))
+        await asyncio.to_thread(started.wait, 1.0)
+
+        start = time.perf_counter()
+        detector.close()
+        assert time.perf_counter() - start < 0.5
+        detector._backend.close.assert_not_called()
+
+        release.set()
+        assert await task is False
+        assert await asyncio.to_thread(closed.wait, 1.0)
+        detector._backend.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reset_waits_for_inference_and_drops_queue(self, mock_detector):
+        """Test reset lets the running inference finish and forgets the queue."""
+        detector, _ = mock_detector
+        started, release = threading.Event(), threading.Event()
+        finished = []
+
+        def slow_detect(frame):
+            started.set()
+            release.wait(timeout=1.0)
+            finished.append(frame)
+            return False
+
+        detector.detect = slow_detect
+        first = asyncio.create_task(detector.detect_async(np.zeros((2, 2))))
+        queued = asyncio.create_task(detector.detect_async(np.ones((2, 2))))
+        await asyncio.to_thread(started.wait, 1.0)
+        threading.Timer(0.05, release.set).start()
+
+        detector.reset()
+
+        assert len(finished) == 1
+        assert detector._inflight is None and detector._queued is None
+        detector.detect = Mock(return_value=True)
+        assert await detector.detect_async(np.zeros((2, 2))) is True
+        assert await first is False
+        queued.cancel()
+        detector.close()
+
+    def test_close_without_worker(self, mock_detector):
+        """Test close is safe before any async detection ran."""
+        detector, _ = mock_detector
+        detector.close()
+        assert detector._executor is None
+
+
+class TestFaceDetectorMotionGating:
+    """Test suite for motion-gated detection."""
+
+    def test_static_frames_skip_inference(self):
+        """Test repeated static frames run inference only once."""
+        with patch("app.core.backends.mp"):
+            detector = FaceDetector(
+                Config(MOTION_GATING=True, MOTION_MAX_STALENESS=60.0)
+            )
+        mock_detections = Mock()
+        mock_detections.detections = [make_detection(0.4, 0.3, 0.2, 0.3)]
+        detector.backend.model.process.return_value = mock_detections
+        frame = np.full((480, 640, 3), 80, dtype=np.uint8)
+
+        assert [detector.detect(frame).present for _ in range(4)] == [True] * 4
+        detector.backend.model.process.assert_called_once()
+        assert detector.motion_gate.gated_ratio == pytest.approx(0.75)
+
+    def test_gating_disabled_by_default(self, mock_detector):
+        """Test the gate is only built when enabled in the config."""
+        detector, _ = mock_detector
+        assert detector.motion_gate is None
+
+
+@pytest.fixture
+def roi_detector():
+    """Fixture providing a FaceDetector in ROI mode with mocked mediapipe."""
+    with patch("app.core.backends.mp"):
+        detector = FaceDetector(
+            Config(ROI_DETECTION=True, ROI_EXPANSION=2.0, ROI_REFRESH_INTERVAL=3)
+        )
+    yield detector
+
+
+class TestFaceDetectorROI:
+    """Test suite for region-of-interest detection."""
+
+    def test_full_scan_records_face_box(self, roi_detector):
+        """Test a full-frame hit remembers the face position."""
+        results = Mock()
+        results.detections = [
+            make_detection(0.4, 0.4, 0.2, 0.2, score=0.9),
+            make_detection(0.0, 0.0, 0.1, 0.1, score=0.3),
+        ]
+        roi_detector.backend.model.process.return_value = results
+
+        assert roi_detector.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+        assert roi_detector.last_box == pytest.approx((0.4, 0.4, 0.6, 0.6))
+        assert roi_detector.full_scans == 1
 
-        mock_cv2.cvtColor.assert_called_once_with(test_frame, mock_cv2.COLOR_BGR2RGB)
+    def test_tracked_face_uses_crop(self, roi_detector):
+        """Test the next frame only analyses the expanded crop."""
+        roi_detector.last_box = (0.4, 0.4, 0.6, 0.6)
+        results = Mock()
+        results.detections = [make_detection(0.25, 0.25, 0.5, 0.5)]
+        roi_detector.backend.model.process.return_value = results
+
+        assert roi_detector.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+        analysed = roi_detector.backend.model.process.call_args[0][0]
+        assert analysed.shape == (96, 128, 3)
+        assert roi_detector.roi_hits == 1
+        assert roi_detector.full_scans == 0
+        assert roi_detector.last_box == pytest.approx((0.4, 0.4, 0.6, 0.6))
+
+    def test_empty_crop_falls_back_to_full_scan(self, roi_detector):
+        """Test a miss in the crop triggers a full-frame scan."""
+        roi_detector.last_box = (0.4, 0.4, 0.6, 0.6)
+        empty = Mock(detections=None)
+        roi_detector.backend.model.process.return_value = empty
+
+        assert not roi_detector.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+        assert roi_detector.backend.model.process.call_count == 2
+        assert roi_detector.full_scans == 1
+        assert roi_detector.last_box is None
+
+    def test_periodic_full_refresh(self, roi_detector):
+        """Test a full-frame scan runs after the refresh interval."""
+        results = Mock()
+        results.detections = [make_detection(0.25, 0.25, 0.5, 0.5)]
+        roi_detector.backend.model.process.return_value = results
+        roi_detector.last_box = (0.4, 0.4, 0.6, 0.6)
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        for _ in range(4):
+            roi_detector.detect(frame)
+
+        assert roi_detector.roi_hits == 3
+        assert roi_detector.full_scans == 1
+
+
+class TestDetectionResult:
+    """Test suite for the DetectionResult class."""
+
+    def test_empty_result_is_falsy(self):
+        """Test a result without faces reads as absent."""
+        result = DetectionResult()
+        assert not result
+        assert result.present is False
+        assert result.best_score == 0.0
+        assert result.best_box is None
+
+    def test_from_mediapipe_maps_region(self):
+        """Test boxes found in a crop are mapped to full-frame coordinates."""
+        result = DetectionResult.from_mediapipe(
+            [
+                make_detection(0.0, 0.0, 0.5, 0.5, score=0.6),
+                make_detection(0.5, 0.5, 0.5, 0.5, score=0.8),
+            ],
+            region=(0.5, 0.5, 1.0, 1.0),
+        )
+        assert result
+        assert result.scores == (0.6, 0.8)
+        assert result.best_score == 0.8
+        assert result.best_box == pytest.approx((0.75, 0.75, 1.0, 1.0))
+
+    def test_from_mediapipe_clamps_boxes(self):
+        """Test boxes reaching outside the image are clamped."""
+        result = DetectionResult.from_mediapipe([make_detection(-0.1, 0.9, 0.3, 0.3)])
+        assert result.boxes[0] == pytest.approx((0.0, 0.9, 0.2, 1.0))
+
+    def test_no_instance_dict(self):
+        """Test results use slots rather than a per-instance dict."""
+        assert not hasattr(DetectionResult(), "__dict__")
+
+    def test_detect_records_inference_time(self, mock_detector):
+        """Test detect reports how long inference took."""
+        detector, _ = mock_detector
+        detector.backend.model.process.return_value = Mock(detections=None)
+        result = detector.detect(np.zeros((48, 64, 3), dtype=np.uint8))
+        assert result.inference_time > 0
@@ -0,0 +1,134 @@
+from unittest.mock import Mock, patch
+import cv2
+import numpy as np
+import pytest
+from app.core.camera import Camera
+from app.core.frame_pool import Frame, FramePool
+from app.utils.config import Config
+
+
+@pytest.fixture
+def pool():
+    """Fixture providing a pool of two small buffers."""
+    return FramePool(2, (4, 4, 3))
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """Fixture providing a short recorded video clip."""
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for index in range(4):
+        writer.write(np.full((24, 32, 3), index * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class TestFramePool:
+    """Test suite for the preallocated frame pool."""
+
+    def test_frame_has_slots(self):
+        """Test frames carry no per-instance dict."""
+        assert not hasattr(Frame(success=True), "__dict__")
+        Frame(success=False).release()
+
+    def test_acquire_until_exhausted(self, pool):
+        """Test every slot is handed out once and misses are counted."""
+        first, second = pool.acquire(), pool.acquire()
+
+        assert {first.index, second.index} == {0, 1}
+        assert pool.acquire() is None
+        assert pool.misses == 1
+        assert pool.in_use == 2
+
+    def test_release_returns_slot(self, pool):
+        """Test a released slot is reused with the same Frame and buffer."""
+        frame = pool.acquire()
+        pool.acquire()
+        frame.release()
+
+        assert pool.acquire() is frame
+        assert pool.buffers[frame.index] is not None
+
+    def test_retained_slot_needs_every_release(self, pool):
+        """Test a slot with two holders is freed by the second release."""
+        frame = pool.acquire()
+        pool.retain(frame)
+
+        frame.release()
+        assert pool.in_use == 1
+        frame.release()
+        assert pool.in_use == 0
+        frame.release()
+        assert pool.in_use == 0
+
+    def test_adopt_replaces_mismatched_buffer(self, pool):
+        """Test a reallocated capture becomes the slot's buffer."""
+        frame = pool.acquire()
+        image = np.zeros((8, 8, 3), dtype=np.uint8)
+
+        pool.adopt(frame, image)
+
+        assert pool.buffers[frame.index] is image
+
+    def test_camera_reuses_buffers(self, video_file):
+        """Test released frames are captured into the same buffers again."""
+        config = Config(
+            FRAME_SOURCE="video",
+            SOURCE_PATH=video_file,
+            SOURCE_REALTIME=False,
+            CAMERA_WIDTH=32,
+            CAMERA_HEIGHT=24,
+            CAPTURE_FRAME_POOL=2,
+        )
+        with Camera(config) as camera:
+            assert camera.start() is True
+            buffers = set()
+            for _ in range(3):
+                frame = camera.read()
+                assert frame.sequence > 0 and frame.timestamp > 0
+                buffers.add(id(frame.image))
+                assert any(frame.image is buffer for buffer in camera.pool.buffers)
+                frame.release()
+
+        assert len(buffers) == 1
+        assert camera.pool.misses == 0
+
+    def test_camera_falls_back_when_pool_is_empty(self, video_file):
+        """Test capture still works when the consumer holds every slot."""
+        config = Config(
+            FRAME_SOURCE="video",
+            SOURCE_PATH=video_file,
+            SOURCE_REALTIME=False,
+            CAPTURE_FRAME_POOL=1,
+        )
+        with Camera(config) as camera:
+            camera.start()
+            held = camera.read()
+            frame = camera.read()
+
+        assert held.pool is camera.pool
+        assert frame.success is True
+        assert frame.pool is None
+        assert camera.pool.misses == 1
+
+    def test_threaded_read_releases_superseded_frames(self, pool):
+        """Test the threaded camera frees frames the consumer never saw."""
+        camera = Camera(Config(CAPTURE_THREADED=True))
+        camera.device = Mock()
+        camera._grabber = Mock()
+        for sequence in (1, 2):
+            frame = pool.acquire()
+            frame.success, frame.sequence = True, sequence
+            camera._buffer.append(frame)
+
+        delivered = camera.read()
+        assert delivered.sequence == 2
+        assert pool.in_use == 1
+        delivered.release()
+        assert pool.in_use == 1
+
+        camera._grabber = None
+        with patch("app.core.camera.cv2"):
+            camera.release()
+        assert pool.in_use == 0
@@ -0,0 +1,157 @@
+import pytest
+from unittest.mock import patch
+import cv2
+import numpy as np
+from app.core.camera import Camera
+from app.core.frame_source import (
+    ImageSequenceSource,
+    Pacer,
+    SyntheticSource,
+    VideoFileSource,
+    create_frame_source,
+)
+from app.utils.config import Config
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    """Fixture providing a directory with three small images."""
+    for index in range(3):
+        image = np.full((8, 8, 3), index * 10, dtype=np.uint8)
+        cv2.imwrite(str(tmp_path / f"frame_{index:03d}.png"), image)
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """Fixture providing a short recorded video clip."""
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 24))
+    for index in range(4):
+        writer.write(np.full((24, 32, 3), index * 40, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+class TestPacer:
+    """Test suite for the Pacer helper."""
+
+    def test_unpaced_does_not_sleep(self):
+        """Test as-fast-as-possible mode never sleeps."""
+        pacer = Pacer(fps=1, realtime=False)
+        with patch("app.core.frame_source.time.sleep") as mock_sleep:
+            pacer.wait()
+            pacer.wait()
+        mock_sleep.assert_not_called()
+
+    def test_realtime_sleeps_between_frames(self):
+        """Test real-time mode waits for the next frame slot."""
+        pacer = Pacer(fps=10, realtime=True)
+        with patch("app.core.frame_source.time.sleep") as mock_sleep:
+            pacer.wait()
+            pacer.wait()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 0.1
+
+
+class TestFrameSources:
+    """Test suite for the recorded and synthetic frame sources."""
+
+    def test_synthetic_is_deterministic(self):
+        """Test two synthetic sources with the same seed agree frame by frame."""
+        config = Config(FRAME_SOURCE="synthetic", SOURCE_REALTIME=False)
+        first, second = SyntheticSource(config), SyntheticSource(config)
+        for _ in range(3):
+            ok_a, image_a = first.read()
+            ok_b, image_b = second.read()
+            assert ok_a and ok_b
+            assert image_a.shape == (config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3)
+            assert np.array_equal(image_a, image_b)
+
+    def test_synthetic_frames_change(self):
+        """Test the synthetic scene moves between frames."""
+        source = SyntheticSource(Config(SOURCE_REALTIME=False))
+        _, image_a = source.read()
+        _, image_b = source.read()
+        assert not np.array_equal(image_a, image_b)
+
+    def test_image_sequence_reads_in_order(self, image_dir):
+        """Test images are replayed in filename order and then exhausted."""
+        config = Config(SOURCE_PATH=str(image_dir), SOURCE_REALTIME=False)
+        source = ImageSequenceSource(config)
+        assert source.isOpened()
+        values = [int(source.read()[1][0, 0, 0]) for _ in range(3)]
+        assert values == [0, 10, 20]
+        assert source.read() == (False, None)
+
+    def test_image_sequence_grab_skips_decoding(self, image_dir):
+        """Test grab() advances through images without reading them."""
+        config = Config(SOURCE_PATH=str(image_dir), SOURCE_REALTIME=False)
+        source = ImageSequenceSource(config)
+        with patch("app.core.frame_source.cv2.imread", wraps=cv2.imread) as imread:
+            assert source.grab() and source.grab()
+            imread.assert_not_called()
+            success, image = source.retrieve()
+        assert success is True
+        assert image[0, 0, 0] == 10
+        imread.assert_called_once()
+
+    def test_image_sequence_loops(self, image_dir):
+        """Test looping restarts the sequence."""
+        config = Config(
+            SOURCE_PATH=str(image_dir), SOURCE_REALTIME=False, SOURCE_LOOP=True
+        )
+        source = ImageSequenceSource(config)
+        for _ in range(3):
+            source.read()
+        success, image = source.read()
+        assert success is True
+        assert image[0, 0, 0] == 0
+
+    def test_image_sequence_missing_directory(self, tmp_path):
+        """Test a missing directory yields a closed source."""
+        source = ImageSequenceSource(Config(SOURCE_PATH=str(tmp_path / "missing")))
+        assert source.isOpened() is False
+        assert source.read() == (False, None)
+
+    def test_video_file_replays_and_loops(self, video_file):
+        """Test a video file is replayed and looped."""
+        config = Config(SOURCE_PATH=video_file, SOURCE_REALTIME=False, SOURCE_LOOP=True)
+        source = VideoFileSource(config)
+        assert source.isOpened()
+        frames = [source.read() for _ in range(6)]
+        assert all(success for success, _ in frames)
+        assert frames[0][1].shape == (24, 32, 3)
+        source.release()
+        assert source.isOpened() is False
+
+    def test_video_file_grab_and_retrieve(self, video_file):
+        """Test grab() skips frames and retrieve() decodes the current one."""
+        config = Config(SOURCE_PATH=video_file, SOURCE_REALTIME=False)
+        source = VideoFileSource(config)
+        assert all(source.grab() for _ in range(4))
+        success, image = source.retrieve()
+        assert success is True
+        assert image.shape == (24, 32, 3)
+        assert source.grab() is False
+        source.release()
+
+    def test_create_frame_source_unknown(self):
+        """Test an unknown source name is rejected."""
+        with pytest.raises(ValueError):
+            create_frame_source(Config(FRAME_SOURCE="webcam2"))
+
+    def test_camera_reads_from_synthetic_source(self):
+        """Test Camera runs end to end on a synthetic source."""
+        config = Config(FRAME_SOURCE="synthetic", SOURCE_REALTIME=False)
+        with Camera(config) as camera:
+            assert camera.start() is True
+            frame = camera.read()
+            assert frame.success is True
+            assert frame.image.shape == (config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3)
+
+    def test_camera_reports_unopened_source(self, tmp_path):
+        """Test Camera start fails cleanly for a missing recording."""
+        config = Config(FRAME_SOURCE="images", SOURCE_PATH=str(tmp_path / "none"))
+        assert Camera(config).start() is False
@@ -0,0 +1,26 @@
+import pytest
+from app.services.fusion import get_fusion_rule
+
+
+class TestFusionRules:
+    """Test suite for multi-camera presence fusion."""
+
+    @pytest.mark.parametrize(
+        "rule, votes, expected",
+        [
+            ("any", [False, True], True),
+            ("any", [False, False], False),
+            ("all", [True, True], True),
+            ("all", [True, False], False),
+            ("majority", [True, True, False], True),
+            ("majority", [True, False], False),
+        ],
+    )
+    def test_rules(self, rule, votes, expected):
+        """Test each rule combines presence answers as documented."""
+        assert get_fusion_rule(rule)(votes) is expected
+
+    def test_unknown_rule(self):
+        """Test an unknown rule name raises a ValueError."""
+        with pytest.raises(ValueError):
+            get_fusion_rule("vote")
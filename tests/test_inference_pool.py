@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+import numpy as np
+import pytest
+from app.core.face_detector import FaceDetector
+from app.services.inference_pool import InferencePool
+from app.utils.config import Config
+
+
+@pytest.fixture
+def pool():
+    """Fixture providing a two-worker pool with mocked backends."""
+    with patch("app.services.inference_pool.create_backend") as create:
+        create.side_effect = lambda config: Mock(name=threading.current_thread().name)
+        pool = InferencePool(Config(), workers=2)
+        yield pool, create
+        pool.close()
+
+
+class TestInferencePool:
+    """Test suite for the shared inference worker pool."""
+
+    def test_backend_per_thread(self, pool):
+        """Test each worker thread builds one backend and then reuses it."""
+        pool, create = pool
+        backends = [
+            pool.executor.submit(lambda: pool.backend).result() for _ in range(6)
+        ]
+
+        assert len({id(backend) for backend in backends}) == create.call_count
+        assert create.call_count <= pool.workers
+
+    def test_close_closes_worker_backends(self, pool):
+        """Test closing the pool closes the backend of every worker thread."""
+        pool, create = pool
+        backends = {
+            pool.executor.submit(lambda: pool.backend).result() for _ in range(4)
+        }
+
+        pool.close()
+        pool.close()
+        pool.executor.shutdown(wait=True)
+
+        assert all(backend.close.call_count == 1 for backend in backends)
+
+    def test_close_does_not_wait_for_detection(self, pool):
+        """Test close returns at once and closes a busy backend afterwards."""
+        pool, create = pool
+        started, release = threading.Event(), threading.Event()
+
+        def detect():
+            backend = pool.backend
+            started.set()
+            release.wait(timeout=1.0)
+            return backend
+
+        running = pool.executor.submit(detect)
+        started.wait(timeout=1.0)
+
+        start = time.perf_counter()
+        pool.close()
+        assert time.perf_counter() - start < 0.5
+        backend = pool._backends[0]
+        backend.close.assert_not_called()
+
+        release.set()
+        assert running.result(timeout=1.0) is backend
+        pool.executor.shutdown(wait=True)
+        backend.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_detectors_share_workers(self, pool):
+        """Test pooled detectors run on the pool threads and keep their own state."""
+        pool, create = pool
+        with patch("app.core.face_detector.create_backend") as own_backend:
+            detectors = [FaceDetector(Config(), pool=pool) for _ in range(3)]
+        own_backend.assert_not_called()
+        threads = set()
+
+        def detect(image, region):
+            threads.add(threading.current_thread().name)
+            return Mock(best_box=None)
+
+        create.side_effect = lambda config: Mock(**{"detect.side_effect": detect})
+        frame = np.zeros((4, 4, 3), dtype=np.uint8)
+
+        await asyncio.gather(*(d.detect_async(frame) for d in detectors))
+
+        assert threads and all(name.startswith("inference") for name in threads)
+        assert create.call_count <= pool.workers
+        for detector in detectors:
+            detector.close()
+        assert not pool.executor._shutdown
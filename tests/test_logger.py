@@ -0,0 +1,141 @@
+import json
+import logging
+import queue
+import time
+from unittest.mock import patch
+import pytest
+from app.utils.logger import (
+    DroppingQueueHandler,
+    RateLimitFilter,
+    StderrHandler,
+    StructuredFormatter,
+    setup_logger,
+)
+from app.utils.config import Config
+
+
+def make_record(message="⚠️ Failed to capture frame", lineno=10):
+    return logging.LogRecord(
+        "sentry", logging.WARNING, "camera.py", lineno, message, None, None
+    )
+
+
+class TestLogger:
+    """Test suite for the rate-limited, queued logging pipeline."""
+
+    def test_rate_limit_collapses_repeats(self):
+        """Test repeats beyond the burst are dropped and counted."""
+        log_filter = RateLimitFilter(window=10.0, burst=2)
+        with patch("app.utils.logger.time.monotonic", return_value=0.0):
+            passed = [log_filter.filter(make_record()) for _ in range(5)]
+        assert passed == [True, True, False, False, False]
+
+        with patch("app.utils.logger.time.monotonic", return_value=11.0):
+            record = make_record()
+            assert log_filter.filter(record)
+        assert record.suppressed == 3
+
+    def test_rate_limit_reports_storm_that_stops(self):
+        """Test the count is emitted once the window closes without a repeat."""
+        emitted = []
+        log_filter = RateLimitFilter(window=0.05, burst=1, emit=emitted.append)
+
+        passed = [log_filter.filter(make_record()) for _ in range(4)]
+        assert passed == [True, False, False, False]
+        assert log_filter.filter(make_record("📷 Camera reopened"))
+
+        deadline = time.monotonic() + 2.0
+        while not emitted and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(emitted) == 1
+        assert emitted[0].getMessage() == "⚠️ Failed to capture frame"
+        assert emitted[0].suppressed == 3
+
+        record = make_record()
+        assert log_filter.filter(record)
+        assert record.suppressed == 0
+
+    def test_rate_limit_force_flush(self):
+        """Test pending counts are reported before the window closes on exit."""
+        emitted = []
+        log_filter = RateLimitFilter(window=60.0, burst=1, emit=emitted.append)
+        for _ in range(3):
+            log_filter.filter(make_record())
+
+        log_filter.flush(force=True)
+        log_filter.flush(force=True)
+
+        assert [record.suppressed for record in emitted] == [2]
+        assert log_filter._timer is None
+
+    def test_rate_limit_keys_on_call_site(self):
+        """Test different lines and messages are limited independently."""
+        log_filter = RateLimitFilter(window=10.0, burst=1)
+
+        assert log_filter.filter(make_record())
+        assert log_filter.filter(make_record(lineno=20))
+        assert log_filter.filter(make_record("📷 Camera reopened"))
+        assert not log_filter.filter(make_record())
+
+    def test_rate_limit_disabled(self):
+        """Test a zero window lets every record through."""
+        log_filter = RateLimitFilter(window=0, burst=1)
+
+        assert all(log_filter.filter(make_record()) for _ in range(5))
+
+    def test_queue_handler_drops_when_full(self):
+        """Test a full queue drops records instead of blocking the caller."""
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 1
+
+    @pytest.mark.parametrize("style", ["plain", "logfmt", "json"])
+    def test_formatter_reports_suppressed(self, style):
+        """Test every format carries the message and the suppression count."""
+        record = make_record()
+        record.suppressed = 4
+
+        text = StructuredFormatter(style).format(record)
+
+        if style == "json":
+            fields = json.loads(text)
+            assert fields["message"] == "⚠️ Failed to capture frame"
+            assert fields["suppressed"] == 4
+        elif style == "logfmt":
+            assert 'message="⚠️ Failed to capture frame"' in text
+            assert "level=WARNING" in text
+            assert "suppressed=4" in text
+        else:
+            assert text == "⚠️ Failed to capture frame (suppressed 4 repeats)"
+
+    def test_stderr_handler_follows_replaced_stream(self, capsys):
+        """Test records go to the current sys.stderr, not the one at setup."""
+        handler = StderrHandler()
+
+        handler.handle(make_record())
+
+        assert capsys.readouterr().err == "⚠️ Failed to capture frame\n"
+
+    def test_reconfiguring_flushes_pending_counts(self, capsys):
+        """Test counts held by the old filter are written before it is replaced."""
+        logger = setup_logger(
+            Config(LOG_RATE_LIMIT_WINDOW=60.0, LOG_RATE_LIMIT_BURST=1)
+        )
+        try:
+            for _ in range(5):
+                logger.warning("⚠️ Failed to capture frame")
+            setup_logger(Config())
+        finally:
+            setup_logger()
+
+        err = capsys.readouterr().err
+        assert "⚠️ Failed to capture frame (suppressed 4 repeats)" in err
+
+    def test_formatter_rejects_unknown_style(self):
+        """Test an unknown LOG_FORMAT fails fast."""
+        with pytest.raises(ValueError):
+            StructuredFormatter("xml")
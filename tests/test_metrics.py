@@ -0,0 +1,151 @@
+import time
+import urllib.request
+import numpy as np
+import pytest
+from app.utils.config import Config
+from app.utils.metrics import MetricsRegistry, start_exporters
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    """Test suite for the metrics registry and its exporters."""
+
+    def test_counter_and_gauge(self, registry):
+        """Test counters accumulate and gauges follow the last value."""
+        counter = registry.counter("frames_total", "Frames", result="ok")
+        gauge = registry.gauge("absence", "Absence")
+        counter.inc()
+        counter.inc(2)
+        gauge.set(5)
+        gauge.dec()
+
+        assert counter.value == 3
+        assert gauge.value == 4
+        assert registry.counter("frames_total", "Frames", result="ok") is counter
+
+    def test_histogram_buckets(self, registry):
+        """Test observations land in cumulative fixed buckets."""
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1.0"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_sum 2.65" in text
+        assert "latency_seconds_count 4" in text
+
+    def test_render_groups_label_sets(self, registry):
+        """Test series sharing a name are exported under one HELP/TYPE header."""
+        registry.counter("probes_total", "Probes", probe="sleep").inc()
+        registry.counter("probes_total", "Probes", probe='a"b').inc(2)
+
+        text = registry.render()
+
+        assert text.count("# TYPE probes_total counter") == 1
+        assert 'probes_total{probe="sleep"} 1' in text
+        assert 'probes_total{probe="a\\"b"} 2' in text
+
+    def test_conflicting_kinds_rejected(self, registry):
+        """Test a name cannot be reused for a different metric type."""
+        registry.counter("value", "Value")
+        with pytest.raises(ValueError):
+            registry.gauge("value", "Value")
+
+    def test_write_file(self, registry, tmp_path):
+        """Test the exposition text is written to a file."""
+        registry.counter("locks_total", "Locks").inc()
+        path = tmp_path / "metrics.prom"
+
+        registry.write(str(path))
+
+        assert "locks_total 1" in path.read_text()
+
+    def test_serve_on_localhost(self, registry):
+        """Test /metrics is served over HTTP."""
+        registry.counter("locks_total", "Locks").inc()
+        server = registry.serve(0)
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as reply:
+                body = reply.read().decode()
+        finally:
+            server.shutdown()
+
+        assert "locks_total 1" in body
+
+    def test_file_exporter(self, registry, tmp_path):
+        """Test the file exporter rewrites the file periodically until stopped."""
+        path = tmp_path / "metrics.prom"
+        stoppers = start_exporters(
+            Config(METRICS_FILE=str(path), METRICS_FILE_INTERVAL=0.01), registry
+        )
+        deadline = time.monotonic() + 2
+        while not path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for stop in stoppers:
+            stop()
+
+        assert path.exists()
+        assert start_exporters(Config(), registry) == []
+
+
+class TestInstrumentation:
+    """Test the pipeline stages record into the shared registry."""
+
+    def test_camera_read_is_counted(self):
+        """Test Camera.read records its latency and outcome."""
+        from app.core.camera import FRAMES_READ, READ_SECONDS, Camera
+
+        camera = Camera(
+            Config(FRAME_SOURCE="synthetic", CAMERA_WIDTH=32, CAMERA_HEIGHT=24)
+        )
+        reads, observed = FRAMES_READ.value, READ_SECONDS.count
+        try:
+            assert camera.start()
+            camera.read()
+        finally:
+            camera.release()
+
+        assert FRAMES_READ.value == reads + 1
+        assert READ_SECONDS.count == observed + 1
+
+    def test_detect_is_counted(self):
+        """Test FaceDetector.detect records inference time and outcome."""
+        from unittest.mock import Mock, patch
+        from app.core.face_detector import DETECT_SECONDS, DETECTIONS, FaceDetector
+
+        with patch("app.core.backends.mp"):
+            detector = FaceDetector(Config())
+        detector.backend.model.process.return_value = Mock(detections=None)
+        absent, observed = DETECTIONS["absent"].value, DETECT_SECONDS.count
+
+        detector.detect(np.zeros((48, 64, 3), dtype=np.uint8))
+
+        assert DETECTIONS["absent"].value == absent + 1
+        assert DETECT_SECONDS.count == observed + 1
+
+    @pytest.mark.asyncio
+    async def test_monitor_transitions_are_counted(self):
+        """Test monitor state changes update the transition metrics."""
+        from unittest.mock import Mock, patch
+        from app.services.monitor import STATE_ACTIVE, STATE_ENTRIES, SecurityMonitor
+
+        with patch("app.services.monitor.Camera"), patch(
+            "app.services.monitor.FaceDetector"
+        ):
+            monitor = SecurityMonitor(Config(), system=Mock(), detector=Mock())
+            locks = STATE_ENTRIES["absence_lock"].value
+            await monitor._handle_absence()
+            await monitor.stop()
+
+        assert STATE_ENTRIES["absence_lock"].value == locks + 1
+        assert monitor.state == "stopped"
+        assert STATE_ACTIVE["stopped"].value == 1
+        assert STATE_ACTIVE["absence_lock"].value == 0
@@ -1,9 +1,11 @@
 import pytest
 import pytest_asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import numpy as np
 import asyncio
+import threading
 from app.services.monitor import SecurityMonitor
+from app.services.system_state import SystemStateService
 from app.utils.config import Config
 from typing import AsyncGenerator
 
@@ -23,6 +25,9 @@ def mock_dependencies():
 
         mock_camera_instance = Mock()
         mock_detector_instance = Mock()
+        mock_detector_instance.detect_async = AsyncMock(
+            side_effect=lambda image: mock_detector_instance.detect(image)
+        )
         mock_system_instance = Mock()
 
         mock_camera.return_value = mock_camera_instance
@@ -54,10 +59,16 @@ class TestSecurityMonitor:
         """Test monitor initialization."""
         monitor = SecurityMonitor(config)
         assert monitor.config == config
-        assert monitor.absence_timer == 0
+        assert monitor.presence.state == "present"
         assert monitor.frame_count == 0
         assert monitor.running is True
 
+    def test_initialization_with_state_polling(self, mock_dependencies):
+        """Test state polling wraps the system controller in a cached service."""
+        monitor = SecurityMonitor(Config(SYSTEM_STATE_POLLING=True))
+        assert isinstance(monitor.system, SystemStateService)
+        assert monitor.system.backend.controller is mock_dependencies["system"]
+
     @pytest.mark.asyncio
     async def test_stop(self, monitor, mock_dependencies):
         """Test monitor stop functionality."""
@@ -131,7 +142,7 @@ class TestSecurityMonitor:
             await task
 
         mock_dependencies["detector"].detect.assert_called()
-        assert monitor.absence_timer == 0
+        assert monitor.presence.state == "present"
 
     @pytest.mark.asyncio
     async def test_monitor_absence_detection(self, monitor, mock_dependencies):
@@ -188,7 +199,7 @@ class TestSecurityMonitor:
         finally:
             await task
 
-        mock_dependencies["camera"].release.assert_called()
+        mock_dependencies["camera"].suspend.assert_called()
 
     @pytest.mark.asyncio
     async def test_monitor_user_inactivity(self, monitor, mock_dependencies):
@@ -217,3 +228,253 @@ class TestSecurityMonitor:
 
         mock_dependencies["system"].lock_screen.assert_called()
         mock_dependencies["camera"].release.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_absence_lock_waits_for_default_timeout(self, mock_dependencies):
+        """Test an empty scene locks only after ABSENCE_TIMEOUT with defaults."""
+        config = Config()
+        system = idle_system()
+        monitor = SecurityMonitor(config, system=system)
+        mock_dependencies["camera"].start.return_value = True
+        mock_dependencies["camera"].read.return_value = Mock(
+            success=True, image=np.zeros((4, 4, 3))
+        )
+        loop = asyncio.get_running_loop()
+        detections = []
+
+        def detect(image):
+            detections.append(loop.time())
+            return False
+
+        mock_dependencies["detector"].detect.side_effect = detect
+
+        await run_until_locked(monitor, system, timeout=3.0)
+        locked_at = loop.time()
+        await monitor.stop()
+
+        system.lock_screen.assert_called_once()
+        assert len(detections) > 2
+        assert locked_at - detections[0] >= config.ABSENCE_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_cameras_start_off_the_event_loop(self, mock_dependencies):
+        """Test opening and probing cameras never blocks the event loop thread."""
+        system = idle_system()
+        monitor = SecurityMonitor(Config(), system=system)
+        threads = []
+
+        def start():
+            threads.append(threading.current_thread())
+            monitor.running = False
+            return True
+
+        mock_dependencies["camera"].start.side_effect = start
+
+        await asyncio.wait_for(monitor.monitor(), timeout=1.0)
+        await monitor.stop()
+
+        assert threads and threading.main_thread() not in threads
+
+    def synthetic_monitor(self, **overrides):
+        """Build a monitor on a real synthetic camera that never sees a face."""
+        config = Config(
+            FRAME_SOURCE="synthetic",
+            CHECK_INTERVAL=0.0,
+            CAMERA_IDLE_TIMEOUT=5.0,
+            **overrides,
+        )
+        detector = Mock()
+        detector.detect_async = AsyncMock(return_value=False)
+        system = idle_system()
+        return SecurityMonitor(config, system=system, detector=detector), system
+
+    @pytest.mark.asyncio
+    async def test_lock_closes_camera(self):
+        """Test the device is closed before the screen is locked."""
+        monitor, system = self.synthetic_monitor(ABSENCE_TIMEOUT=0.0)
+        opened_at_lock = []
+
+        def lock_screen():
+            opened_at_lock.append(monitor.camera.device.isOpened())
+            monitor.running = False
+
+        system.lock_screen.side_effect = lock_screen
+
+        await asyncio.wait_for(monitor.monitor(), timeout=2.0)
+
+        assert opened_at_lock == [False]
+        assert not monitor.camera.suspended
+        await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_sleep_keeps_camera_open_for_quick_resume(self):
+        """Test monitoring resumes the suspended device after sleep."""
+        monitor, system = self.synthetic_monitor(ABSENCE_TIMEOUT=60.0)
+        system.is_sleep_mode.side_effect = [False, True, False] + [False] * 100
+        suspended = []
+
+        async def detect(image):
+            suspended.append(monitor.camera.suspended)
+            monitor.running = len(suspended) < 2
+            return False
+
+        monitor.detector.detect_async = AsyncMock(side_effect=detect)
+        with patch.object(
+            monitor.camera, "_open_device", wraps=monitor.camera._open_device
+        ) as open_device:
+            await asyncio.wait_for(monitor.monitor(), timeout=2.0)
+
+        assert system.is_sleep_mode.call_count >= 3
+        assert monitor.state == "monitoring"
+        assert suspended == [False, False]
+        open_device.assert_called_once()
+        assert monitor.camera.device.isOpened()
+        await monitor.stop()
+        assert not monitor.camera.device.isOpened()
+
+
+@pytest.fixture
+def multi_camera():
+    """Fixture providing two mocked cameras, each with its own detector."""
+    with patch("app.services.monitor.Camera") as camera_class, patch(
+        "app.services.monitor.FaceDetector"
+    ) as detector_class:
+        cameras, detectors = [], []
+
+        def build_camera(config):
+            camera = Mock()
+            camera.config = config
+            camera.start.return_value = True
+            camera.read.return_value = Mock(success=True, image=np.zeros((4, 4, 3)))
+            cameras.append(camera)
+            return camera
+
+        def build_detector(config, pool=None):
+            detector = Mock()
+            detector.pool = pool
+            detector.detect_async = AsyncMock(
+                side_effect=lambda image: detector.detect(image)
+            )
+            detectors.append(detector)
+            return detector
+
+        camera_class.side_effect = build_camera
+        detector_class.side_effect = build_detector
+        yield cameras, detectors
+
+
+async def run_until_locked(monitor, system, timeout=1.0):
+    """Run the monitor until it locks the screen or the timeout expires."""
+    system.lock_screen.side_effect = lambda: setattr(monitor, "running", False)
+
+    async def watch():
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not system.lock_screen.called:
+            if asyncio.get_running_loop().time() > deadline:
+                break
+            await asyncio.sleep(0.01)
+        monitor.running = False
+
+    await asyncio.gather(monitor.monitor(), watch())
+
+
+def idle_system():
+    system = Mock()
+    system.is_screen_locked.return_value = False
+    system.is_sleep_mode.return_value = False
+    system.is_user_inactive.return_value = False
+    return system
+
+
+class TestMultiCameraMonitor:
+    """Test suite for monitoring several cameras at once."""
+
+    def multi_config(self, **overrides):
+        return Config(
+            CAMERA_INDICES=(0, 1),
+            CAMERA_FRAME_SKIPS=(1, 2),
+            CHECK_INTERVAL=0.0,
+            ABSENCE_TIMEOUT=0.0,
+            **overrides,
+        )
+
+    @pytest.mark.asyncio
+    async def test_sources_share_one_pool(self, multi_camera):
+        """Test each camera gets its own settings and a pooled detector."""
+        cameras, detectors = multi_camera
+        monitor = SecurityMonitor(self.multi_config(), system=idle_system())
+
+        assert [camera.config.CAMERA_INDEX for camera in cameras] == [0, 1]
+        assert [camera.config.FRAME_SKIP for camera in cameras] == [1, 2]
+        assert all(detector.pool is monitor.pool for detector in detectors)
+        assert monitor.pool is not None
+        await monitor.stop()
+        assert all(camera.release.called for camera in cameras)
+
+    @pytest.mark.asyncio
+    async def test_any_rule_stays_unlocked_with_one_face(self, multi_camera):
+        """Test a face on either camera keeps the screen unlocked."""
+        cameras, detectors = multi_camera
+        system = idle_system()
+        monitor = SecurityMonitor(self.multi_config(), system=system)
+        detectors[0].detect.return_value = False
+        detectors[1].detect.return_value = True
+
+        await run_until_locked(monitor, system, timeout=0.2)
+        await monitor.stop()
+
+        system.lock_screen.assert_not_called()
+        assert cameras[0].read.call_count > cameras[1].read.call_count / 2
+        assert detectors[0].detect.call_count > detectors[1].detect.call_count
+
+    @pytest.mark.asyncio
+    async def test_all_rule_locks_when_one_camera_sees_nobody(self, multi_camera):
+        """Test the 'all' rule requires a face on every camera."""
+        _, detectors = multi_camera
+        system = idle_system()
+        monitor = SecurityMonitor(
+            self.multi_config(PRESENCE_FUSION="all"), system=system
+        )
+        detectors[0].detect.return_value = False
+        detectors[1].detect.return_value = True
+
+        await run_until_locked(monitor, system)
+        await monitor.stop()
+
+        system.lock_screen.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_camera_is_dropped(self, multi_camera):
+        """Test monitoring continues on the remaining camera after a failure."""
+        cameras, detectors = multi_camera
+        system = idle_system()
+        monitor = SecurityMonitor(self.multi_config(), system=system)
+        cameras[1].read.return_value = Mock(success=False, image=None)
+        detectors[0].detect.return_value = False
+
+        await run_until_locked(monitor, system)
+        await monitor.stop()
+
+        system.lock_screen.assert_called_once()
+        detectors[1].detect.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_only_sampled_frames_are_decoded(self, multi_camera):
+        """Test frames skipped by the schedule are read without decoding."""
+        cameras, detectors = multi_camera
+        system = idle_system()
+        monitor = SecurityMonitor(self.multi_config(), system=system)
+        for detector in detectors:
+            detector.detect.return_value = True
+
+        await run_until_locked(monitor, system, timeout=0.1)
+        await monitor.stop()
+
+        decodes = [call.kwargs["decode"] for call in cameras[1].read.call_args_list]
+        assert decodes[:4] == [False, True, False, True]
+        assert all(call.kwargs["decode"] for call in cameras[0].read.call_args_list)
+
+    def test_rejects_unknown_fusion_rule(self, multi_camera):
+        """Test an unknown fusion rule is refused at construction."""
+        with pytest.raises(ValueError):
+            SecurityMonitor(self.multi_config(PRESENCE_FUSION="vote"), system=Mock())
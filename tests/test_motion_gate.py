@@ -0,0 +1,83 @@
+import pytest
+from unittest.mock import patch
+import numpy as np
+from app.core.motion_gate import MotionGate
+from app.utils.config import Config
+
+
+@pytest.fixture
+def gate():
+    """Fixture providing a motion gate with a long staleness window."""
+    return MotionGate(Config(MOTION_GATING=True, MOTION_MAX_STALENESS=60.0))
+
+
+@pytest.fixture
+def still_frame():
+    """Fixture providing a static scene."""
+    return np.full((480, 640, 3), 100, dtype=np.uint8)
+
+
+class TestMotionGate:
+    """Test suite for the MotionGate class."""
+
+    def test_first_frame_runs_inference(self, gate, still_frame):
+        """Test the gate never answers before a result was recorded."""
+        assert gate.lookup(still_frame) == (False, None)
+        assert gate.frames_seen == 1
+        assert gate.frames_gated == 0
+
+    def test_static_scene_reuses_result(self, gate, still_frame):
+        """Test an unchanged scene reuses the previous result."""
+        gate.lookup(still_frame)
+        gate.update(True)
+
+        assert gate.lookup(still_frame.copy()) == (True, True)
+        assert gate.gated_ratio == pytest.approx(0.5)
+
+    def test_reuses_negative_result(self, gate, still_frame):
+        """Test an empty static scene keeps reporting absence."""
+        gate.lookup(still_frame)
+        gate.update(False)
+
+        assert gate.lookup(still_frame) == (True, False)
+
+    def test_motion_forces_inference(self, gate, still_frame):
+        """Test a changed scene goes back through inference."""
+        gate.lookup(still_frame)
+        gate.update(True)
+        moved = still_frame.copy()
+        moved[:, :320] = 200
+
+        assert gate.lookup(moved) == (False, None)
+
+    def test_staleness_forces_inference(self, still_frame):
+        """Test results older than the staleness limit are not reused."""
+        gate = MotionGate(Config(MOTION_GATING=True, MOTION_MAX_STALENESS=1.0))
+        with patch("app.core.motion_gate.time.monotonic", return_value=100.0):
+            gate.lookup(still_frame)
+            gate.update(True)
+        with patch("app.core.motion_gate.time.monotonic", return_value=101.5):
+            assert gate.lookup(still_frame) == (False, None)
+
+    def test_resolution_change_forces_inference(self, gate, still_frame):
+        """Test frames of a different shape are never compared."""
+        gate.lookup(still_frame)
+        gate.update(True)
+
+        assert gate.lookup(np.full((240, 640, 3), 100, dtype=np.uint8)) == (
+            False,
+            None,
+        )
+
+    def test_thumbnail_is_small_and_grey(self, gate, still_frame):
+        """Test thumbnails are downsampled single-channel images."""
+        thumbnail = gate.thumbnail(still_frame)
+        assert thumbnail.shape == (24, 32)
+
+    def test_reset(self, gate, still_frame):
+        """Test reset drops the cached result."""
+        gate.lookup(still_frame)
+        gate.update(True)
+        gate.reset()
+
+        assert gate.lookup(still_frame) == (False, None)
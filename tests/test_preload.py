@@ -0,0 +1,41 @@
+from unittest.mock import patch
+import pytest
+from app.services.preload import preload_detector
+from app.utils.config import Config
+
+
+class TestPreloadDetector:
+    """Test suite for background model loading."""
+
+    def test_future_resolves_to_warmed_detector(self):
+        """Test the future yields a detector that has been warmed up."""
+        with patch("app.core.face_detector.FaceDetector") as mock_class:
+            future = preload_detector(Config())
+            detector = future.result(timeout=5)
+
+        assert detector is mock_class.return_value
+        mock_class.assert_called_once()
+        detector.warm_up.assert_called_once()
+
+    def test_future_reports_loading_errors(self):
+        """Test a failing model load is surfaced through the future."""
+        with patch(
+            "app.core.face_detector.FaceDetector", side_effect=RuntimeError("boom")
+        ):
+            future = preload_detector(Config())
+            with pytest.raises(RuntimeError):
+                future.result(timeout=5)
+
+    def test_warm_up_runs_inference_on_blank_frame(self):
+        """Test warm_up runs the model without touching tracking state."""
+        from app.core.face_detector import FaceDetector
+
+        with patch("app.core.backends.mp"):
+            detector = FaceDetector(Config(MOTION_GATING=True))
+        detector.backend.model.process.return_value.detections = None
+
+        detector.warm_up(width=64, height=48, runs=2)
+
+        assert detector.backend.model.process.call_count == 2
+        assert detector.backend.model.process.call_args[0][0].shape == (24, 32, 3)
+        assert detector.motion_gate.frames_seen == 0
@@ -0,0 +1,100 @@
+import cv2
+import numpy as np
+import pytest
+from app.core.preprocess import Preprocessor
+from app.utils.config import Config
+
+
+@pytest.fixture
+def frame():
+    """Fixture providing a random BGR frame."""
+    return np.random.default_rng(0).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+
+
+class TestPreprocessor:
+    """Test suite for the buffer-reusing preprocessing stage."""
+
+    def test_matches_allocating_pipeline(self, frame):
+        """Test the output equals a plain resize followed by cvtColor."""
+        preprocess = Preprocessor(Config())
+        expected = cv2.cvtColor(
+            cv2.resize(frame, (0, 0), fx=0.5, fy=0.5), cv2.COLOR_BGR2RGB
+        )
+
+        np.testing.assert_array_equal(preprocess(frame), expected)
+
+    def test_steady_state_allocates_nothing(self, frame):
+        """Test repeated frames of one shape reuse the same buffer."""
+        preprocess = Preprocessor(Config())
+        first = preprocess(frame)
+        allocated = preprocess.bytes_allocated
+        second = preprocess(frame)
+
+        assert allocated == 2 * 240 * 320 * 3
+        assert preprocess.bytes_allocated == allocated
+        assert preprocess.last_allocated == 0
+        assert np.shares_memory(first, second)
+        assert preprocess.bytes_per_frame == allocated / 2
+
+    def test_smaller_inputs_reuse_arena(self, frame):
+        """Test crops no larger than a previous frame allocate nothing."""
+        preprocess = Preprocessor(Config())
+        preprocess(frame)
+        allocated = preprocess.bytes_allocated
+
+        crop = preprocess(frame[100:300, 200:400])
+
+        assert crop.shape == (100, 100, 3)
+        assert preprocess.bytes_allocated == allocated
+
+    def test_configurable_scale_and_interpolation(self, frame):
+        """Test the downscale factor and interpolation come from the config."""
+        preprocess = Preprocessor(
+            Config(PREPROCESS_SCALE=0.25, PREPROCESS_INTERPOLATION="area")
+        )
+        expected = cv2.cvtColor(
+            cv2.resize(frame, (160, 120), interpolation=cv2.INTER_AREA),
+            cv2.COLOR_BGR2RGB,
+        )
+
+        np.testing.assert_array_equal(preprocess(frame), expected)
+
+    def test_full_scale_skips_resize(self, frame):
+        """Test a scale of 1.0 only converts colour, with a single buffer."""
+        preprocess = Preprocessor(Config(PREPROCESS_SCALE=1.0))
+
+        np.testing.assert_array_equal(
+            preprocess(frame), cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        )
+        assert preprocess.bytes_allocated == frame.nbytes
+
+    def test_reduced_capture_is_not_resized_again(self, frame):
+        """Test frames decoded at inference scale are only colour converted."""
+        preprocess = Preprocessor(
+            Config(CAPTURE_DECODE_SCALE=0.5, PREPROCESS_SCALE=0.5)
+        )
+        half = frame[:240, :320]
+
+        assert preprocess.scale == 1.0
+        np.testing.assert_array_equal(
+            preprocess(half), cv2.cvtColor(half, cv2.COLOR_BGR2RGB)
+        )
+        with pytest.raises(ValueError):
+            Preprocessor(Config(CAPTURE_DECODE_SCALE=0.25, PREPROCESS_SCALE=0.5))
+
+    def test_rejects_invalid_settings(self):
+        """Test unknown interpolation names and scales are refused."""
+        with pytest.raises(ValueError):
+            Preprocessor(Config(PREPROCESS_INTERPOLATION="lanczos"))
+        with pytest.raises(ValueError):
+            Preprocessor(Config(PREPROCESS_SCALE=0.0))
+
+    def test_greyscale_conversion(self, frame):
+        """Test a greyscale stage writes a single-channel buffer."""
+        preprocess = Preprocessor(Config(), cv2.COLOR_BGR2GRAY)
+        expected = cv2.cvtColor(
+            cv2.resize(frame, (0, 0), fx=0.5, fy=0.5), cv2.COLOR_BGR2GRAY
+        )
+
+        np.testing.assert_array_equal(preprocess(frame), expected)
+        assert preprocess.channels == 1
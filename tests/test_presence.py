@@ -0,0 +1,111 @@
+import pytest
+from app.core.face_detector import DetectionResult
+from app.services.presence import (
+    ABSENT,
+    DOUBT,
+    PRESENT,
+    PresenceStateMachine,
+    confidence_of,
+)
+from app.utils.config import Config
+
+
+@pytest.fixture
+def config():
+    """Fixture providing a presence configuration with round numbers."""
+    return Config(
+        ABSENCE_TIMEOUT=1.0,
+        PRESENCE_EVIDENCE=4.0,
+        PRESENCE_NOISE=0.1,
+        FACE_CONFIDENCE=0.5,
+    )
+
+
+@pytest.fixture
+def presence(config):
+    return PresenceStateMachine(config)
+
+
+class TestPresenceStateMachine:
+    """Test suite for the time-based presence decision."""
+
+    def test_confidence_of(self):
+        """Test detection results give their best score, plain answers 1 or 0."""
+        result = DetectionResult(boxes=((0, 0, 1, 1),) * 2, scores=(0.6, 0.9))
+        assert confidence_of(result) == pytest.approx(0.9)
+        assert confidence_of(DetectionResult()) == 0.0
+        assert confidence_of(True) == 1.0
+        assert confidence_of(False) == 0.0
+
+    def test_absence_waits_for_timeout(self, presence):
+        """Test strong evidence still waits ABSENCE_TIMEOUT seconds of doubt."""
+        assert presence.update(0.0, now=10.0) == DOUBT
+        assert presence.update(0.0, now=10.5) == DOUBT
+        assert presence.evidence >= 4.0
+        assert presence.update(0.0, now=11.0) == ABSENT
+
+    def test_sparse_strong_samples_decide(self, presence):
+        """Test two faceless samples a timeout apart are enough to lock."""
+        presence.update(0.0, now=0.0)
+        assert presence.update(0.0, now=1.0) == ABSENT
+
+    def test_weak_faces_need_more_evidence(self, presence):
+        """Test unsure detections add less evidence than empty frames."""
+        assert presence.log_likelihood_ratio(0.3) < presence.max_step
+        states = [presence.update(0.3, now=float(second)) for second in range(7)]
+        assert states[:5] == [DOUBT] * 5
+        assert states[-1] == ABSENT
+
+    def test_confident_face_settles_presence(self, presence):
+        """Test one confident face clears all pending doubt."""
+        presence.update(0.0, now=0.0)
+        presence.update(0.0, now=0.9)
+
+        assert presence.update(0.95, now=1.0) == PRESENT
+        assert presence.evidence == 0.0
+        assert presence.doubt_since is None
+        assert presence.update(0.0, now=1.1) == DOUBT
+
+    def test_accepted_face_settles_presence(self, presence):
+        """Test a face just above FACE_CONFIDENCE clears doubt like a strong one."""
+        presence.update(0.0, now=0.0)
+
+        assert presence.update(0.55, now=0.5) == PRESENT
+        assert presence.doubt_since is None
+        assert presence.update(0.0, now=2.0) == DOUBT
+
+    def test_sparse_misses_among_unsure_faces_stay_present(self, presence):
+        """Test isolated empty frames between mid-confidence faces never lock."""
+        states = []
+        for sample in range(101):
+            confidence = 0.0 if sample in (10, 60) else 0.5 + sample % 3 * 0.01
+            states.append(presence.update(confidence, now=sample * 0.2))
+
+        assert ABSENT not in states
+        assert states[-1] == PRESENT
+
+    def test_default_timeout_delays_lock(self):
+        """Test default settings lock only after ABSENCE_TIMEOUT of empty frames."""
+        presence = PresenceStateMachine(Config())
+        timeout = Config().ABSENCE_TIMEOUT
+        states = {
+            step * 0.1: presence.update(0.0, now=step * 0.1) for step in range(20)
+        }
+
+        locked = min(now for now, state in states.items() if state == ABSENT)
+        assert timeout > 0
+        assert locked == pytest.approx(timeout)
+        assert all(state == DOUBT for now, state in states.items() if now < locked)
+
+    def test_decision_delay(self, presence):
+        """Test the delay covers the timeout at the sampling interval."""
+        assert presence.decision_delay(0.1) == pytest.approx(1.0)
+        assert presence.decision_delay(2.0) == pytest.approx(2.0)
+        assert presence.decision_delay(0.0) == 0.0
+
+    def test_reset(self, presence):
+        """Test reset returns to presence."""
+        presence.update(0.0, now=0.0)
+        presence.reset()
+        assert presence.state == PRESENT
+        assert presence.evidence == 0.0
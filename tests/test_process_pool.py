@@ -0,0 +1,96 @@
+import os
+import signal
+import time
+from dataclasses import replace
+import numpy as np
+import pytest
+from app.core.backends import create_backend
+from app.core.face_detector import FaceDetector
+from app.core.process_pool import (
+    ProcessBackend,
+    ProcessInferencePool,
+    WorkerFailure,
+)
+from app.utils.config import Config
+
+
+@pytest.fixture
+def config():
+    """Fixture providing a config with a cheap backend in worker processes."""
+    return Config(
+        DETECTOR_BACKEND="haar",
+        INFERENCE_PROCESSES=1,
+        CAMERA_WIDTH=64,
+        CAMERA_HEIGHT=48,
+        INFERENCE_HEALTH_INTERVAL=0.1,
+    )
+
+
+@pytest.fixture
+def pool(config):
+    """Fixture providing a running single-worker process pool."""
+    pool = ProcessInferencePool(config, workers=1)
+    yield pool
+    pool.close()
+
+
+class TestProcessInferencePool:
+    """Test suite for out-of-process inference."""
+
+    def test_create_backend_uses_processes(self, config):
+        """Test INFERENCE_PROCESSES swaps in the process backend."""
+        assert isinstance(create_backend(config), ProcessBackend)
+
+    def test_detects_through_shared_memory(self, pool):
+        """Test a frame round-trips through a worker process."""
+        result = pool.detect(np.zeros((48, 64, 3), dtype=np.uint8))
+
+        assert not result
+        assert pool._ring.slot_size == 48 * 64 * 3
+
+    def test_accepts_crops_and_larger_frames(self, pool):
+        """Test non-contiguous crops and oversized frames are handled."""
+        frame = np.zeros((96, 128, 3), dtype=np.uint8)
+
+        assert not pool.detect(frame[10:50, 20:80], region=(0.1, 0.1, 0.6, 0.5))
+        assert not pool.detect(frame)
+        assert pool._ring.slot_size == frame.nbytes
+
+    def test_restarts_crashed_worker(self, pool):
+        """Test a killed worker is replaced and detection keeps working."""
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        pool.detect(frame)
+        os.kill(pool._workers[0].process.pid, signal.SIGKILL)
+
+        deadline = time.monotonic() + 5
+        while not pool.restarts and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert pool.restarts == 1
+        assert not pool.detect(frame)
+
+    def test_gives_up_on_workers_that_cannot_start(self, config):
+        """Test a backend failing in the worker surfaces instead of looping."""
+        config = replace(config, DETECTOR_BACKEND="missing", INFERENCE_START_ATTEMPTS=2)
+        pool = ProcessInferencePool(config, workers=1)
+        try:
+            started = time.monotonic()
+            with pytest.raises(WorkerFailure, match="Unknown detector backend"):
+                pool.detect(np.zeros((48, 64, 3), dtype=np.uint8))
+
+            assert time.monotonic() - started < config.INFERENCE_START_TIMEOUT
+            assert pool._workers[0].start_failures == 2
+            time.sleep(0.3)
+            assert pool.restarts == 1
+        finally:
+            pool.close()
+
+    def test_face_detector_over_processes(self, config):
+        """Test FaceDetector runs unchanged on top of the process backend."""
+        detector = FaceDetector(config)
+        try:
+            assert not detector.detect(np.zeros((48, 64, 3), dtype=np.uint8))
+            assert detector.preprocess is None
+        finally:
+            detector.close()
+        assert detector.backend.pool is None
@@ -0,0 +1,113 @@
+import pytest
+from app.core.face_detector import DetectionResult
+from app.services.scheduler import (
+    AdaptiveSamplingScheduler,
+    FixedSamplingScheduler,
+    create_scheduler,
+)
+from app.utils.config import Config
+
+CONFIDENT = DetectionResult(boxes=((0.4, 0.4, 0.6, 0.6),), scores=(0.95,))
+DOUBTFUL = DetectionResult(boxes=((0.4, 0.4, 0.6, 0.6),), scores=(0.55,))
+MISS = DetectionResult()
+
+
+@pytest.fixture
+def config():
+    """Fixture providing an adaptive sampling configuration."""
+    return Config(
+        ADAPTIVE_SAMPLING=True,
+        SAMPLING_MIN_INTERVAL=0.1,
+        SAMPLING_MAX_INTERVAL=1.0,
+        SAMPLING_BACKOFF=2.0,
+        SAMPLING_CONFIDENCE=0.8,
+        SAMPLING_LOCK_BUDGET=5.0,
+        ABSENCE_TIMEOUT=0.4,
+    )
+
+
+class TestFixedSamplingScheduler:
+    """Test suite for the fixed-rate scheduler."""
+
+    def test_samples_every_frame_skip(self):
+        """Test only every FRAME_SKIP-th frame is analysed."""
+        scheduler = FixedSamplingScheduler(Config(FRAME_SKIP=3))
+        assert [scheduler.should_sample(n) for n in range(1, 7)] == [
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+        ]
+
+    def test_interval_is_constant(self):
+        """Test detection outcomes never change the interval."""
+        scheduler = FixedSamplingScheduler(Config(CHECK_INTERVAL=0.2))
+        scheduler.record(CONFIDENT, 0)
+        scheduler.record(MISS, 1)
+        assert scheduler.interval == 0.2
+
+    def test_default_is_fixed(self):
+        """Test adaptive sampling is opt-in."""
+        assert type(create_scheduler(Config())) is FixedSamplingScheduler
+
+
+class TestAdaptiveSamplingScheduler:
+    """Test suite for the adaptive scheduler."""
+
+    def test_factory_selects_adaptive(self, config):
+        """Test the config flag selects the adaptive scheduler."""
+        assert isinstance(create_scheduler(config), AdaptiveSamplingScheduler)
+
+    def test_samples_every_frame(self, config):
+        """Test pacing is controlled by time rather than frame skipping."""
+        scheduler = AdaptiveSamplingScheduler(config)
+        assert all(scheduler.should_sample(n) for n in range(1, 5))
+
+    def test_confident_presence_backs_off_to_max(self, config):
+        """Test stable presence stretches the interval up to the maximum."""
+        scheduler = AdaptiveSamplingScheduler(config)
+        intervals = []
+        for _ in range(6):
+            scheduler.record(CONFIDENT, 0)
+            intervals.append(scheduler.interval)
+        assert intervals == pytest.approx([0.2, 0.4, 0.8, 1.0, 1.0, 1.0])
+
+    @pytest.mark.parametrize("result, absence", [(MISS, 1), (DOUBTFUL, 0)])
+    def test_doubt_snaps_back(self, config, result, absence):
+        """Test a miss or a low-confidence hit returns to fast sampling."""
+        scheduler = AdaptiveSamplingScheduler(config)
+        for _ in range(4):
+            scheduler.record(CONFIDENT, 0)
+        scheduler.record(result, absence)
+        assert scheduler.interval == pytest.approx(0.1)
+
+    def test_boolean_results_are_accepted(self, config):
+        """Test plain booleans count as fully confident hits or misses."""
+        scheduler = AdaptiveSamplingScheduler(config)
+        scheduler.record(True, 0)
+        assert scheduler.interval == pytest.approx(0.2)
+        scheduler.record(False, 1)
+        assert scheduler.interval == pytest.approx(0.1)
+
+    def test_lock_budget_caps_interval(self):
+        """Test the maximum interval respects the worst-case lock budget."""
+        scheduler = AdaptiveSamplingScheduler(
+            Config(
+                ADAPTIVE_SAMPLING=True,
+                SAMPLING_MIN_INTERVAL=0.1,
+                SAMPLING_MAX_INTERVAL=5.0,
+                SAMPLING_LOCK_BUDGET=1.5,
+                ABSENCE_TIMEOUT=0.4,
+            )
+        )
+        assert scheduler.max_interval == pytest.approx(1.1)
+        assert scheduler.worst_case_lock_delay == pytest.approx(1.5)
+
+    def test_reset(self, config):
+        """Test reset returns to the fastest rate."""
+        scheduler = AdaptiveSamplingScheduler(config)
+        scheduler.record(CONFIDENT, 0)
+        scheduler.reset()
+        assert scheduler.interval == pytest.approx(0.1)
@@ -0,0 +1,43 @@
+from unittest.mock import Mock
+from app import LAUNCHED
+from app.utils.startup import StartupTimer, startup
+
+
+class TestStartupTimer:
+    """Test suite for the StartupTimer class."""
+
+    def test_mark_records_once(self):
+        """Test a milestone keeps its first timing."""
+        timer = StartupTimer()
+        first = timer.mark("menu_bar_ready")
+        assert first >= 0
+        assert timer.mark("menu_bar_ready") == first
+        assert timer.marks == {"menu_bar_ready": first}
+
+    def test_hooks_receive_new_milestones(self):
+        """Test hooks are called once per milestone."""
+        timer = StartupTimer()
+        hook = Mock()
+        timer.add_hook(hook)
+
+        timer.mark("first_detection")
+        timer.mark("first_detection")
+
+        hook.assert_called_once()
+        assert hook.call_args[0][0] == "first_detection"
+
+    def test_failing_hook_does_not_break_startup(self):
+        """Test a broken hook is logged rather than raised."""
+        timer = StartupTimer()
+        timer.add_hook(Mock(side_effect=RuntimeError("boom")))
+        assert timer.mark("models_ready") >= 0
+
+    def test_origin_is_configurable(self):
+        """Test milestones are measured from the given origin."""
+        timer = StartupTimer(origin=0.0)
+        assert timer.mark("menu_bar_ready") > 0
+
+    def test_shared_timer_starts_at_package_import(self):
+        """Test the shared timer counts from the first import of the package."""
+        assert startup.origin == LAUNCHED
+        assert startup.origin <= StartupTimer().origin
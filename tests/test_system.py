@@ -98,3 +98,19 @@ class TestSystemController:
 
         assert SystemController.is_user_inactive() is False
         mock_os.popen.assert_called_once_with("ioreg -c IOHIDSystem | grep HIDIdleTime")
+
+    @patch("app.core.system.os")
+    def test_probes_record_metrics(self, mock_os):
+        """Test probes record their duration and failures."""
+        from app.core.system import LOCK_ACTIONS, probe_metrics
+
+        seconds, errors = probe_metrics("sleep")
+        observed, failed, locks = seconds.count, errors.value, LOCK_ACTIONS.value
+        mock_os.popen.side_effect = Exception("Test error")
+
+        SystemController.is_sleep_mode()
+        SystemController.lock_screen()
+
+        assert seconds.count == observed + 1
+        assert errors.value == failed + 1
+        assert LOCK_ACTIONS.value == locks + 1
@@ -0,0 +1,323 @@
+import asyncio
+import subprocess
+import threading
+import time
+import types
+import pytest
+from unittest.mock import Mock, patch
+from app.services.events import SystemEvent
+from app.services.monitor import SecurityMonitor
+from app.services.system_state import (
+    FakeStateBackend,
+    MacOSStateBackend,
+    SystemState,
+    SystemStateService,
+)
+from app.utils.config import Config
+
+
+@pytest.fixture
+def config():
+    """Fixture providing a fast-polling configuration."""
+    return Config(SYSTEM_POLL_INTERVAL=0.01, SYSTEM_PROBE_TIMEOUT=0.5)
+
+
+@pytest.fixture
+def backend():
+    """Fixture providing an in-memory state backend."""
+    return FakeStateBackend()
+
+
+@pytest.fixture
+def service(config, backend):
+    """Fixture providing a state service over the fake backend."""
+    service = SystemStateService(config, backend)
+    yield service
+    service.close()
+
+
+class TestSystemStateService:
+    """Test suite for the SystemStateService class."""
+
+    def test_snapshot_reflects_backend(self, service, backend):
+        """Test the first snapshot is probed on demand."""
+        backend.sleeping = True
+        backend.idle_ns = 31_000_000_000
+
+        snapshot = service.snapshot
+        assert snapshot.sleeping is True
+        assert snapshot.inactive is True
+        assert snapshot.locked is False
+        assert snapshot.age >= 0
+
+    def test_queries_are_served_from_cache(self, service, backend):
+        """Test queries do not re-probe between refreshes."""
+        service.refresh()
+        backend.locked = True
+
+        assert service.is_screen_locked() is False
+        service.refresh()
+        assert service.is_screen_locked() is True
+
+    def test_inactivity_threshold_from_config(self, backend):
+        """Test idle time is compared against the configured threshold."""
+        service = SystemStateService(Config(INACTIVITY_THRESHOLD=1_000), backend)
+        backend.idle_ns = 2_000
+        assert service.is_user_inactive() is True
+
+    def test_background_poller_refreshes(self, service, backend):
+        """Test the poller thread picks up state changes on its own."""
+        service.start()
+        backend.sleeping = True
+        for _ in range(100):
+            if service.is_sleep_mode():
+                break
+            service._stop_event.wait(0.01)
+        assert service.is_sleep_mode() is True
+
+    def test_close_stops_poller(self, service):
+        """Test the poller thread exits once close signals it."""
+        service.start()
+        thread = service._thread
+        service.close()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+
+    def test_start_and_close_do_not_wait_on_probes(self, service, backend):
+        """Test probes run on the poller thread and close does not join it."""
+        probed = threading.Event()
+        release = threading.Event()
+        threads = []
+
+        def slow_probe(timeout):
+            threads.append(threading.current_thread())
+            probed.set()
+            release.wait(5)
+            return False
+
+        backend.probe_sleeping = slow_probe
+        service.start()
+        assert probed.wait(1)
+        thread = service._thread
+        service.close()
+
+        assert threads == [thread]
+        assert thread.is_alive()
+        release.set()
+        thread.join(timeout=1)
+        assert not thread.is_alive()
+        assert service.snapshot.timestamp > 0
+
+    def test_failed_probe_keeps_previous_value(self, service, backend):
+        """Test a failing probe keeps the last known value."""
+        backend.sleeping = True
+        service.refresh()
+        backend.probe_sleeping = Mock(side_effect=RuntimeError("boom"))
+
+        assert service.refresh().sleeping is True
+
+    def test_timed_out_probe_keeps_previous_value(self, service, backend):
+        """Test a timed out probe keeps the last known value."""
+        backend.idle_ns = 5
+        service.refresh()
+        backend.probe_idle_ns = Mock(side_effect=subprocess.TimeoutExpired("ioreg", 1))
+
+        assert service.refresh().idle_ns == 5
+
+    def test_lock_screen_updates_snapshot(self, service, backend):
+        """Test locking is reflected before the next poll."""
+        service.refresh()
+        assert service.lock_screen() is True
+        assert backend.lock_count == 1
+        assert service.is_screen_locked() is True
+
+    def test_default_snapshot_is_stale(self):
+        """Test an unprobed snapshot reports its age from time zero."""
+        assert SystemState().age > 0
+
+
+class TestMacOSStateBackend:
+    """Test suite for the macOS backend."""
+
+    @patch("app.services.system_state.subprocess.run")
+    def test_probe_sleeping(self, mock_run):
+        """Test pmset output is parsed without a shell."""
+        mock_run.return_value.stdout = "Now drawing from 'AC Power'\nSleeping"
+        assert MacOSStateBackend(Mock()).probe_sleeping(1.0) is True
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["pmset", "-g", "ps"]
+        assert kwargs["timeout"] == 1.0
+
+    @patch("app.services.system_state.subprocess.run")
+    def test_probe_idle_ns(self, mock_run):
+        """Test HIDIdleTime is extracted from ioreg output."""
+        mock_run.return_value.stdout = (
+            '  | |   "HIDIdleTime" = 1234567\n  | |   "Other" = 1\n'
+        )
+        assert MacOSStateBackend(Mock()).probe_idle_ns(1.0) == 1234567
+
+    @patch("app.services.system_state.subprocess.run")
+    def test_probe_idle_ns_missing(self, mock_run):
+        """Test missing idle time is reported as an error."""
+        mock_run.return_value.stdout = ""
+        with pytest.raises(ValueError):
+            MacOSStateBackend(Mock()).probe_idle_ns(1.0)
+
+    @patch("app.core.system.Quartz")
+    def test_probe_locked(self, mock_quartz):
+        """Test the Quartz session dictionary is read in-process."""
+        mock_quartz.CGSessionCopyCurrentDictionary.return_value = {
+            "CGSSessionScreenIsLocked": True
+        }
+        assert MacOSStateBackend(Mock()).probe_locked(1.0) is True
+
+    def test_lock_screen_delegates(self):
+        """Test locking goes through the system controller."""
+        controller = Mock()
+        controller.lock_screen.return_value = True
+        assert MacOSStateBackend(controller).lock_screen() is True
+        controller.lock_screen.assert_called_once()
+
+    def test_watch_registers_one_observer(self, foundation):
+        """Test repeated watches share an observer that close removes."""
+        center = foundation.NSDistributedNotificationCenter.defaultCenter()
+        backend = MacOSStateBackend(Mock())
+        first, second = Mock(), Mock()
+        assert backend._observer is None
+
+        assert backend.watch(first) is True
+        observer = backend._observer
+        assert backend.watch(second) is True
+        assert center.addObserver_selector_name_object_.call_count == 2
+        observer.screenLocked_(None)
+        first.assert_not_called()
+        second.assert_called_once_with("locked", True)
+
+        backend.close()
+        center.removeObserver_.assert_called_once_with(observer)
+        assert backend._observer is None
+        backend.watch(first)
+        assert center.addObserver_selector_name_object_.call_count == 4
+
+    def test_service_restart_keeps_one_observer(self, config, foundation):
+        """Test a stop/start cycle does not duplicate lock notifications."""
+        center = foundation.NSDistributedNotificationCenter.defaultCenter()
+        backend = MacOSStateBackend(Mock())
+        backend.probe_locked = Mock(return_value=False)
+        backend.probe_sleeping = Mock(return_value=False)
+        backend.probe_idle_ns = Mock(return_value=0)
+        service = SystemStateService(config, backend)
+
+        service.start()
+        service.close()
+        service.start()
+        service.close()
+
+        assert center.addObserver_selector_name_object_.call_count == 4
+        assert center.removeObserver_.call_count == 2
+        assert backend._observer is None
+
+
+@pytest.fixture
+def foundation():
+    """Fixture providing a stand-in for the PyObjC Foundation module."""
+
+    class NSObject:
+        @classmethod
+        def alloc(cls):
+            return cls()
+
+        def init(self):
+            return self
+
+    center = Mock()
+    module = types.SimpleNamespace(
+        NSObject=NSObject,
+        NSDistributedNotificationCenter=Mock(defaultCenter=Mock(return_value=center)),
+    )
+    with patch.dict("sys.modules", {"Foundation": module}):
+        yield module
+
+
+class TestSystemStateEvents:
+    """Test suite for transition events published by the state service."""
+
+    @pytest.mark.asyncio
+    async def test_poll_publishes_transitions(self, service, backend):
+        """Test changes seen by the poller are published as events."""
+        service.refresh()
+        subscription = service.events.subscribe()
+        backend.locked = True
+        backend.idle_ns = 31_000_000_000
+        service.refresh()
+
+        received = {await subscription.next(timeout=1) for _ in range(2)}
+        assert received == {SystemEvent.LOCK, SystemEvent.IDLE_START}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_publishes_nothing(self, service):
+        """Test refreshing an unchanged state is silent."""
+        service.refresh()
+        subscription = service.events.subscribe()
+        service.refresh()
+
+        assert await subscription.next(timeout=0.05) is None
+
+    @pytest.mark.asyncio
+    async def test_native_notification_updates_immediately(self, service, backend):
+        """Test native notifications update the snapshot without polling."""
+        service.start()
+        assert service.native is True
+        subscription = service.events.subscribe()
+
+        backend.notify("locked", True)
+        assert service.is_screen_locked() is True
+        assert await subscription.next(timeout=1) is SystemEvent.LOCK
+
+    @pytest.mark.asyncio
+    async def test_monitor_resumes_on_unlock_event(self, backend):
+        """Test a locked monitor resumes as soon as unlock is published."""
+        config = Config(SYSTEM_POLL_INTERVAL=60.0)
+        backend.locked = True
+        service = SystemStateService(config, backend)
+        with patch("app.services.monitor.Camera"), patch(
+            "app.services.monitor.FaceDetector"
+        ):
+            monitor = SecurityMonitor(config, system=service)
+            service.start()
+            monitor._events = service.events.subscribe()
+            waiting = asyncio.create_task(monitor._wait_for_unlock())
+
+            await asyncio.sleep(0.05)
+            assert not waiting.done()
+            backend.notify("locked", False)
+            await asyncio.wait_for(waiting, timeout=0.5)
+            await monitor.stop()
+
+    @pytest.mark.asyncio
+    async def test_monitor_probes_state_off_the_loop(self, backend):
+        """Test the monitor's first snapshot is not probed on the event loop."""
+        config = Config(SYSTEM_POLL_INTERVAL=60.0)
+        backend.locked = True
+        loop_thread = threading.current_thread()
+        threads = []
+        probe_locked = backend.probe_locked
+
+        def record_probe(timeout):
+            threads.append(threading.current_thread())
+            time.sleep(0.02)
+            return probe_locked(timeout)
+
+        backend.probe_locked = record_probe
+        service = SystemStateService(config, backend)
+        with patch("app.services.monitor.Camera"), patch(
+            "app.services.monitor.FaceDetector"
+        ):
+            monitor = SecurityMonitor(config, system=service)
+            running = asyncio.create_task(monitor.monitor())
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+            await asyncio.wait_for(running, timeout=1)
+
+        assert threads
+        assert loop_thread not in threads